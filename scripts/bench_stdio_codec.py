@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark stdio response encoding.
+
+Compares the previous path (``json.dumps`` + ``print`` on the text layer)
+with each available codec writing bytes to a binary stream, for a
+``list_events`` response carrying N formatted events. Run from the
+project root::
+
+    python scripts/bench_stdio_codec.py --events 2000 --repeat 50
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.mcp.servers import stdio_codec  # noqa: E402
+
+
+def sample_response(events: int) -> dict:
+    content = [
+        {
+            "type": "text",
+            "text": (f"📅 Reunião de planejamento {i}\n🕒 2026-03-{i % 28 + 1:02d}T09:00:00-03:00"
+                     f"\n📍 Sala {i % 12}\n🆔 evt{i:06d}\n🗂️ Source: google"),
+        }
+        for i in range(events)
+    ]
+    return {"jsonrpc": "2.0", "id": 7, "result": {"content": content}}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    response = sample_response(args.events)
+
+    def stdlib_print():
+        out = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        print(json.dumps(response), file=out, flush=True)
+
+    cases = [("json + print (before)", stdlib_print)]
+    for codec in (stdio_codec.STDLIB, stdio_codec.ORJSON):
+        if codec is None:
+            continue
+
+        def write_bytes(codec=codec):
+            io.BytesIO().write(codec.dumps(response) + b"\n")
+
+        cases.append((f"{codec.name} -> bytes", write_bytes))
+
+    if stdio_codec.ORJSON is None:
+        print("orjson not installed; only the stdlib codec is measured")
+    print(f"{args.events} events, {args.repeat} runs, best of 3")
+    baseline = None
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=args.repeat, repeat=3)) / args.repeat
+        baseline = baseline or best
+        print(f"  {name:<24} {best * 1000:8.2f} ms/response  x{baseline / best:.1f}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
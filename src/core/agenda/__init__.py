@@ -0,0 +1,8 @@
+from .merge import AgendaEntry, google_entries, ics_entries, merge
+
+__all__ = [
+    'AgendaEntry',
+    'google_entries',
+    'ics_entries',
+    'merge',
+]
@@ -0,0 +1,57 @@
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from ..ics.parser import ICSEvent
+
+Interval = Tuple[float, float]
+
+
+class Conflict(NamedTuple):
+    start: float
+    end: float
+    source: str
+
+
+def merge_busy(intervals: Iterable[Interval]) -> List[Interval]:
+    """Union of *intervals* as sorted, disjoint intervals (touching ones are joined).
+
+    A single sweep over the intervals sorted by start: O(n log n).
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_slots(busy: Iterable[Interval], start: float, end: float, min_duration: float = 0.0,
+               limit: Optional[int] = None) -> List[Interval]:
+    """Gaps of at least *min_duration* seconds between busy intervals within ``[start, end)``."""
+    slots: List[Interval] = []
+    cursor = start
+    for busy_start, busy_end in merge_busy(busy) + [(end, end)]:
+        if busy_start >= end:
+            busy_start = end
+        if busy_start - cursor >= min_duration and busy_start > cursor:
+            slots.append((cursor, busy_start))
+            if limit is not None and len(slots) >= limit:
+                break
+        cursor = max(cursor, busy_end)
+        if cursor >= end:
+            break
+    return slots
+
+
+def conflicts(busy: Iterable[Conflict], start: float, end: float) -> List[Conflict]:
+    """Busy intervals overlapping ``[start, end)``, ordered by start."""
+    return sorted(c for c in busy if c.start < end and c.end > start)
+
+
+def ics_busy(records: Iterable[ICSEvent]) -> List[Interval]:
+    """Busy intervals of parsed ICS events; transparent and cancelled events are free time."""
+    return [(ev.start_ts, ev.end_ts) for ev in records
+            if ev.start is not None and ev.get('TRANSP').upper() != 'TRANSPARENT'
+            and ev.get('STATUS').upper() != 'CANCELLED']
@@ -0,0 +1,54 @@
+import heapq
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+from ..calendar.list_events import format_event
+from ..calendar.utils import event_timestamp
+from ..ics.ops import format_record
+from ..ics.parser import ICSEvent
+
+
+class AgendaEntry(NamedTuple):
+    """One formatted event of a merged listing, keyed by start."""
+    start: float
+    uid: str
+    source: str
+    content: Dict
+
+
+def _tagged(item: Dict, source: str) -> Dict:
+    return dict(item, text=f"{item['text']}\n🗂️ Source: {source}")
+
+
+def google_entries(events: Iterable[Dict], extra_fields: Sequence[str] = (),
+                   source: str = 'google') -> Iterator[AgendaEntry]:
+    """Entries for Calendar API event resources, already ordered by start."""
+    for event in events:
+        yield AgendaEntry(event_timestamp(event.get('start')), event.get('iCalUID') or event.get('id', ''),
+                          source, _tagged(format_event(event, extra_fields), source))
+
+
+def ics_entries(records: Iterable[ICSEvent], alias: str) -> Iterator[AgendaEntry]:
+    """Entries for parsed ICS records, already ordered by start."""
+    source = f"ics:{alias}"
+    for record in records:
+        yield AgendaEntry(record.sort_key(), record.uid, source, _tagged(format_record(record), source))
+
+
+def merge(streams: Sequence[Iterable[AgendaEntry]], max_results: Optional[int] = None) -> List[AgendaEntry]:
+    """k-way merge of start-ordered *streams*, keeping the first *max_results* entries.
+
+    The same occurrence listed by several sources (same UID and start, e.g. a
+    feed that is also subscribed in Google Calendar) is kept once, from the
+    first stream that has it.
+    """
+    merged: List[AgendaEntry] = []
+    seen = set()
+    for entry in heapq.merge(*streams, key=lambda entry: entry.start):
+        if max_results is not None and len(merged) >= max_results:
+            break
+        if entry.uid:
+            key = (entry.uid, entry.start)
+            if key in seen:
+                continue
+            seen.add(key)
+        merged.append(entry)
+    return merged
@@ -4,7 +4,7 @@ import pickle
 from pathlib import Path
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from .calendar_service import _calendar_discovery_doc, get_calendar_service
 
 # Escopos necessários para acessar o Google Calendar e Tasks
 SCOPES = [
@@ -88,12 +88,8 @@ def get_credentials(credentials_path: str = None) -> object:
     if credentials_path is None:
         credentials_path = _get_config_path('credentials.json')
     
-    creds = None
     token_path = _get_config_path('token.pickle')
-    
-    if os.path.exists(token_path):
-        with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
+    creds = _load_token(token_path)
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -103,18 +99,49 @@ def get_credentials(credentials_path: str = None) -> object:
                 credentials_path, SCOPES)
             creds = flow.run_local_server(port=0)
             
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
+        _save_token(creds, token_path)
 
     return creds
 
-def get_calendar_service():
+def _load_token(token_path: str = None):
+    """Stored credentials from token.pickle, or None if there are none."""
+    if token_path is None:
+        token_path = _get_config_path('token.pickle')
+    if not os.path.exists(token_path):
+        return None
+    with open(token_path, 'rb') as token:
+        return pickle.load(token)
+
+def _usable_without_consent(creds) -> bool:
+    """True if *creds* are valid or can be refreshed without user interaction."""
+    return bool(creds) and (creds.valid or bool(creds.expired and creds.refresh_token))
+
+def _save_token(creds, token_path: str = None) -> None:
+    """Persist credentials to token.pickle."""
+    if token_path is None:
+        token_path = _get_config_path('token.pickle')
+    with open(token_path, 'wb') as token:
+        pickle.dump(creds, token)
+
+def prewarm_calendar_service() -> bool:
     """
-    Get an authorized Google Calendar service instance.
+    Load the discovery document and build the service ahead of the first call.
+    
+    The service is only built when the stored token is valid or can be
+    refreshed, so pre-warming never starts the interactive OAuth flow.
     
     Returns:
-        object: Authorized Google Calendar service
+        bool: True if the service is ready for use
     """
-    creds = get_credentials()
-    service = build('calendar', 'v3', credentials=creds)
-    return service 
\ No newline at end of file
+    _calendar_discovery_doc()
+    try:
+        creds = _load_token()
+    except Exception:
+        return False
+    if not _usable_without_consent(creds):
+        return False
+    try:
+        get_calendar_service()
+        return True
+    except Exception:
+        return False
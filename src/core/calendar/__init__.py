@@ -1,13 +1,23 @@
 from .add_event import add_event
 from .edit_event import edit_event
-from .list_events import list_events
+from .list_events import fetch_events, list_events
 from .remove_event import remove_event
 from .utils import ensure_timezone
+from .bulk import add_events, edit_events, remove_events
+from .calendars import fetch_calendars, list_calendars
+from .freebusy import query_busy
 
 __all__ = [
     'add_event',
+    'add_events',
     'edit_event',
+    'edit_events',
+    'fetch_calendars',
+    'fetch_events',
+    'list_calendars',
     'list_events',
+    'query_busy',
     'remove_event',
+    'remove_events',
     'ensure_timezone',
 ] 
\ No newline at end of file
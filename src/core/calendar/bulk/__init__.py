@@ -0,0 +1,12 @@
+from .batch import BATCH_LIMIT, execute_batch
+from .add_events import add_events
+from .edit_events import edit_events
+from .remove_events import remove_events
+
+__all__ = [
+    'BATCH_LIMIT',
+    'execute_batch',
+    'add_events',
+    'edit_events',
+    'remove_events',
+]
@@ -0,0 +1,24 @@
+from typing import Dict, List
+from ..fields import MUTATION_FIELDS
+from ..utils import normalize_event_times
+from .batch import execute_batch
+
+
+def add_events(service, events_data: List[Dict]) -> List[Dict]:
+    """Insert several events using batched HTTP requests.
+
+    Returns one result per event, in input order, shaped like ``add_event``:
+    ``{'status': 'confirmed', 'event': ...}`` or ``{'status': 'error', 'message': ...}``.
+    """
+    events = service.events()
+    requests = [
+        events.insert(calendarId='primary', body=normalize_event_times(data), fields=MUTATION_FIELDS)
+        for data in events_data
+    ]
+    results = []
+    for event, error in execute_batch(service, requests):
+        if error is not None:
+            results.append({'status': 'error', 'message': str(error)})
+        else:
+            results.append({'status': 'confirmed', 'event': event})
+    return results
@@ -0,0 +1,32 @@
+from typing import Dict, List, Optional, Tuple
+
+# Maximum number of calls the Calendar API accepts in one batch request
+BATCH_LIMIT = 50
+
+BatchResult = Tuple[Optional[Dict], Optional[Exception]]
+
+
+def execute_batch(service, requests: List) -> List[BatchResult]:
+    """Execute API requests through batch HTTP calls.
+
+    Requests are sent in chunks of ``BATCH_LIMIT``. Returns one
+    ``(response, exception)`` pair per request, in input order.
+    """
+    results: List[BatchResult] = [(None, None)] * len(requests)
+
+    def _callback(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+
+    for offset in range(0, len(requests), BATCH_LIMIT):
+        chunk = requests[offset:offset + BATCH_LIMIT]
+        batch = service.new_batch_http_request(callback=_callback)
+        for index, request in enumerate(chunk, start=offset):
+            batch.add(request, request_id=str(index))
+        try:
+            batch.execute()
+        except Exception as e:
+            # Transport failure: every item of this chunk without a result failed
+            for index in range(offset, offset + len(chunk)):
+                if results[index] == (None, None):
+                    results[index] = (None, e)
+    return results
@@ -0,0 +1,58 @@
+from typing import Dict, List
+from ..fields import MUTATION_FIELDS, TIME_FIELDS
+from ..utils import build_event_patch, is_self_contained_patch
+from .batch import execute_batch
+
+
+def _invalid(error: Exception) -> Dict:
+    # A malformed edit fails on its own, like an API error for that item
+    return {'status': 'error', 'message': f'Invalid edit: {error}'}
+
+
+def edit_events(service, edits: List[Dict]) -> List[Dict]:
+    """Patch several events using batched HTTP requests.
+
+    Each edit is ``{'event_id': ..., 'updated_details': {...}}`` with an
+    optional ``etag`` sent as ``If-Match``. Events are
+    only read first (in one batch) when their patch is not self-contained.
+    Returns ``{'status': 'confirmed', 'event': ...}`` or
+    ``{'status': 'error', 'message': ...}`` per edit, in input order.
+    """
+    events = service.events()
+    results: List[Dict] = [{}] * len(edits)
+
+    pending = []
+    for i, edit in enumerate(edits):
+        try:
+            if not is_self_contained_patch(edit['updated_details']):
+                pending.append(i)
+        except Exception as e:
+            results[i] = _invalid(e)
+    current = {}
+    fetched = execute_batch(service, [
+        events.get(calendarId='primary', eventId=edits[i]['event_id'], fields=TIME_FIELDS) for i in pending
+    ]) if pending else []
+    for i, (event, error) in zip(pending, fetched):
+        if error is not None:
+            results[i] = {'status': 'error', 'message': str(error)}
+        else:
+            current[i] = event
+
+    to_patch, requests = [], []
+    for i in (i for i in range(len(edits)) if not results[i]):
+        try:
+            body = build_event_patch(edits[i]['updated_details'], current.get(i))
+        except Exception as e:
+            results[i] = _invalid(e)
+            continue
+        request = events.patch(calendarId='primary', eventId=edits[i]['event_id'], body=body, fields=MUTATION_FIELDS)
+        if edits[i].get('etag'):
+            request.headers['If-Match'] = edits[i]['etag']
+        to_patch.append(i)
+        requests.append(request)
+    for i, (event, error) in zip(to_patch, execute_batch(service, requests)):
+        if error is not None:
+            results[i] = {'status': 'error', 'message': str(error)}
+        else:
+            results[i] = {'status': 'confirmed', 'event': event}
+    return results
@@ -0,0 +1,19 @@
+from typing import Dict, List
+from .batch import execute_batch
+
+
+def remove_events(service, event_ids: List[str]) -> List[Dict]:
+    """Delete several events using batched HTTP requests.
+
+    Returns one ``{'event_id', 'status'}`` entry per id, in input order, with
+    ``status`` set to ``'deleted'`` or ``'error'`` (plus ``message``).
+    """
+    events = service.events()
+    requests = [events.delete(calendarId='primary', eventId=eid) for eid in event_ids]
+    results = []
+    for event_id, (_, error) in zip(event_ids, execute_batch(service, requests)):
+        if error is not None:
+            results.append({'event_id': event_id, 'status': 'error', 'message': str(error)})
+        else:
+            results.append({'event_id': event_id, 'status': 'deleted'})
+    return results
@@ -0,0 +1,63 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from .bulk.batch import execute_batch
+from .fields import list_fields, normalize_fields
+from .list_events import PAGE_SIZE_LIMIT, events_query, iter_event_pages
+
+# Calendar list fields needed to pick the calendars to query
+CALENDAR_LIST_FIELDS = 'nextPageToken,items(id,summary,selected,primary)'
+
+
+class CalendarEvents(NamedTuple):
+    calendar_id: str
+    events: List[Dict]
+    error: Optional[Exception] = None
+
+
+def list_calendars(service, selected_only: bool = True) -> List[Dict]:
+    """Entries of the user's calendar list (only those shown in the UI by default)."""
+    calendars: List[Dict] = []
+    page_token = None
+    while True:
+        params = {'fields': CALENDAR_LIST_FIELDS}
+        if page_token:
+            params['pageToken'] = page_token
+        result = service.calendarList().list(**params).execute()
+        calendars.extend(c for c in result.get('items', [])
+                         if not selected_only or c.get('selected') or c.get('primary'))
+        page_token = result.get('nextPageToken')
+        if not page_token:
+            return calendars
+
+
+def fetch_calendars(service, calendar_ids: Sequence[str], max_results: Optional[int] = None,
+                    time_min: Optional[str] = None, time_max: Optional[str] = None,
+                    fields: Optional[Sequence[str]] = None) -> List[CalendarEvents]:
+    """Raw upcoming events of several calendars, one entry per calendar in input order.
+
+    The first page of every calendar is requested in a single batch HTTP call;
+    further pages are only fetched for calendars that still have fewer than
+    *max_results* events. A failing calendar carries its error instead of
+    failing the others.
+    """
+    mask = list_fields(normalize_fields(fields))
+    page_size = PAGE_SIZE_LIMIT if max_results is None else min(max_results, PAGE_SIZE_LIMIT)
+    queries = [dict(events_query(cid, time_min, time_max), fields=mask) for cid in calendar_ids]
+    events = service.events()
+    requests = [events.list(maxResults=page_size, **query) for query in queries]
+    results = []
+    for cid, query, (response, error) in zip(calendar_ids, queries, execute_batch(service, requests)):
+        if error is not None:
+            results.append(CalendarEvents(cid, [], error))
+            continue
+        items = response.get('items', [])[:max_results]
+        page_token = response.get('nextPageToken')
+        remaining = None if max_results is None else max_results - len(items)
+        try:
+            if page_token and (remaining is None or remaining > 0):
+                for page, _ in iter_event_pages(service, query, remaining, page_token):
+                    items.extend(page)
+        except Exception as e:
+            results.append(CalendarEvents(cid, items, e))
+            continue
+        results.append(CalendarEvents(cid, items))
+    return results
@@ -1,37 +1,34 @@
+import sys
 from typing import Dict, Optional
-from .utils import ensure_timezone
+from .fields import MUTATION_FIELDS, TIME_FIELDS
+from .utils import build_event_patch, is_self_contained_patch
 
-def edit_event(service, event_id: str, updated_details: Dict) -> Optional[Dict]:
-    try:
-        event = service.events().get(
-            calendarId="primary", 
-            eventId=event_id
-        ).execute()
-
-        for key, value in updated_details.items():
-            event[key] = value
+def edit_event(service, event_id: str, updated_details: Dict, etag: Optional[str] = None) -> Optional[Dict]:
+    """Patch an event, sending only the changed fields.
 
-        if 'start' in updated_details and 'dateTime' in updated_details['start']:
-            event['start']['dateTime'] = ensure_timezone(
-                updated_details['start']['dateTime']
-            )
-            if 'timeZone' not in event['start']:
-                event['start']['timeZone'] = 'America/Sao_Paulo'
-        
-        if 'end' in updated_details and 'dateTime' in updated_details['end']:
-            event['end']['dateTime'] = ensure_timezone(
-                updated_details['end']['dateTime']
-            )
-            if 'timeZone' not in event['end']:
-                event['end']['timeZone'] = 'America/Sao_Paulo'
+    The current event is read first only when the patch has a start/end
+    without its own dateTime/date. With *etag* the patch is sent with
+    ``If-Match`` and fails if the event changed in the meantime.
+    """
+    try:
+        current = None
+        if not is_self_contained_patch(updated_details):
+            current = service.events().get(
+                calendarId="primary",
+                eventId=event_id,
+                fields=TIME_FIELDS
+            ).execute()
 
-        updated_event = service.events().patch(
+        request = service.events().patch(
             calendarId="primary",
             eventId=event_id,
-            body=event
-        ).execute()
+            body=build_event_patch(updated_details, current),
+            fields=MUTATION_FIELDS
+        )
+        if etag:
+            request.headers['If-Match'] = etag
 
-        return updated_event
+        return request.execute()
     except Exception as e:
-        print(f"Error editing event {event_id}: {str(e)}")
-        return None 
\ No newline at end of file
+        print(f"Error editing event {event_id}: {str(e)}", file=sys.stderr)
+        return None
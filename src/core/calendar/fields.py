@@ -0,0 +1,38 @@
+import re
+from typing import Iterable, List, Optional
+
+# Event fields read by the list formatter
+EVENT_FIELDS = ('id', 'summary', 'start', 'end', 'location', 'description')
+# Fields read from insert/patch responses when building tool output
+MUTATION_FIELDS = 'id,etag,summary,start,end,location'
+# Fields needed to complete a partial start/end patch
+TIME_FIELDS = 'start,end'
+
+_FIELD_RE = re.compile(r'^[A-Za-z][\w/(),]*$')
+
+
+def normalize_fields(extra: Optional[Iterable[str]] = None) -> List[str]:
+    """Validate caller-requested fields and drop duplicates of the defaults."""
+    fields = []
+    for name in extra or []:
+        name = str(name).strip()
+        if not _FIELD_RE.match(name):
+            raise ValueError(f"Invalid field: {name}")
+        if name not in EVENT_FIELDS and name not in fields:
+            fields.append(name)
+    return fields
+
+
+def event_fields(extra: Optional[Iterable[str]] = None) -> str:
+    """Partial-response mask for a single event resource."""
+    return ','.join(list(EVENT_FIELDS) + normalize_fields(extra))
+
+
+def list_fields(extra: Optional[Iterable[str]] = None) -> str:
+    """Partial-response mask for events().list pages."""
+    return f"nextPageToken,items({event_fields(extra)})"
+
+
+def field_key(field: str) -> str:
+    """Top-level resource key of a field path such as ``attendees(email)``."""
+    return re.split(r'[/(]', field, 1)[0]
@@ -0,0 +1,35 @@
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+from .utils import event_timestamp
+
+# Calendars the freebusy endpoint accepts in one query
+FREEBUSY_LIMIT = 50
+
+Interval = Tuple[float, float]
+
+
+class BusyTimes(NamedTuple):
+    busy: Dict[str, List[Interval]]
+    errors: Dict[str, str]
+
+
+def query_busy(service, calendar_ids: Sequence[str], time_min: str, time_max: str) -> BusyTimes:
+    """Busy intervals (epoch seconds) of several calendars from ``freebusy.query``.
+
+    One request covers up to ``FREEBUSY_LIMIT`` calendars. Calendars the API
+    reports errors for (e.g. ``notFound``) are listed in ``errors`` instead.
+    """
+    busy: Dict[str, List[Interval]] = {}
+    errors: Dict[str, str] = {}
+    for offset in range(0, len(calendar_ids), FREEBUSY_LIMIT):
+        chunk = calendar_ids[offset:offset + FREEBUSY_LIMIT]
+        body = {'timeMin': time_min, 'timeMax': time_max, 'items': [{'id': cid} for cid in chunk]}
+        result = service.freebusy().query(body=body).execute()
+        calendars = result.get('calendars', {})
+        for cid in chunk:
+            entry = calendars.get(cid, {})
+            if entry.get('errors'):
+                errors[cid] = ', '.join(e.get('reason', 'unknown') for e in entry['errors'])
+                continue
+            busy[cid] = [(event_timestamp({'dateTime': b['start']}), event_timestamp({'dateTime': b['end']}))
+                         for b in entry.get('busy', [])]
+    return BusyTimes(busy, errors)
@@ -1,32 +1,123 @@
-from typing import List, Dict, Optional
+import base64
+import json
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime, timezone
+from .fields import field_key, list_fields, normalize_fields
+
+# Largest page the Calendar API returns for events().list
+PAGE_SIZE_LIMIT = 250
+
+
+def encode_cursor(query: Dict, page_token: str) -> str:
+    """Pack the query and page token into an opaque cursor for the caller."""
+    payload = json.dumps({'q': query, 'p': page_token}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Dict, str]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return data['q'], data['p']
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def iter_event_pages(service, query: Dict, max_results: Optional[int] = None,
+                     page_token: Optional[str] = None) -> Iterator[Tuple[List[Dict], Optional[str]]]:
+    """Yield ``(items, next_page_token)`` one page at a time.
+
+    Pages are requested lazily and fetching stops as soon as *max_results*
+    events have been yielded.
+    """
+    remaining = max_results
+    while remaining is None or remaining > 0:
+        page_size = PAGE_SIZE_LIMIT if remaining is None else min(remaining, PAGE_SIZE_LIMIT)
+        params = dict(query, maxResults=page_size)
+        if page_token:
+            params['pageToken'] = page_token
+        result = service.events().list(**params).execute()
+        items = result.get('items', [])
+        page_token = result.get('nextPageToken')
+        if remaining is not None:
+            items = items[:remaining]
+            remaining -= len(items)
+        yield items, page_token
+        if not page_token:
+            return
+
+
+def format_event(event: Dict, extra_fields: Sequence[str] = ()) -> Dict:
+    event_id = event.get('id', 'No ID')
+    summary = event.get('summary', 'No Summary')
+    start_time = event.get('start', {}).get('dateTime', 'No start time')
+    end_time = event.get('end', {}).get('dateTime', 'No end time')
+    location = event.get('location', '')
+    description = event.get('description', '')
+
+    event_text = f"{summary}\n🆔 ID: {event_id}\n📅 Start: {start_time}\n📅 End: {end_time}"
+
+    if location:
+        event_text += f"\n📍 Location: {location}"
+
+    if description:
+        event_text += f"\n📝 Description: {description}"
+
+    for field in extra_fields:
+        key = field_key(field)
+        if key in event:
+            event_text += f"\n🔹 {key}: {json.dumps(event[key], ensure_ascii=False)}"
+
+    return {"type": "text", "text": event_text}
+
+
+def events_query(calendar_id: str, time_min: Optional[str], time_max: Optional[str]) -> Dict:
+    """events().list parameters for upcoming single events ordered by start."""
+    query = {
+        'calendarId': calendar_id,
+        'timeMin': time_min or datetime.now(timezone.utc).isoformat(),
+        'singleEvents': True,
+        'orderBy': 'startTime',
+    }
+    if time_max:
+        query['timeMax'] = time_max
+    return query
+
+
+def fetch_events(service, max_results: Optional[int] = None, calendar_id: str = 'primary',
+                 time_min: Optional[str] = None, time_max: Optional[str] = None,
+                 fields: Optional[Sequence[str]] = None) -> List[Dict]:
+    """Raw event resources of the same listing as :func:`list_events`, ordered by start."""
+    query = dict(events_query(calendar_id, time_min, time_max), fields=list_fields(normalize_fields(fields)))
+    events: List[Dict] = []
+    for items, _ in iter_event_pages(service, query, max_results):
+        events.extend(items)
+    return events
+
+
+def list_events(service, max_results: Optional[int] = None, calendar_id: str = 'primary',
+                cursor: Optional[str] = None, fields: Optional[Sequence[str]] = None,
+                time_min: Optional[str] = None, time_max: Optional[str] = None) -> List[Dict]:
+    """List upcoming events, following ``nextPageToken`` until *max_results* is met.
+
+    *time_min*/*time_max* (RFC 3339) restrict the listing to events
+    overlapping that window; *time_min* defaults to now.
+
+    Only the fields the formatter reads are requested, plus any extra
+    *fields* asked for by the caller. When more events remain, a final text
+    item carries the cursor to pass back in order to continue the listing.
+    """
+    extra = normalize_fields(fields)
+    if cursor:
+        query, page_token = decode_cursor(cursor)
+    else:
+        query, page_token = events_query(calendar_id, time_min, time_max), None
+    query['fields'] = list_fields(extra)
 
-def list_events(service, max_results: Optional[int] = None, calendar_id: str = 'primary') -> List[Dict]:
-    now = datetime.now(timezone.utc).isoformat()
-    events_result = service.events().list(
-        calendarId=calendar_id,
-        timeMin=now,
-        maxResults=max_results,
-        singleEvents=True,
-        orderBy='startTime'
-    ).execute()
-    events = events_result.get('items', [])
     formatted_events = []
-    for event in events:
-        event_id = event.get('id', 'No ID')
-        summary = event.get('summary', 'No Summary')
-        start_time = event.get('start', {}).get('dateTime', 'No start time')
-        end_time = event.get('end', {}).get('dateTime', 'No end time')
-        location = event.get('location', '')
-        description = event.get('description', '')
-        
-        event_text = f"{summary}\n🆔 ID: {event_id}\n📅 Start: {start_time}\n📅 End: {end_time}"
-        
-        if location:
-            event_text += f"\n📍 Location: {location}"
-        
-        if description:
-            event_text += f"\n📝 Description: {description}"
-        
-        formatted_events.append({"type": "text", "text": event_text})
-    return formatted_events 
\ No newline at end of file
+    next_token = None
+    for items, next_token in iter_event_pages(service, query, max_results, page_token):
+        formatted_events.extend(format_event(event, extra) for event in items)
+    if next_token:
+        next_cursor = encode_cursor(query, next_token)
+        formatted_events.append({"type": "text", "text": f"🔖 More events available. cursor: {next_cursor}"})
+    return formatted_events
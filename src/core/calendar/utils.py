@@ -1,6 +1,69 @@
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+DEFAULT_TIMEZONE = 'America/Sao_Paulo'
+
+
 def ensure_timezone(datetime_str: str) -> str:
     """Ensure datetime string has timezone information."""
     if datetime_str.endswith('Z') or '+' in datetime_str[-6:] or '-' in datetime_str[-6:]:
         return datetime_str
     
-    return f"{datetime_str}-03:00" 
\ No newline at end of file
+    return f"{datetime_str}-03:00"
+
+
+def event_timestamp(when: Dict, default: float = 0.0) -> float:
+    """Epoch seconds for a Calendar ``start``/``end`` object (all-day = UTC midnight)."""
+    value = (when or {}).get('dateTime') or (when or {}).get('date')
+    if not value:
+        return default
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def normalize_event_times(event_data: Dict) -> Dict:
+    """Return a copy of *event_data* with timezone-aware start/end dateTimes."""
+    processed = dict(event_data)
+    for key in ('start', 'end'):
+        if key in processed and 'dateTime' in processed[key]:
+            processed[key] = dict(processed[key])
+            processed[key]['dateTime'] = ensure_timezone(processed[key]['dateTime'])
+            if 'timeZone' not in processed[key]:
+                processed[key]['timeZone'] = DEFAULT_TIMEZONE
+    return processed
+
+
+def is_self_contained_patch(updated_details: Dict) -> bool:
+    """True when every start/end in the patch carries its own dateTime or date,
+    so it can be sent without first reading the current event."""
+    return all(
+        'dateTime' in updated_details[key] or 'date' in updated_details[key]
+        for key in ('start', 'end') if key in updated_details
+    )
+
+
+def build_event_patch(updated_details: Dict, current: Optional[Dict] = None) -> Dict:
+    """Build the PATCH body for *updated_details*.
+
+    Only the changed fields are sent. When *current* (the stored event) is
+    given, partial start/end entries are completed from it and a missing
+    timeZone falls back to ``DEFAULT_TIMEZONE``.
+    """
+    body = dict(updated_details)
+    for key in ('start', 'end'):
+        if key not in body:
+            continue
+        entry = dict(current.get(key, {})) if current else {}
+        if 'dateTime' in body[key]:
+            entry.pop('date', None)
+        if 'date' in body[key]:
+            entry.pop('dateTime', None)
+        entry.update(body[key])
+        if 'dateTime' in entry:
+            entry['dateTime'] = ensure_timezone(entry['dateTime'])
+            if current is not None and 'timeZone' not in entry:
+                entry['timeZone'] = DEFAULT_TIMEZONE
+        body[key] = entry
+    return body
@@ -0,0 +1,101 @@
+import json
+import threading
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from google.auth.transport.requests import Request
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import HttpRequest
+from . import deadline
+
+# Refresh cached credentials this long before they actually expire
+_REFRESH_MARGIN = timedelta(minutes=5)
+_SERVICE_LOCK = threading.Lock()
+_SERVICE_CACHE = {}
+_THREAD_LOCAL = threading.local()
+
+def _needs_refresh(creds) -> bool:
+    """Return True when credentials are invalid or about to expire."""
+    if not creds.valid:
+        return True
+    expiry = getattr(creds, 'expiry', None)
+    if not isinstance(expiry, datetime):
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return expiry - now < _REFRESH_MARGIN
+
+def _thread_http(creds) -> AuthorizedHttp:
+    """
+    Return an authorized transport owned by the calling thread.
+    
+    httplib2.Http is not thread-safe, so the shared service object issues
+    every request through a per-thread connection instead.
+    """
+    http = getattr(_THREAD_LOCAL, 'http', None)
+    if http is None or http.credentials is not creds:
+        http = AuthorizedHttp(creds, http=httplib2.Http())
+        _THREAD_LOCAL.http = http
+    return http
+
+def _apply_timeout(http, seconds) -> None:
+    """Set the socket timeout of *http*, including keep-alive connections httplib2 would not update."""
+    raw = getattr(http, 'http', http)
+    raw.timeout = seconds
+    for conn in getattr(raw, 'connections', {}).values():
+        conn.timeout = seconds
+        sock = getattr(conn, 'sock', None)
+        if sock is not None:
+            sock.settimeout(seconds)
+
+def _request_builder(creds):
+    def build_request(_http, *args, **kwargs):
+        # Requests (and batches of them) time out with the calling request's budget
+        http = _thread_http(creds)
+        _apply_timeout(http, deadline.timeout())
+        return HttpRequest(http, *args, **kwargs)
+    return build_request
+
+@lru_cache(maxsize=None)
+def _calendar_discovery_doc():
+    """
+    The Calendar v3 discovery document bundled with googleapiclient, or None.
+    
+    Parsed once per process so building the client needs neither a network
+    round trip nor a fresh parse of the ~100 KB JSON document.
+    """
+    raw = get_static_doc('calendar', 'v3')
+    return json.loads(raw) if raw else None
+
+def _build_service(creds):
+    doc = _calendar_discovery_doc()
+    transport = dict(http=_thread_http(creds), requestBuilder=_request_builder(creds))
+    if doc is None:
+        return build('calendar', 'v3', **transport)
+    return build_from_document(doc, **transport)
+
+def get_calendar_service():
+    """
+    Authorized Google Calendar service, built once per process and shared
+    between threads; credentials are refreshed only when close to expiry.
+    """
+    from . import auth
+    with _SERVICE_LOCK:
+        creds = _SERVICE_CACHE.get('credentials')
+        if creds is not None and _needs_refresh(creds):
+            if creds.refresh_token:
+                creds.refresh(Request())
+                auth._save_token(creds)
+            else:
+                _SERVICE_CACHE.clear()
+                creds = None
+        if creds is None:
+            creds = auth.get_credentials()
+            _SERVICE_CACHE['credentials'] = creds
+
+        service = _SERVICE_CACHE.get('service')
+        if service is None:
+            service = _build_service(creds)
+            _SERVICE_CACHE['service'] = service
+        return service 
\ No newline at end of file
@@ -0,0 +1,90 @@
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """The current request ran out of time."""
+
+
+class RequestCancelled(Exception):
+    """The client cancelled the current request."""
+
+
+class Deadline:
+    """Time budget and cancellation flag of one request.
+
+    Code doing I/O asks for the remaining budget (see :func:`timeout`) and so
+    gives up once the client has stopped waiting.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (None if unbounded); raises once cancelled or expired."""
+        if self.cancelled:
+            raise RequestCancelled("Request cancelled")
+        if self.expires_at is None:
+            return None
+        left = self.expires_at - time.monotonic()
+        if left <= 0:
+            raise DeadlineExceeded("Request deadline exceeded")
+        return left
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar('deadline', default=None)
+
+
+def current() -> Optional[Deadline]:
+    return _current.get()
+
+
+@contextmanager
+def scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make *deadline* the current one for the code run inside the block."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def check() -> None:
+    """Raise if the current request was cancelled or is out of time."""
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.remaining()
+
+
+def timeout(default: Optional[float] = None) -> Optional[float]:
+    """*default* capped by the current request's remaining budget."""
+    deadline = _current.get()
+    left = deadline.remaining() if deadline is not None else None
+    if left is None:
+        return default
+    return left if default is None else min(default, left)
+
+
+def default_seconds() -> Optional[float]:
+    """Budget of requests that do not set one (``MCP_REQUEST_TIMEOUT``, default unbounded)."""
+    try:
+        value = float(os.environ.get('MCP_REQUEST_TIMEOUT', '0'))
+    except ValueError:
+        return None
+    return value if value > 0 else None
@@ -0,0 +1 @@
+"""External ICS calendars: download, parsing, caching, registry and listing."""
@@ -0,0 +1,105 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    loaded_at: float
+    refreshing: bool = False
+
+
+class ParsedFeedCache:
+    """LRU cache of parsed feeds keyed by URL, bounded by approximate size.
+
+    Entries younger than their TTL are served directly. Older entries are
+    still served immediately while a background thread reloads them
+    (stale-while-revalidate). With a TTL of zero or less every read reloads
+    synchronously, but the loader still receives the previous value so it
+    can skip work when the feed did not change.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: float, load: Callable[[Any], Any], size: Callable[[Any], int]) -> Any:
+        """Return the value for *key*, calling ``load(previous)`` when needed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if time.time() - entry.loaded_at < ttl:
+                    return entry.value
+                if ttl > 0:
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        threading.Thread(target=self._refresh, args=(key, entry, load, size),
+                                         daemon=True).start()
+                    return entry.value
+        previous = entry.value if entry is not None else None
+        value = load(previous)
+        self._put(key, value, size(value))
+        return value
+
+    def _refresh(self, key: str, entry: _Entry, load: Callable[[Any], Any], size: Callable[[Any], int]) -> None:
+        try:
+            value = load(entry.value)
+        except Exception as e:
+            print(f"ICS background refresh failed for {key}: {e}", file=sys.stderr)
+            entry.refreshing = False
+            return
+        self._put(key, value, size(value))
+
+    def _put(self, key: str, value: Any, size: int) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total -= old.size
+            if size > self.max_bytes:
+                return
+            self._entries[key] = _Entry(value, size, time.time())
+            self._total += size
+            while self._total > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+
+def _max_bytes_from_env() -> int:
+    try:
+        return int(float(os.environ.get('MCP_ICS_CACHE_MB', '64')) * 1024 * 1024)
+    except ValueError:
+        return _DEFAULT_MAX_BYTES
+
+
+feed_cache = ParsedFeedCache(_max_bytes_from_env())
+
+
+def default_ttl() -> float:
+    """TTL for feeds without a per-alias setting (``MCP_ICS_TTL``, default 0)."""
+    try:
+        return float(os.environ.get('MCP_ICS_TTL', '0'))
+    except ValueError:
+        return 0.0
@@ -0,0 +1,65 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, NamedTuple, Optional
+from .. import deadline as request_deadline
+from . import ops
+from .feeds import _seconds_from_env
+from .parser import ICSEvent
+
+
+def fetch_deadline() -> float:
+    """Overall budget for listing all registered feeds (``MCP_ICS_DEADLINE``, default 15s)."""
+    return _seconds_from_env('MCP_ICS_DEADLINE', 15.0)
+
+
+class FeedResult(NamedTuple):
+    alias: str
+    url: str
+    records: List[ICSEvent]
+    # 'ok', 'timeout' or 'error: <message>'
+    status: str
+
+
+_FEED_WORKERS = 8
+_feed_pool: Optional[ThreadPoolExecutor] = None
+_feed_pool_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _feed_pool
+    with _feed_pool_lock:
+        if _feed_pool is None:
+            _feed_pool = ThreadPoolExecutor(max_workers=_FEED_WORKERS, thread_name_prefix="ics-fetch")
+        return _feed_pool
+
+
+def list_feeds(feeds: Dict[str, str], max_results: Optional[int] = None, deadline: Optional[float] = None,
+               **window) -> List[FeedResult]:
+    """Records of several feeds (``{alias: url}``) fetched concurrently, in the given order.
+
+    Downloads run on a shared pool, each bounded by the per-feed timeout; the
+    call as a whole returns after *deadline* seconds at most (``MCP_ICS_DEADLINE``
+    by default, capped by the current request's deadline). Feeds still running
+    then are reported as ``'timeout'`` while their download completes in the
+    background and warms the feed cache.
+    """
+    if not feeds:
+        return []
+    budget = request_deadline.timeout(fetch_deadline() if deadline is None else deadline)
+    loader = ops.ICSOperations()
+    # Each download runs in the caller's context so it sees the request deadline
+    futures = {alias: _pool().submit(contextvars.copy_context().run, loader.list_records, url, max_results, **window)
+               for alias, url in feeds.items()}
+    done, _ = wait(futures.values(), timeout=budget)
+    results = []
+    for alias, future in futures.items():
+        if future not in done:
+            future.cancel()
+            results.append(FeedResult(alias, feeds[alias], [], 'timeout'))
+            continue
+        try:
+            results.append(FeedResult(alias, feeds[alias], future.result(), 'ok'))
+        except Exception as e:
+            results.append(FeedResult(alias, feeds[alias], [], f'error: {e}'))
+    return results
@@ -0,0 +1,91 @@
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+from ..interval_index import IntervalIndex
+from . import http, registry
+from .cache import default_ttl, feed_cache
+from .parser import Chunks, ICSEvent, iter_events
+from .recurrence import RecurringSeries, split_recurring
+
+
+class ParsedFeed(NamedTuple):
+    events: List[ICSEvent]
+    index: IntervalIndex
+    validators: Optional[Dict[str, str]] = None
+    series: Sequence[RecurringSeries] = ()
+    # Events without a parseable DTSTART; never indexed, always listed first
+    undated: Sequence[ICSEvent] = ()
+
+    def size(self) -> int:
+        """Approximate footprint, used to bound the feed cache."""
+        records = list(self.events) + [series.master for series in self.series]
+        return sum(len(p.name) + len(p.value) + 64
+                   for ev in records for props in ev.properties.values() for p in props)
+
+
+def _seconds_from_env(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def feed_timeout() -> float:
+    """Socket timeout for one feed download (``MCP_ICS_FEED_TIMEOUT``, default 10s)."""
+    return _seconds_from_env('MCP_ICS_FEED_TIMEOUT', 10.0)
+
+
+class FeedLoader:
+    """Downloads, parses and caches feeds; a ``304`` reuses the cached parse."""
+
+    def __init__(self, fetch_timeout: Optional[float] = None):
+        self.fetch_timeout = feed_timeout() if fetch_timeout is None else fetch_timeout
+
+    def _download_ics(self, ics_url: str, validators: Optional[Dict[str, str]] = None) -> http.FeedResponse:  # pragma: no cover
+        return http.open_feed(ics_url, self.fetch_timeout, validators)
+
+    def _open(self, ics_url: str, previous: Optional[ParsedFeed] = None) -> http.FeedResponse:
+        """Start the download, revalidating when *previous* carries validators.
+
+        ``_download_ics`` may also return the whole text as a ``str``.
+        """
+        if previous is not None and previous.validators:
+            response: Union[str, http.FeedResponse] = self._download_ics(ics_url, previous.validators)
+        else:
+            response = self._download_ics(ics_url)
+        if isinstance(response, str):
+            response = http.FeedResponse(chunks=response)
+        return response
+
+    def _cache_ttl(self, ics_url: str) -> float:
+        ttl = registry.ttl_for_url(ics_url)
+        return default_ttl() if ttl is None else ttl
+
+    def _load_feed(self, ics_url: str) -> ParsedFeed:
+        """Parsed feed for *ics_url*, served from the feed cache.
+
+        Within the feed's TTL nothing is downloaded; after it the cached result
+        is returned while a background refresh runs (see ``cache``).
+        """
+        feed = feed_cache.get(ics_url, self._cache_ttl(ics_url),
+                              lambda previous: self._fetch_feed(ics_url, previous), ParsedFeed.size)
+        return feed
+
+    def _fetch_feed(self, ics_url: str, previous: Optional[ParsedFeed] = None) -> ParsedFeed:
+        """Stream and parse *ics_url*; a ``304 Not Modified`` reuses *previous* as is."""
+        response = self._open(ics_url, previous)
+        if response.not_modified:
+            return previous
+        return self._make_feed(self._parse_events(response.chunks), response.validators)
+
+    def _make_feed(self, events: List[ICSEvent], validators: Optional[Dict[str, str]] = None) -> ParsedFeed:
+        singles, series = split_recurring(events)
+        undated = [ev for ev in singles if ev.start is None]
+        return ParsedFeed(singles, self._build_index(singles), validators, series, undated)
+
+    def _parse_events(self, chunks: Chunks) -> List[ICSEvent]:
+        """Parse text (whole or in chunks) into one typed record per non-empty VEVENT."""
+        return list(iter_events(chunks))
+
+    def _build_index(self, events: List[ICSEvent]) -> IntervalIndex:
+        """Interval index over the *events* that have a parseable DTSTART."""
+        return IntervalIndex((ev.start_ts, ev.end_ts, ev) for ev in events if ev.start is not None)
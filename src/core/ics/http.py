@@ -0,0 +1,69 @@
+import codecs
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from .. import deadline
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class FeedResponse:
+    """Outcome of a (conditional) feed download.
+
+    *chunks* yields decoded text incrementally and closes the connection once
+    exhausted or closed. *validators* holds the ``ETag``/``Last-Modified``
+    values to send next time; *not_modified* is set on a 304.
+    """
+    chunks: Iterable[str] = ()
+    validators: Optional[Dict[str, str]] = None
+    not_modified: bool = False
+
+
+def _conditional_headers(validators: Optional[Dict[str, str]]) -> Dict[str, str]:
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def _iter_text(resp) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with resp:
+        while True:
+            deadline.check()
+            data = resp.read(CHUNK_SIZE)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                yield text
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+
+def open_feed(url: str, timeout: float, validators: Optional[Dict[str, str]] = None) -> FeedResponse:
+    """Start downloading *url*, revalidating with *validators* when given.
+
+    The body is not read here: iterate ``chunks`` to stream it. A 304 is only
+    accepted when validators were sent, i.e. the caller holds a copy. The
+    *timeout* is capped by the current request's deadline, and streaming
+    stops once that request is cancelled.
+    """
+    try:
+        resp = urlopen(Request(url, headers=_conditional_headers(validators)), timeout=deadline.timeout(timeout))
+    except HTTPError as e:
+        if e.code == 304 and validators:
+            return FeedResponse(validators=validators, not_modified=True)
+        raise
+    received = {
+        'etag': resp.headers.get('ETag'),
+        'last_modified': resp.headers.get('Last-Modified'),
+    }
+    received = {k: v for k, v in received.items() if v}
+    return FeedResponse(_iter_text(resp), received or None)
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from . import registry
+from .parser import ICSEvent
+from .selection import RecordSelector
+
+
+def format_record(event: ICSEvent) -> Dict:
+    """Text content item for a parsed VEVENT (all-day events show dates only)."""
+    def _display(moment: Optional[datetime], missing: str) -> str:
+        if moment is None:
+            return missing
+        return moment.date().isoformat() if event.all_day else moment.isoformat()
+
+    text = (f"{event.text('SUMMARY', 'No Summary')}\n📅 Start: {_display(event.start, 'No start time')}"
+            f"\n📅 End: {_display(event.end, 'No end time')}")
+    location = event.text('LOCATION')
+    description = event.text('DESCRIPTION')
+    if location:
+        text += f"\n📍 Location: {location}"
+    if description:
+        text += f"\n📝 Description: {description}"
+    return {"type": "text", "text": text}
+
+
+class ICSOperations(RecordSelector):
+    def list_events(self, ics_url: str, max_results: Optional[int] = None, debug: bool = False,
+                    time_min: Optional[str] = None, time_max: Optional[str] = None) -> List[Dict]:
+        if time_min or time_max:
+            return self.list_window(ics_url, time_min, time_max, max_results)
+        try:
+            if max_results and not debug and self._cache_ttl(ics_url) <= 0 and registry.is_ordered(ics_url):
+                return self._formatted(ics_url, self._ordered_records(ics_url, max_results))
+            feed = self._load_feed(ics_url)
+        except Exception as e:
+            error_msg = f"❌ Failed to fetch ICS calendar from {ics_url}: {str(e)}"
+            return [{"type": "text", "text": error_msg}]
+        
+        now = datetime.now(timezone.utc)
+        # Only the selected records are formatted
+        events: List[Dict] = [self._format_event(current) for current in self._upcoming(feed, now, max_results)]
+        total_events_found = len(feed.events) + len(feed.series)
+        
+        # Add debug information if requested or if no events were found
+        if debug or (len(events) == 0 and total_events_found > 0):
+            past_events_filtered = sum(1 for ev in feed.events if not self._is_future_event(ev, now))
+            debug_info = self._create_debug_info(ics_url, total_events_found, past_events_filtered, len(events))
+            events.append(debug_info)
+        elif len(events) == 0 and total_events_found == 0:
+            # No events found at all in the calendar
+            empty_msg = f"📅 No events found in ICS calendar: {ics_url}"
+            events.append({"type": "text", "text": empty_msg})
+        
+        return events
+
+    def list_window(self, ics_url: str, time_min: Optional[str] = None, time_max: Optional[str] = None,
+                    max_results: Optional[int] = None) -> List[Dict]:
+        """Events overlapping ``[time_min, time_max)``; *time_min* defaults to now."""
+        start, end = self._bounds(time_min, time_max)
+        try:
+            feed = self._load_feed(ics_url)
+        except Exception as e:
+            error_msg = f"❌ Failed to fetch ICS calendar from {ics_url}: {str(e)}"
+            return [{"type": "text", "text": error_msg}]
+        return self._formatted(ics_url, self._window_records(feed, start, end, max_results))
+
+    def _formatted(self, ics_url: str, records: List[ICSEvent]) -> List[Dict]:
+        events = [self._format_event(raw) for raw in records]
+        if not events:
+            events.append({"type": "text", "text": f"📅 No events found in ICS calendar: {ics_url}"})
+        return events
+
+    def _create_debug_info(self, ics_url: str, total_found: int, filtered: int, returned: int) -> Dict:
+        """Create debug information about the ICS processing."""
+        debug_text = f"🔍 ICS Debug Info for {ics_url}:\n"
+        debug_text += f"📊 Total events found: {total_found}\n"
+        debug_text += f"🚫 Past events filtered: {filtered}\n"
+        debug_text += f"✅ Future events returned: {returned}"
+        
+        if filtered > 0:
+            debug_text += f"\n💡 Tip: {filtered} past events were filtered out (events must start today or later)"
+        
+        return {"type": "text", "text": debug_text}
+
+    def _format_event(self, event: ICSEvent) -> Dict:
+        return format_record(event)
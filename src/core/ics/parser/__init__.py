@@ -0,0 +1,19 @@
+from .lines import Chunks, Property, iter_lines, parse_property, unescape_text
+from .timezones import TimezoneResolver, parse_datetime, parse_datetimes
+from .event import ICSEvent, build_event, parse_duration
+from .stream import iter_events
+
+__all__ = [
+    'Chunks',
+    'Property',
+    'iter_lines',
+    'parse_property',
+    'unescape_text',
+    'TimezoneResolver',
+    'parse_datetime',
+    'parse_datetimes',
+    'ICSEvent',
+    'build_event',
+    'parse_duration',
+    'iter_events',
+]
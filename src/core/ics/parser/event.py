@@ -0,0 +1,86 @@
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from .lines import Property, unescape_text
+from .timezones import TimezoneResolver, parse_datetime, parse_datetimes
+
+_DURATION = re.compile(r'^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+
+def parse_duration(value: str) -> Optional[timedelta]:
+    """``timedelta`` for an RFC 5545 DURATION such as ``PT1H30M`` or ``-P1D``."""
+    match = _DURATION.match(value.strip())
+    if not match or not any(match.groups()[1:]):
+        return None
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    delta = timedelta(weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+                      minutes=int(minutes or 0), seconds=int(seconds or 0))
+    return -delta if sign == '-' else delta
+
+
+@dataclass
+class ICSEvent:
+    """A parsed VEVENT with resolved start/end and its raw properties."""
+    properties: Dict[str, List[Property]]
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    all_day: bool = False
+    recurrence_id: Optional[datetime] = None
+    rdates: List[datetime] = field(default_factory=list)
+    exdates: List[datetime] = field(default_factory=list)
+    # Start as epoch seconds, computed once so sorting never re-derives it
+    sort_ts: float = float('-inf')
+
+    def get(self, name: str, default: str = '') -> str:
+        props = self.properties.get(name)
+        return props[0].value if props else default
+
+    def text(self, name: str, default: str = '') -> str:
+        props = self.properties.get(name)
+        return unescape_text(props[0].value) if props else default
+
+    @property
+    def uid(self) -> str:
+        return self.get('UID')
+
+    @property
+    def is_recurring(self) -> bool:
+        return self.start is not None and self.recurrence_id is None and ('RRULE' in self.properties or bool(self.rdates))
+
+    @property
+    def start_ts(self) -> Optional[float]:
+        return self.start.timestamp() if self.start else None
+
+    @property
+    def end_ts(self) -> Optional[float]:
+        return self.end.timestamp() if self.end else self.start_ts
+
+    def sort_key(self) -> float:
+        """Start as epoch seconds; undated events sort first."""
+        return self.sort_ts
+
+
+def build_event(properties: Dict[str, List[Property]], resolver: TimezoneResolver) -> ICSEvent:
+    event = ICSEvent(properties)
+    if 'DTSTART' in properties:
+        event.start, event.all_day = parse_datetime(properties['DTSTART'][0], resolver)
+    if event.start is None:
+        return event
+    event.sort_ts = event.start.timestamp()
+    if 'DTEND' in properties:
+        event.end, _ = parse_datetime(properties['DTEND'][0], resolver)
+    elif 'DURATION' in properties:
+        duration = parse_duration(properties['DURATION'][0].value)
+        event.end = event.start + duration if duration is not None else None
+    elif event.all_day:
+        event.end = event.start + timedelta(days=1)
+    if event.end is None or event.end < event.start:
+        event.end = event.start
+    if 'RECURRENCE-ID' in properties:
+        event.recurrence_id, _ = parse_datetime(properties['RECURRENCE-ID'][0], resolver)
+    for prop in properties.get('RDATE', []):
+        event.rdates.extend(parse_datetimes(prop, resolver))
+    for prop in properties.get('EXDATE', []):
+        event.exdates.extend(parse_datetimes(prop, resolver))
+    return event
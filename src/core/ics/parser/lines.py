@@ -0,0 +1,94 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+Chunks = Union[str, Iterable[str]]
+
+_TEXT_ESCAPE = re.compile(r'\\([\\;,nN])')
+
+
+def iter_lines(chunks: Chunks) -> Iterator[str]:
+    """Yield unfolded content lines from text arriving in arbitrary chunks.
+
+    A physical line that starts with a space or tab continues the previous
+    one (RFC 5545 §3.1); this holds even when the fold straddles a chunk
+    boundary. Only the current partial line is ever buffered.
+    """
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    pending = ''
+    logical = None
+    try:
+        for chunk in chunks:
+            pending += chunk
+            physical = pending.split('\n')
+            pending = physical.pop()
+            for raw in physical:
+                raw = raw.rstrip('\r')
+                if raw[:1] in (' ', '\t') and logical is not None:
+                    logical += raw[1:]
+                    continue
+                if logical is not None:
+                    yield logical.rstrip()
+                logical = raw
+        if pending:
+            if pending[:1] in (' ', '\t') and logical is not None:
+                logical += pending[1:]
+            else:
+                if logical is not None:
+                    yield logical.rstrip()
+                logical = pending
+        if logical is not None:
+            yield logical.rstrip()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+@dataclass
+class Property:
+    """One content line: ``NAME;PARAM=value:VALUE``."""
+    name: str
+    value: str
+    params: Dict[str, str] = field(default_factory=dict)
+
+
+def _split_unquoted(text: str, sep: str) -> List[str]:
+    parts, current, quoted = [], [], False
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif ch == sep and not quoted:
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(ch)
+    parts.append(''.join(current))
+    return parts
+
+
+def parse_property(line: str) -> Optional[Property]:
+    """Split a content line into name, parameters and value (None if malformed).
+
+    Parameter values may be quoted and contain ``:`` or ``;``.
+    """
+    quoted = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            quoted = not quoted
+        elif ch == ':' and not quoted:
+            break
+    else:
+        return None
+    name, *raw_params = _split_unquoted(line[:i], ';')
+    params = {}
+    for raw in raw_params:
+        if '=' in raw:
+            key, val = raw.split('=', 1)
+            params[key.upper()] = val.strip('"')
+    return Property(name.upper(), line[i + 1:], params)
+
+
+def unescape_text(value: str) -> str:
+    return _TEXT_ESCAPE.sub(lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
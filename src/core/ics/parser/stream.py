@@ -0,0 +1,47 @@
+from typing import Dict, Iterator, List, Optional
+from .event import ICSEvent, build_event
+from .lines import Chunks, Property, iter_lines, parse_property
+from .timezones import TimezoneResolver
+
+
+def iter_events(chunks: Chunks) -> Iterator[ICSEvent]:
+    """Yield an :class:`ICSEvent` per non-empty VEVENT as soon as it ends.
+
+    Components nested in an event (e.g. VALARM) are skipped; VTIMEZONE
+    blocks are kept to resolve TZIDs of the events that follow them.
+    """
+    lines = iter_lines(chunks)
+    resolver = TimezoneResolver()
+    props: Optional[Dict[str, List[Property]]] = None
+    nested = 0
+    tz_lines: Optional[List[str]] = None
+    try:
+        for line in lines:
+            upper = line.upper()
+            if tz_lines is not None:
+                tz_lines.append(line)
+                if upper == 'END:VTIMEZONE':
+                    resolver.add_definition(tz_lines)
+                    tz_lines = None
+            elif upper == 'BEGIN:VTIMEZONE' and props is None:
+                tz_lines = [line]
+            elif upper == 'BEGIN:VEVENT' and props is None:
+                props = {}
+            elif props is None:
+                prop = parse_property(line)
+                if prop is not None and prop.name == 'X-WR-TIMEZONE':
+                    resolver.set_default(prop.value)
+            elif upper.startswith('BEGIN:'):
+                nested += 1
+            elif upper.startswith('END:') and nested:
+                nested -= 1
+            elif upper == 'END:VEVENT':
+                if props:
+                    yield build_event(props, resolver)
+                props = None
+            elif not nested:
+                prop = parse_property(line)
+                if prop is not None:
+                    props.setdefault(prop.name, []).append(prop)
+    finally:
+        lines.close()
@@ -0,0 +1,81 @@
+import io
+from datetime import datetime, timezone, tzinfo
+from typing import Dict, List, Optional, Tuple
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    from backports.zoneinfo import ZoneInfo
+from dateutil.tz import tzical
+from .lines import Property, parse_property
+
+
+class TimezoneResolver:
+    """Map TZID parameters to tzinfo objects.
+
+    IANA names resolve through zoneinfo; other names (e.g. Windows zone names)
+    use the VTIMEZONE definitions found in the feed. Floating times use the
+    calendar's ``X-WR-TIMEZONE`` when present, otherwise UTC.
+    """
+
+    def __init__(self):
+        self.default: tzinfo = timezone.utc
+        self._definitions: Dict[str, str] = {}
+        self._cache: Dict[str, tzinfo] = {}
+
+    def add_definition(self, lines: List[str]) -> None:
+        for line in lines:
+            prop = parse_property(line)
+            if prop is not None and prop.name == 'TZID':
+                self._definitions[prop.value] = '\n'.join(lines)
+                self._cache.pop(prop.value, None)
+                return
+
+    def set_default(self, tzid: str) -> None:
+        self.default = self.resolve(tzid)
+
+    def resolve(self, tzid: Optional[str]) -> tzinfo:
+        if not tzid:
+            return self.default
+        if tzid not in self._cache:
+            self._cache[tzid] = self._lookup(tzid)
+        return self._cache[tzid]
+
+    def _lookup(self, tzid: str) -> tzinfo:
+        try:
+            return ZoneInfo(tzid)
+        except Exception:
+            pass
+        definition = self._definitions.get(tzid)
+        if definition:
+            try:
+                return tzical(io.StringIO(definition)).get(tzid)
+            except Exception:
+                pass
+        return self.default
+
+
+def parse_datetime(prop: Property, resolver: TimezoneResolver) -> Tuple[Optional[datetime], bool]:
+    """``(aware datetime, is_all_day)`` for a DATE or DATE-TIME property.
+
+    Dates become midnight UTC, matching how all-day Calendar events are
+    indexed. Returns ``(None, False)`` when the value cannot be parsed.
+    """
+    value = prop.value.strip()
+    try:
+        if prop.params.get('VALUE', '').upper() == 'DATE' or len(value) == 8:
+            return datetime.strptime(value[:8], '%Y%m%d').replace(tzinfo=timezone.utc), True
+        moment = datetime.strptime(value[:15], '%Y%m%dT%H%M%S')
+    except ValueError:
+        return None, False
+    tz = timezone.utc if value.upper().endswith('Z') else resolver.resolve(prop.params.get('TZID'))
+    return moment.replace(tzinfo=tz), False
+
+
+def parse_datetimes(prop: Property, resolver: TimezoneResolver) -> List[datetime]:
+    """All instants of a comma-separated EXDATE/RDATE value (PERIOD values use their start)."""
+    moments = []
+    for value in prop.value.split(','):
+        moment, _ = parse_datetime(Property(prop.name, value.split('/', 1)[0], prop.params), resolver)
+        if moment is not None:
+            moments.append(moment)
+    return moments
@@ -0,0 +1,105 @@
+import os
+import re
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from itertools import islice, takewhile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from dateutil.rrule import rruleset, rrulestr
+from .parser import ICSEvent
+
+_UTC_UNTIL = re.compile(r'UNTIL=(\d{8}T\d{6})Z', re.IGNORECASE)
+
+
+def expansion_horizon() -> timedelta:
+    """How far ahead open-ended listings expand (``MCP_ICS_EXPANSION_DAYS``, default 365)."""
+    try:
+        return timedelta(days=float(os.environ.get('MCP_ICS_EXPANSION_DAYS', '365')))
+    except ValueError:
+        return timedelta(days=365)
+
+
+class RecurringSeries:
+    """Occurrences of a recurring VEVENT, generated lazily.
+
+    Rules are evaluated in the wall-clock time of the event's timezone, so a
+    09:00 meeting stays at 09:00 across DST changes. Generated instants are
+    cached by dateutil, i.e. once per parsed feed version.
+    """
+
+    def __init__(self, master: ICSEvent, excluded: Iterable[datetime] = ()):
+        self.master = master
+        self.duration = master.end - master.start
+        self.tz = master.start.tzinfo
+        dtstart = self._local(master.start)
+        rules = rruleset(cache=True)
+        for prop in master.properties.get('RRULE', []):
+            rules.rrule(rrulestr(self._rule_text(prop.value), dtstart=dtstart))
+        rules.rdate(dtstart)
+        for moment in master.rdates:
+            rules.rdate(self._local(moment))
+        for moment in list(master.exdates) + list(excluded):
+            rules.exdate(self._local(moment))
+        self._rules = rules
+
+    def _local(self, moment: datetime) -> datetime:
+        return moment.astimezone(self.tz).replace(tzinfo=None)
+
+    def _rule_text(self, rule: str) -> str:
+        # UNTIL in UTC is converted to the naive wall-clock domain the rule runs in
+        def _until(match):
+            until = datetime.strptime(match.group(1), '%Y%m%dT%H%M%S').replace(tzinfo=timezone.utc)
+            return f"UNTIL={self._local(until):%Y%m%dT%H%M%S}"
+        return _UTC_UNTIL.sub(_until, rule)
+
+    def _instance(self, start: datetime) -> ICSEvent:
+        start = start.replace(tzinfo=self.tz)
+        return replace(self.master, start=start, end=start + self.duration, sort_ts=start.timestamp())
+
+    def after(self, moment: datetime) -> Iterator[ICSEvent]:
+        """Occurrences still running at *moment* or starting later, in start order."""
+        for start in self._rules.xafter(self._local(moment - self.duration), inc=False):
+            yield self._instance(start)
+
+    def between(self, start: datetime, end: datetime) -> List[ICSEvent]:
+        """Occurrences overlapping ``[start, end)``."""
+        starts = self._rules.between(self._local(start - self.duration), self._local(end), inc=False)
+        return [self._instance(moment) for moment in starts]
+
+    def take(self, after: datetime, limit: Optional[int] = None, until: Optional[datetime] = None) -> List[ICSEvent]:
+        """Up to *limit* occurrences from *after*, bounded by *until* or the expansion horizon."""
+        if until is None and limit is None:
+            until = after + expansion_horizon()
+        occurrences = self.after(after)
+        if until is not None:
+            occurrences = takewhile(lambda ev: ev.start < until, occurrences)
+        return list(islice(occurrences, limit))
+
+
+def split_recurring(events: Iterable[ICSEvent]) -> Tuple[List[ICSEvent], List[RecurringSeries]]:
+    """Separate single events from recurring series.
+
+    ``RECURRENCE-ID`` overrides are listed as single events and their original
+    instants removed from the series; cancelled overrides only remove them.
+    A master whose rule cannot be parsed is kept as a single event.
+    """
+    singles: List[ICSEvent] = []
+    masters: List[ICSEvent] = []
+    overrides: Dict[str, List[ICSEvent]] = {}
+    for event in events:
+        if event.recurrence_id is not None:
+            overrides.setdefault(event.uid, []).append(event)
+        elif event.is_recurring:
+            masters.append(event)
+        else:
+            singles.append(event)
+    series = []
+    for master in masters:
+        moved = overrides.pop(master.uid, [])
+        try:
+            series.append(RecurringSeries(master, [ev.recurrence_id for ev in moved]))
+        except (ValueError, TypeError, OverflowError):
+            singles.append(master)
+        singles.extend(ev for ev in moved if ev.get('STATUS').upper() != 'CANCELLED')
+    for orphans in overrides.values():
+        singles.extend(ev for ev in orphans if ev.get('STATUS').upper() != 'CANCELLED')
+    return singles, series
@@ -0,0 +1,68 @@
+# pragma: no cover
+import json
+import os
+import threading
+from typing import Dict, Optional, Union
+
+_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir, 'config', 'ics_urls.json')
+_LOCK = threading.Lock()
+
+
+def _load() -> Dict[str, str]:  # pragma: no cover
+    if not os.path.exists(_REGISTRY_PATH):
+        return {}  # pragma: no cover
+    with open(_REGISTRY_PATH, 'r', encoding='utf8') as fh:
+        try:
+            return json.load(fh)
+        except Exception:
+            return {}  # pragma: no cover
+
+
+def _save(data: Dict[str, str]) -> None:  # pragma: no cover
+    os.makedirs(os.path.dirname(_REGISTRY_PATH), exist_ok=True)
+    with open(_REGISTRY_PATH, 'w', encoding='utf8') as fh:
+        json.dump(data, fh, indent=2)  # pragma: no cover
+
+
+def _url(entry: Union[str, Dict]) -> str:
+    """Entries are a bare URL, or ``{"url": ..., "ttl": seconds, "ordered": bool}`` with options."""
+    return entry.get('url', '') if isinstance(entry, dict) else entry
+
+
+def register(alias: str, url: str, ttl: Optional[float] = None, ordered: bool = False) -> None:
+    if not alias or not url:
+        raise ValueError('alias and url are required')
+    if ttl is not None and ttl < 0:
+        raise ValueError('ttl must be zero or positive')
+    entry: Union[str, Dict] = url
+    if ttl is not None or ordered:
+        entry = {'url': url}
+        if ttl is not None:
+            entry['ttl'] = ttl
+        if ordered:
+            entry['ordered'] = True
+    with _LOCK:
+        data = _load()
+        data[alias] = entry
+        _save(data)
+
+
+def get(alias: str) -> str:
+    return _url(_load().get(alias, ''))
+
+
+def ttl_for_url(url: str) -> Optional[float]:
+    """TTL configured for any alias pointing at *url* (the largest, if several)."""
+    ttls = [entry['ttl'] for entry in _load().values()
+            if isinstance(entry, dict) and entry.get('url') == url and entry.get('ttl') is not None]
+    return max(ttls) if ttls else None
+
+
+def is_ordered(url: str) -> bool:
+    """True when an alias declares that *url* lists its events in start order."""
+    return any(isinstance(entry, dict) and entry.get('url') == url and entry.get('ordered')
+               for entry in _load().values())
+
+
+def list_all() -> Dict[str, str]:
+    return {alias: _url(entry) for alias, entry in _load().items()} 
\ No newline at end of file
@@ -0,0 +1,92 @@
+import heapq
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterator, List, Optional
+from ..interval_index import to_timestamp
+from . import registry
+from .feeds import FeedLoader, ParsedFeed
+from .parser import ICSEvent, iter_events
+
+
+class RecordSelector(FeedLoader):
+    """Picks the records of a feed to list, in start order, without formatting them."""
+
+    def _select(self, streams: List[Iterator[ICSEvent]], max_results: Optional[int] = None) -> List[ICSEvent]:
+        """The first *max_results* records (all if None) of start-ordered *streams*.
+
+        The streams are merged lazily through a heap holding one record per
+        stream, so only the selected records are ever materialised; a single
+        stream (a feed without recurring events) is simply cut short.
+        """
+        merged = streams[0] if len(streams) == 1 else heapq.merge(*streams, key=ICSEvent.sort_key)
+        return list(islice(merged, max_results))
+
+    def _upcoming(self, feed: ParsedFeed, now: datetime, max_results: Optional[int] = None) -> List[ICSEvent]:
+        """The next *max_results* events of *feed* still running or starting from today on.
+
+        Singles come from the interval index in start order, so a 100k-event
+        feed costs O(log n + k) per listing; each series only generates the
+        occurrences that are actually needed.
+        """
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        streams = [iter(feed.undated), feed.index.iter_overlapping(today.timestamp())]
+        for rule in feed.series:
+            streams.append(rule.after(today) if max_results else iter(rule.take(today)))
+        streams = [(ev for ev in stream if self._is_future_event(ev, now)) for stream in streams]
+        return self._select(streams, max_results)
+
+    def _ordered_records(self, ics_url: str, max_results: int) -> List[ICSEvent]:
+        """Read a feed registered as time-ordered only until *max_results* upcoming events are found.
+
+        Recurring events met before stopping still contribute their later
+        occurrences; anything after the stop point starts later anyway.
+        """
+        now = datetime.now(timezone.utc)
+        collected: List[ICSEvent] = []
+        found = 0
+        stream = iter_events(self._open(ics_url).chunks)
+        try:
+            for raw in stream:
+                collected.append(raw)
+                if raw.recurrence_id is None and not raw.is_recurring and self._is_future_event(raw, now):
+                    found += 1
+                    if found >= max_results:
+                        break
+        finally:
+            stream.close()
+        return self._upcoming(self._make_feed(collected), now, max_results)
+
+    def _window_records(self, feed: ParsedFeed, start: float, end: Optional[float],
+                        max_results: Optional[int] = None) -> List[ICSEvent]:
+        streams = [feed.index.iter_overlapping(start, end)]
+        window_start = datetime.fromtimestamp(start, timezone.utc)
+        for rule in feed.series:
+            if end is not None:
+                streams.append(iter(rule.between(window_start, datetime.fromtimestamp(end, timezone.utc))))
+            else:
+                streams.append(rule.after(window_start) if max_results else iter(rule.take(window_start)))
+        return self._select(streams, max_results)
+
+    def _bounds(self, time_min: Optional[str], time_max: Optional[str]):
+        start = to_timestamp(time_min) if time_min else datetime.now(timezone.utc).timestamp()
+        return start, to_timestamp(time_max) if time_max else None
+
+    def list_records(self, ics_url: str, max_results: Optional[int] = None,
+                     time_min: Optional[str] = None, time_max: Optional[str] = None) -> List[ICSEvent]:
+        """The records ``list_events`` would list, in start order, unformatted.
+
+        Fetch errors propagate instead of becoming an error message.
+        """
+        if time_min or time_max:
+            start, end = self._bounds(time_min, time_max)
+            return self._window_records(self._load_feed(ics_url), start, end, max_results)
+        if max_results and self._cache_ttl(ics_url) <= 0 and registry.is_ordered(ics_url):
+            return self._ordered_records(ics_url, max_results)
+        return self._upcoming(self._load_feed(ics_url), datetime.now(timezone.utc), max_results)
+
+    def _is_future_event(self, event: ICSEvent, now: datetime) -> bool:
+        """Check if event starts today or later, or is still running."""
+        if event.start is None:
+            return True  # Include events we can't parse or without start time
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return event.start >= today or event.end > now
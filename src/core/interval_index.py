@@ -0,0 +1,83 @@
+import heapq
+import math
+from bisect import bisect_left
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def to_timestamp(value: str) -> float:
+    """Epoch seconds for an RFC 3339 string such as ``timeMin``/``timeMax`` (naive = UTC)."""
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        raise ValueError(f"Invalid time bound: {value}")
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class _DurationBucket:
+    """Intervals of similar length: sorted starts plus the longest duration among them."""
+
+    def __init__(self):
+        self.starts: List[float] = []
+        self.ends: List[float] = []
+        self.positions: List[int] = []
+        self.max_duration = 0.0
+
+    def add(self, start: float, end: float, position: int) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+        self.positions.append(position)
+        self.max_duration = max(self.max_duration, end - start)
+
+    def iter_overlapping(self, start: float, end: Optional[float]) -> Iterator[int]:
+        lo = bisect_left(self.starts, start - self.max_duration)
+        hi = len(self.starts) if end is None else bisect_left(self.starts, end)
+        for i in range(lo, hi):
+            if self.ends[i] > start or self.starts[i] >= start:
+                yield self.positions[i]
+
+
+def _duration_class(duration: float) -> int:
+    # Durations within a factor of two share a class; zero-length intervals get their own
+    return math.frexp(duration)[1] if duration > 0 else -1
+
+
+class IntervalIndex:
+    """Immutable index of ``(start, end, item)`` intervals sorted by start.
+
+    Intervals are grouped by duration within a factor of two; each group
+    widens its lower bound by its own longest duration, so an interval that
+    began earlier but is still running is never missed, and a few
+    multi-year events do not make every query rescan everything since they
+    began. Queries cost O(g log n + k) for g duration groups (at most a few
+    dozen) and the k intervals scanned.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[float, float, Any]] = ()):
+        entries = sorted(intervals, key=lambda entry: entry[0])
+        self._items = [item for _, _, item in entries]
+        buckets: Dict[int, _DurationBucket] = {}
+        for position, (start, end, _) in enumerate(entries):
+            end = max(start, end)
+            buckets.setdefault(_duration_class(end - start), _DurationBucket()).add(start, end, position)
+        self._buckets = list(buckets.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def iter_overlapping(self, start: float, end: Optional[float] = None) -> Iterator[Any]:
+        """Lazily yield items running at any point of ``[start, end)`` ordered by start.
+
+        Zero-length intervals count when they fall inside the window.
+        """
+        # Positions index the start-sorted items, so merging them keeps start order
+        positions = heapq.merge(*(bucket.iter_overlapping(start, end) for bucket in self._buckets))
+        for position in positions:
+            yield self._items[position]
+
+    def overlapping(self, start: float, end: Optional[float] = None, limit: Optional[int] = None) -> List[Any]:
+        """Items running at any point of ``[start, end)`` ordered by start."""
+        return list(islice(self.iter_overlapping(start, end), limit))
@@ -0,0 +1,59 @@
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from ..calendar.list_events import format_event
+from ..interval_index import to_timestamp
+from .store import EventStore
+from .engine import ensure_fresh, sync_calendar
+
+__all__ = [
+    'EventStore',
+    'ensure_fresh',
+    'sync_calendar',
+    'cached_events',
+    'get_store',
+    'list_cached_events',
+    'mark_stale',
+]
+
+_STORE: Optional[EventStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_store() -> Optional[EventStore]:
+    """Process-wide store, or None unless MCP_EVENT_STORE=1."""
+    global _STORE
+    if os.environ.get('MCP_EVENT_STORE') != '1':
+        return None
+    with _STORE_LOCK:
+        if _STORE is None:
+            path = os.environ.get('MCP_EVENT_STORE_PATH')
+            _STORE = EventStore(path) if path else EventStore()
+        return _STORE
+
+
+def mark_stale() -> None:
+    """Invalidate cached listings after this server modified events."""
+    store = get_store()
+    if store is not None:
+        store.mark_stale()
+
+
+def cached_events(service, store: EventStore, max_results: Optional[int] = None,
+                  calendar_id: str = 'primary', time_min: Optional[str] = None,
+                  time_max: Optional[str] = None) -> List[Dict]:
+    """Raw events overlapping ``[time_min, time_max)`` (default: from now on),
+    served from the local store and syncing first when stale."""
+    start = to_timestamp(time_min) if time_min else time.time()
+    end = to_timestamp(time_max) if time_max else None
+    ttl = float(os.environ.get('MCP_SYNC_TTL', '60'))
+    ensure_fresh(service, store, calendar_id, ttl)
+    return store.window(calendar_id, start, end, max_results)
+
+
+def list_cached_events(service, store: EventStore, max_results: Optional[int] = None,
+                       calendar_id: str = 'primary', time_min: Optional[str] = None,
+                       time_max: Optional[str] = None) -> List[Dict]:
+    """Formatted :func:`cached_events`."""
+    return [format_event(e) for e in cached_events(service, store, max_results, calendar_id, time_min, time_max)]
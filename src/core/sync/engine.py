@@ -0,0 +1,51 @@
+import time
+from typing import Dict, List, Optional
+from googleapiclient.errors import HttpError
+from ..calendar.fields import EVENT_FIELDS
+from .store import EventStore
+
+SYNC_FIELDS = f"nextPageToken,nextSyncToken,items({','.join(EVENT_FIELDS)},iCalUID,status)"
+
+
+def _fetch_changes(service, calendar_id: str, sync_token: Optional[str]):
+    """Return ``(items, next_sync_token)`` for a full or incremental sync."""
+    params = {'calendarId': calendar_id, 'singleEvents': True, 'fields': SYNC_FIELDS, 'maxResults': 2500}
+    if sync_token:
+        params['syncToken'] = sync_token
+    items: List[Dict] = []
+    page_token = None
+    while True:
+        if page_token:
+            params['pageToken'] = page_token
+        result = service.events().list(**params).execute()
+        items.extend(result.get('items', []))
+        page_token = result.get('nextPageToken')
+        if not page_token:
+            return items, result.get('nextSyncToken')
+
+
+def sync_calendar(service, store: EventStore, calendar_id: str = 'primary') -> int:
+    """Bring the local copy of *calendar_id* up to date; returns the number of changes.
+
+    Uses the stored ``syncToken`` when there is one and falls back to a full
+    resync when the token has expired (HTTP 410 Gone).
+    """
+    sync_token, _ = store.get_state(calendar_id)
+    try:
+        items, next_token = _fetch_changes(service, calendar_id, sync_token)
+    except HttpError as e:
+        if sync_token is None or getattr(e.resp, 'status', None) != 410:
+            raise
+        sync_token = None
+        items, next_token = _fetch_changes(service, calendar_id, None)
+    store.apply_changes(calendar_id, items, next_token, reset=sync_token is None)
+    return len(items)
+
+
+def ensure_fresh(service, store: EventStore, calendar_id: str, ttl: float) -> bool:
+    """Sync *calendar_id* unless it was synced within *ttl* seconds; True if synced."""
+    _, synced_at = store.get_state(calendar_id)
+    if time.time() - synced_at < ttl:
+        return False
+    sync_calendar(service, store, calendar_id)
+    return True
@@ -0,0 +1,94 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..calendar.utils import event_timestamp
+from ..interval_index import IntervalIndex
+
+_DEFAULT_PATH = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir, 'config', 'events.sqlite3')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, event_id)
+);
+CREATE INDEX IF NOT EXISTS events_by_start ON events (calendar_id, start_ts);
+CREATE TABLE IF NOT EXISTS sync_state (
+    calendar_id TEXT PRIMARY KEY,
+    sync_token TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+class EventStore:
+    """SQLite-backed copy of Calendar events plus per-calendar sync tokens.
+
+    Time-window reads go through an in-memory :class:`IntervalIndex` per
+    calendar, rebuilt lazily after each change.
+    """
+
+    def __init__(self, path: str = _DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, IntervalIndex] = {}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get_state(self, calendar_id: str) -> Tuple[Optional[str], float]:
+        with self._connect() as conn:
+            row = conn.execute('SELECT sync_token, synced_at FROM sync_state WHERE calendar_id = ?',
+                               (calendar_id,)).fetchone()
+        return (row[0], row[1]) if row else (None, 0.0)
+
+    def apply_changes(self, calendar_id: str, changed: Iterable[Dict], sync_token: Optional[str],
+                      reset: bool = False) -> None:
+        """Upsert changed events, drop cancelled ones and record the new token atomically."""
+        with self._lock, self._connect() as conn:
+            if reset:
+                conn.execute('DELETE FROM events WHERE calendar_id = ?', (calendar_id,))
+            for event in changed:
+                if event.get('status') == 'cancelled':
+                    conn.execute('DELETE FROM events WHERE calendar_id = ? AND event_id = ?',
+                                 (calendar_id, event['id']))
+                    continue
+                start_ts = event_timestamp(event.get('start'))
+                end_ts = event_timestamp(event.get('end'), start_ts)
+                conn.execute('INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)',
+                             (calendar_id, event['id'], start_ts, end_ts, json.dumps(event)))
+            conn.execute('INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)',
+                         (calendar_id, sync_token, time.time()))
+            self._indexes.pop(calendar_id, None)
+
+    def mark_stale(self) -> None:
+        """Force the next read of every calendar to sync first."""
+        with self._lock, self._connect() as conn:
+            conn.execute('UPDATE sync_state SET synced_at = 0')
+
+    def index(self, calendar_id: str) -> IntervalIndex:
+        """Interval index over the stored events of *calendar_id*."""
+        index = self._indexes.get(calendar_id)
+        if index is not None:
+            return index
+        with self._lock:
+            with self._connect() as conn:
+                rows = conn.execute('SELECT start_ts, end_ts, data FROM events WHERE calendar_id = ?',
+                                    (calendar_id,)).fetchall()
+            index = IntervalIndex((start, end, data) for start, end, data in rows)
+            self._indexes[calendar_id] = index
+            return index
+
+    def window(self, calendar_id: str, start_ts: float, end_ts: Optional[float] = None,
+               limit: Optional[int] = None) -> List[Dict]:
+        """Events overlapping ``[start_ts, end_ts)``, ordered by start."""
+        return [json.loads(data) for data in self.index(calendar_id).overlapping(start_ts, end_ts, limit)]
@@ -9,8 +9,9 @@ from src.core import auth as auth
 
 from ..tools import tool_calendar as _cal
 from ..tools import tool_ics as _ics
+from ..tools import tool_availability as _availability
 
-_modules = [_cal, _ics]
+_modules = [_cal, _ics, _availability]
 
 
 def _dispatch(name: str, args: Dict[str, Any]):
@@ -1,47 +1,44 @@
-import json
+import threading
 from typing import Dict, Any, Optional
+from src.core import deadline
 from ..mcp_schema import get_mcp_schema
-from .mcp_post_other_handler import handle_post_other
-
-class MockHandler:
-    """Mocks the behavior of a BaseHTTPRequestHandler for capturing responses."""
-    def __init__(self):
-        self.response_data = None
-        self.status_code = 200
-        self.headers = []
-    
-    def send_response(self, code):
-        self.status_code = code
-    
-    def send_header(self, key, value):
-        self.headers.append((key, value))
-    
-    def end_headers(self):
-        pass
-    
-    @property
-    def wfile(self):
-        class MockWFile:
-            def __init__(self, handler):
-                self.handler = handler
-            
-            def write(self, data):
-                if isinstance(data, bytes):
-                    data = data.decode('utf-8')
-                try:
-                    self.handler.response_data = json.loads(data)
-                except json.JSONDecodeError:
-                    self.handler.response_data = {"error": "Invalid JSON response"}
-        
-        return MockWFile(self)
+from .mcp_post_other_handler import post_other_response
 
 class StdioRequestHandler:
     def __init__(self, capabilities: Dict):
         self.capabilities = capabilities
+        self._pending: Dict[Any, deadline.Deadline] = {}
+        self._pending_lock = threading.Lock()
+
+    def register(self, request: Dict[str, Any]) -> None:
+        """Track a queued ``tools/call`` (its deadline starts now) so an early cancellation is kept."""
+        if request.get("method") == "tools/call":
+            with self._pending_lock:
+                self._pending[request.get("id")] = self._deadline_for(request)
+
+    def cancel(self, request_id: Any) -> None:
+        """Signal a queued or running ``tools/call`` to stop (``notifications/cancelled``)."""
+        with self._pending_lock:
+            pending = self._pending.get(request_id)
+        if pending is not None:
+            pending.cancel()
+
+    @staticmethod
+    def _error(request: Dict[str, Any], code: int, message: str) -> Dict[str, Any]:
+        return {"jsonrpc": request.get("jsonrpc", "2.0"), "id": request.get("id"),
+                "error": {"code": code, "message": message}}
+
+    @staticmethod
+    def _deadline_for(request: Dict[str, Any]) -> deadline.Deadline:
+        """Budget from ``params._meta.timeoutMs``, else the server default (MCP_REQUEST_TIMEOUT)."""
+        meta = (request.get("params") or {}).get("_meta") or {}
+        timeout_ms = meta.get("timeoutMs")
+        if isinstance(timeout_ms, (int, float)) and not isinstance(timeout_ms, bool) and timeout_ms > 0:
+            return deadline.Deadline(timeout_ms / 1000)
+        return deadline.Deadline(deadline.default_seconds())
 
     def handle_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         method = request.get("method")
-        
         if method == "initialize":
             return self._handle_initialize(request)
         elif method == "tools/list":
@@ -49,11 +46,7 @@ class StdioRequestHandler:
         elif method == "tools/call":
             return self._handle_tools_call(request)
         else:
-            return {
-                "jsonrpc": request.get("jsonrpc", "2.0"),
-                "id": request.get("id"),
-                "error": {"code": -32601, "message": f"Method not found: {method}"}
-            }
+            return self._error(request, -32601, f"Method not found: {method}")
 
     def _handle_initialize(self, request: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -74,18 +67,35 @@ class StdioRequestHandler:
             "result": {"tools": schema['tools']}
         }
 
-    def _handle_tools_call(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        mock_handler = MockHandler()
-        response = {"jsonrpc": request.get("jsonrpc", "2.0"), "id": request.get("id")}
-        
+    def _handle_tools_call(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run a tool within its deadline; cancelled calls get no response."""
+        request_id = request.get("id")
+        with self._pending_lock:
+            budget = self._pending.setdefault(request_id, self._deadline_for(request))
+        try:
+            if budget.cancelled:
+                return None
+            with deadline.scope(budget):
+                result = self._call_tool(request)
+        except deadline.RequestCancelled:
+            return None
+        except deadline.DeadlineExceeded:
+            result = None
+        finally:
+            with self._pending_lock:
+                if self._pending.get(request_id) is budget:
+                    del self._pending[request_id]
+        if budget.cancelled:
+            return None
+        if result is None or budget.expired:
+            return self._error(request, -32001, "Request timed out")
+        return result
+
+    def _call_tool(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch in process; the response dict is serialised once, by the transport."""
         try:
-            handle_post_other(mock_handler, request, response)
-            if mock_handler.response_data:
-                return mock_handler.response_data
-            return response
+            return post_other_response(request)
+        except (deadline.DeadlineExceeded, deadline.RequestCancelled):
+            raise
         except Exception as e:
-            return {
-                "jsonrpc": request.get("jsonrpc", "2.0"),
-                "id": request.get("id"),
-                "error": {"code": -32603, "message": f"Internal error: {str(e)}"}
-            } 
\ No newline at end of file
+            return self._error(request, -32603, f"Internal error: {str(e)}") 
\ No newline at end of file
@@ -22,6 +22,15 @@ def get_mcp_schema():
                             "type": "string",
                             "description": "ID of the Google Calendar to query (defaults to primary)"
                         },
+                        "calendar_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Google Calendar IDs to query together; results are merged by start time"
+                        },
+                        "all_calendars": {
+                            "type": "boolean",
+                            "description": "Query every calendar selected in the user's calendar list and merge the results"
+                        },
                         "ics_url": {
                             "type": "string",
                             "description": "External ICS URL to fetch events from (takes precedence over calendar_id)"
@@ -29,6 +38,27 @@ def get_mcp_schema():
                         "ics_alias": {
                             "type": "string",
                             "description": "Alias of a previously registered ICS calendar URL"
+                        },
+                        "with_ics": {
+                            "type": "boolean",
+                            "description": "Also list every registered ICS calendar, merged with the Google events by start time"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursor returned by a previous call to continue the listing"
+                        },
+                        "fields": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Extra event fields to include (e.g. attendees, hangoutLink)"
+                        },
+                        "timeMin": {
+                            "type": "string",
+                            "description": "Only events ending after this RFC 3339 time (defaults to now)"
+                        },
+                        "timeMax": {
+                            "type": "string",
+                            "description": "Only events starting before this RFC 3339 time"
                         }
                     },
                     "required": []
@@ -162,11 +192,61 @@ def get_mcp_schema():
                                     }
                                 }
                             }
+                        },
+                        "etag": {
+                            "type": "string",
+                            "description": "Only apply the edit if the event still has this ETag (If-Match)"
                         }
                     },
                     "required": ["event_id", "updated_details"]
                 }
             },
+            {
+                "name": "remove_events",
+                "description": "Remove multiple events from Google Calendar in batch",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "event_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "IDs of the events to remove"
+                        }
+                    },
+                    "required": ["event_ids"]
+                }
+            },
+            {
+                "name": "edit_events",
+                "description": "Edit multiple existing events in Google Calendar in batch",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "edits": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "event_id": {
+                                        "type": "string",
+                                        "description": "ID of the event to edit"
+                                    },
+                                    "updated_details": {
+                                        "type": "object",
+                                        "description": "Fields to change (same format as edit_event)"
+                                    },
+                                    "etag": {
+                                        "type": "string",
+                                        "description": "Optional ETag for If-Match"
+                                    }
+                                },
+                                "required": ["event_id", "updated_details"]
+                            }
+                        }
+                    },
+                    "required": ["edits"]
+                }
+            },
             {
                 "name": "register_ics_calendar",
                 "description": "Register a persistent alias for an external ICS calendar URL",
@@ -174,7 +254,9 @@ def get_mcp_schema():
                     "type": "object",
                     "properties": {
                         "alias": {"type": "string", "description": "Short alias"},
-                        "ics_url": {"type": "string", "description": "ICS URL to associate"}
+                        "ics_url": {"type": "string", "description": "ICS URL to associate"},
+                        "ttl": {"type": "number", "description": "Seconds to serve the parsed feed from cache before refreshing it in the background"},
+                        "ordered": {"type": "boolean", "description": "Declare that the feed lists events in start order so downloads can stop early"}
                     },
                     "required": ["alias", "ics_url"]
                 }
@@ -183,6 +265,38 @@ def get_mcp_schema():
                 "name": "list_ics_calendars",
                 "description": "List registered ICS calendar aliases",
                 "inputSchema": {"type": "object", "properties": {}, "required": []}
+            },
+            {
+                "name": "find_free_slots",
+                "description": "Find free time slots across calendars (freebusy) and registered ICS feeds",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "timeMin": {"type": "string", "description": "Start of the search range (RFC 3339, defaults to now)"},
+                        "timeMax": {"type": "string", "description": "End of the search range (RFC 3339, defaults to 7 days after timeMin)"},
+                        "duration_minutes": {"type": "number", "description": "Minimum length of a free slot (default 30)"},
+                        "max_results": {"type": "integer", "minimum": 1, "description": "Maximum number of slots to return (default 10)"},
+                        "calendar_ids": {"type": "array", "items": {"type": "string"}, "description": "Calendars whose busy times count (defaults to primary)"},
+                        "all_calendars": {"type": "boolean", "description": "Use every calendar selected in the user's calendar list"},
+                        "with_ics": {"type": "boolean", "description": "Also count events of registered ICS feeds as busy"}
+                    },
+                    "required": []
+                }
+            },
+            {
+                "name": "check_conflicts",
+                "description": "Check whether a time range conflicts with busy times in calendars or registered ICS feeds",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "start_time": {"type": "string", "description": "Start of the range (RFC 3339)"},
+                        "end_time": {"type": "string", "description": "End of the range (RFC 3339)"},
+                        "calendar_ids": {"type": "array", "items": {"type": "string"}, "description": "Calendars to check (defaults to primary)"},
+                        "all_calendars": {"type": "boolean", "description": "Check every calendar selected in the user's calendar list"},
+                        "with_ics": {"type": "boolean", "description": "Also check events of registered ICS feeds"}
+                    },
+                    "required": ["start_time", "end_time"]
+                }
             }
         ]
     }
@@ -1,5 +1,6 @@
 from .mcp_server import *
-from .mcp_stdio_server import MCPStdioServer, run_stdio_server
+from .mcp_stdio_server import AsyncMCPStdioServer, MCPStdioServer, run_stdio_server
 from .stdio_server_core import MCPStdioServer as StdioServerCore
-from .stdio_server_io import send_response, create_error_response, read_stdin_loop
+from .stdio_frames import send_response, create_error_response, encode_response
+from .stdio_server_io import read_stdin_loop
 from .stdio_server_runner import run_stdio_server as run_stdio_server_func
\ No newline at end of file
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+JSON codecs for the stdio transport.
+
+``orjson`` is used when installed; otherwise the stdlib ``json`` module.
+Both encode straight to UTF-8 bytes so frames can be written to
+``sys.stdout.buffer`` without a text-layer round trip. Set
+``MCP_JSON_CODEC=json`` to force the stdlib codec.
+"""
+import json
+import os
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class JSONCodec(NamedTuple):
+    """``dumps`` returns UTF-8 bytes; ``loads`` accepts bytes or str.
+
+    Malformed input, including invalid UTF-8, raises ``json.JSONDecodeError``.
+    """
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    if isinstance(data, bytes):
+        try:
+            data = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid UTF-8: {e.reason}", '', e.start)
+    return json.loads(data)
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # e.g. integers beyond 64 bits, which the stdlib still encodes
+        return _json_dumps(obj)
+
+
+STDLIB = JSONCodec('json', _json_dumps, _json_loads)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+ORJSON = JSONCodec('orjson', _orjson_dumps, orjson.loads) if orjson is not None else None
+
+
+def select_codec(name: Optional[str] = None) -> JSONCodec:
+    """Codec named *name* (``MCP_JSON_CODEC`` by default), else the fastest available."""
+    name = (name or os.environ.get('MCP_JSON_CODEC', '')).strip().lower()
+    if name == 'json' or ORJSON is None:
+        return STDLIB
+    return ORJSON
+
+
+codec = select_codec()
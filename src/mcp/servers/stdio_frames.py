@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Newline-delimited JSON-RPC frames on stdin/stdout.
+Shared by the threaded and asyncio stdio servers.
+"""
+import asyncio
+import json
+import os
+import stat
+import sys
+import threading
+from typing import Callable, Dict, Any, Optional, Tuple
+from . import stdio_codec
+
+# Serialises writes so concurrent workers never interleave stdout frames.
+_WRITE_LOCK = threading.Lock()
+
+
+def create_error_response(error_code: int, message: str, request_id: str = "") -> Dict[str, Any]:
+    """Create a standardized error response."""
+    return {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": error_code,
+            "message": message
+        },
+        "id": request_id
+    }
+
+
+def decode_request(line: bytes, on_cancel: Callable[[Optional[Dict[str, Any]]], None]
+                   ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """``(request, error_response)`` for a stdin line; ``notifications/cancelled`` params go to *on_cancel*."""
+    line = line.strip()
+    if not line:
+        return None, None
+    try:
+        request = stdio_codec.codec.loads(line)
+        if not isinstance(request, dict):
+            raise TypeError(f"expected a JSON object, got {type(request).__name__}")
+        if request.get("method") == "notifications/cancelled":
+            on_cancel(request.get("params"))
+            return None, None
+        return (None if request.get("id") is None else request), None
+    except json.JSONDecodeError:
+        return None, create_error_response(-32700, "Parse error")
+    except Exception as e:
+        return None, create_error_response(-32603, f"Internal error: {str(e)}")
+
+
+def encode_response(response: Dict[str, Any]) -> bytes:
+    """Serialise a JSON-RPC response to UTF-8. Always include 'id' (string/number, never null)."""
+    if "id" not in response or response["id"] is None:
+        response["id"] = ""
+    try:
+        return stdio_codec.codec.dumps(response)
+    except Exception as e:
+        return stdio_codec.codec.dumps(create_error_response(-32603, f"Internal error: {str(e)}"))
+
+
+def write_frame(data: bytes) -> None:
+    """Write one newline-terminated frame to stdout as bytes."""
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    with _WRITE_LOCK:
+        if buffer is None:
+            out.write(data.decode("utf-8") + "\n")
+            out.flush()
+            return
+        # Text already queued by print() must not end up after this frame
+        out.flush()
+        buffer.write(data + b"\n")
+        buffer.flush()
+
+
+def send_response(response: Dict[str, Any]) -> None:
+    """Send JSON-RPC response to stdout. Always include 'id' (string/number, never null)."""
+    write_frame(encode_response(response))
+
+
+def streams_are_pipes() -> bool:
+    """Whether stdin and stdout are pipes, sockets or ttys (what an event loop can attach to)."""
+    for stream in (sys.stdin, sys.stdout):
+        try:
+            fd = stream.fileno()
+            mode = os.fstat(fd).st_mode
+        except (AttributeError, ValueError, OSError):
+            return False
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or os.isatty(fd)):
+            return False
+    return True
+
+
+async def open_stdio_streams(limit: int) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Attach an asyncio reader to stdin and a writer to stdout."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=limit)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
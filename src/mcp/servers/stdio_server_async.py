@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Asyncio MCP Stdio Server.
+Reads requests through asyncio streams and runs each one as a task, so slow
+calls overlap and can be aborted with ``notifications/cancelled``.
+"""
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from . import stdio_frames
+from .stdio_frames import create_error_response, decode_request, encode_response
+from .stdio_server_core import MCPStdioServer
+from .stdio_server_io import cancel_request
+
+# Longest request line accepted from stdin
+LINE_LIMIT = 16 * 1024 * 1024
+
+
+class AsyncMCPStdioServer(MCPStdioServer):
+    """MCP stdio server driven by an asyncio event loop.
+
+    The Calendar client and ICS downloads block, so ``tools/call`` runs on a
+    worker pool; other methods are answered on the loop. Cancelling a pending
+    request cancels its task and, as the protocol requires, sends no response.
+    """
+
+    default_workers = 8
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__(max_workers)
+        self._tasks: Dict[Any, asyncio.Task] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+
+    async def handle(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Handle one request; blocking tool calls are awaited on the worker pool."""
+        if request.get("method") != "tools/call":
+            return self.handler.handle_request(request)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.handler.handle_request, request)
+
+    async def _write(self, writer, response: Dict[str, Any]) -> None:
+        # One drain waiter at a time: Python < 3.10 asserts on concurrent drains
+        data = encode_response(response) + b"\n"
+        async with self._write_lock:
+            writer.write(data)
+            await writer.drain()
+
+    async def _run_request(self, request: Dict[str, Any], writer) -> None:
+        request_id = request["id"]
+        try:
+            response = await self.handle(request)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            response = create_error_response(-32603, f"Internal error: {str(e)}", request_id)
+        finally:
+            self._tasks.pop(request_id, None)
+        if response:
+            await self._write(writer, response)
+
+    def _cancel(self, params: Optional[Dict[str, Any]]) -> None:
+        # Stop waiting for the call and tell the worker thread to give up too
+        task = self._tasks.pop((params or {}).get("requestId"), None)
+        if task is not None:
+            task.cancel()
+        cancel_request(self, params)
+
+    async def serve(self, reader: asyncio.StreamReader, writer) -> None:
+        """Process requests from *reader* until EOF, then wait for pending ones."""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mcp-async")
+        # Created here so it binds to the running loop on Python 3.8/3.9
+        self._write_lock = asyncio.Lock()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request, error_response = decode_request(line, self._cancel)
+                if error_response:
+                    await self._write(writer, error_response)
+                elif request is not None:
+                    self._tasks[request["id"]] = asyncio.create_task(self._run_request(request, writer))
+            if self._tasks:
+                await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        finally:
+            self._executor.shutdown(wait=False)
+            self.running = False
+
+    async def _serve_stdio(self) -> None:
+        await self.serve(*await stdio_frames.open_stdio_streams(LINE_LIMIT))
+
+    def _read_stdin(self):
+        """Serve stdin/stdout on an event loop (threaded loop if they are not pipes)."""
+        if not stdio_frames.streams_are_pipes():
+            print("Async stdio needs pipes on stdin and stdout; using the threaded loop", file=sys.stderr)
+            super()._read_stdin()
+            return
+        asyncio.run(self._serve_stdio())
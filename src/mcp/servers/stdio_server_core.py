@@ -3,7 +3,8 @@
 Core MCP Stdio Server class.
 Contains the main server logic and capabilities setup.
 """
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Optional
 from ..mcp_schema import get_mcp_schema
 from ..handlers.stdio_handler import StdioRequestHandler
 
@@ -11,11 +12,23 @@ from ..handlers.stdio_handler import StdioRequestHandler
 class MCPStdioServer:
     """MCP Server that communicates via stdin/stdout using JSON-RPC protocol."""
     
-    def __init__(self):
+    # Requests handled concurrently when MCP_STDIO_WORKERS is not set (1 = sequential)
+    default_workers = 1
+    
+    def __init__(self, max_workers: Optional[int] = None):
         self.running = False
+        self.max_workers = max_workers or self._workers_from_env()
         self._setup_capabilities()
         self.handler = StdioRequestHandler(self.capabilities)
     
+    @classmethod
+    def _workers_from_env(cls) -> int:
+        """Worker count for concurrent dispatch (MCP_STDIO_WORKERS, default ``default_workers``)."""
+        try:
+            return max(1, int(os.environ.get('MCP_STDIO_WORKERS', cls.default_workers)))
+        except ValueError:
+            return cls.default_workers
+    
     def _setup_capabilities(self):
         """Setup server capabilities from schema."""
         schema = get_mcp_schema()
@@ -27,7 +40,7 @@ class MCPStdioServer:
     
     def _send_response(self, response):
         """Send JSON-RPC response to stdout. Always include 'id' (string/number, never null)."""
-        from .stdio_server_io import send_response
+        from .stdio_frames import send_response
         send_response(response)
     
     def _read_stdin(self):
@@ -35,6 +48,12 @@ class MCPStdioServer:
         from .stdio_server_io import read_stdin_loop
         read_stdin_loop(self)
     
+    def _prewarm(self):
+        """Build the Calendar client in the background so the first call is fast."""
+        import threading
+        from src.core import auth
+        threading.Thread(target=auth.prewarm_calendar_service, daemon=True).start()
+    
     def start(self):
         """Start the stdio server."""
         if self.running:
@@ -42,10 +61,13 @@ class MCPStdioServer:
         
         self.running = True
         
+        if os.environ.get('MCP_PREWARM_SERVICE') == '1':
+            self._prewarm()
+        
         try:
             self._read_stdin()
         except Exception as e:
-            from .stdio_server_io import create_error_response, send_response
+            from .stdio_frames import create_error_response, send_response
             error_response = create_error_response(-32603, f"Server error: {str(e)}")
             send_response(error_response)
     
@@ -3,66 +3,66 @@
 MCP Stdio Server I/O operations.
 Handles reading from stdin and writing responses to stdout.
 """
-import json
 import sys
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+from .stdio_frames import create_error_response, decode_request, send_response
 
 
-def send_response(response: Dict[str, Any]) -> None:
-    """Send JSON-RPC response to stdout. Always include 'id' (string/number, never null)."""
-    if "id" not in response or response["id"] is None:
-        response["id"] = ""
-    try:
-        response_json = json.dumps(response)
-        print(response_json, flush=True)
-    except Exception as e:
-        fallback_error = {
-            "jsonrpc": "2.0",
-            "error": {
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            },
-            "id": ""
-        }
-        print(json.dumps(fallback_error), flush=True)
+def cancel_request(server, params: Optional[Dict[str, Any]]) -> None:
+    """Forward ``notifications/cancelled`` to the handler running the request."""
+    cancel = getattr(server.handler, "cancel", None)
+    if cancel is not None:
+        cancel((params or {}).get("requestId"))
 
 
-def create_error_response(error_code: int, message: str, request_id: str = "") -> Dict[str, Any]:
-    """Create a standardized error response."""
-    return {
-        "jsonrpc": "2.0",
-        "error": {
-            "code": error_code,
-            "message": message
-        },
-        "id": request_id
-    }
+def register_request(server, request: Dict[str, Any]) -> None:
+    """Let the handler track a request queued for a worker, so it can be cancelled before it starts."""
+    register = getattr(server.handler, "register", None)
+    if register is not None:
+        register(request)
 
 
-def read_stdin_loop(server) -> None:
-    """Read and process JSON-RPC requests from stdin."""
+def dispatch_request(server, request: Dict[str, Any]) -> None:
+    """Handle a single request and write its response, keyed by the request id."""
     try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
+        response = server.handler.handle_request(request)
+        if response:
+            send_response(response)
+    except Exception as e:
+        error_response = create_error_response(-32603, f"Internal error: {str(e)}", request.get("id", ""))
+        send_response(error_response)
 
-            try:
-                request = json.loads(line)
-                if "id" not in request or request["id"] is None:
-                    continue
-                response = server.handler.handle_request(request)
-                if response:
-                    send_response(response)
 
-            except json.JSONDecodeError:
-                error_response = create_error_response(-32700, "Parse error")
-                send_response(error_response)
-            except Exception as e:
-                error_response = create_error_response(-32603, f"Internal error: {str(e)}")
+def read_stdin_loop(server) -> None:
+    """Read and process JSON-RPC requests from stdin.
+
+    With ``server.max_workers`` greater than one, requests are dispatched to a
+    thread pool and responses are written as they complete (possibly out of
+    order); clients match them by ``id``.
+    """
+    workers = getattr(server, "max_workers", 1) or 1
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-stdio") if workers > 1 else None
+    # Raw bytes go straight to the codec, skipping the text decoder
+    source = getattr(sys.stdin, "buffer", sys.stdin)
+    try:
+        for line in source:
+            request, error_response = decode_request(line, lambda params: cancel_request(server, params))
+            if error_response:
                 send_response(error_response)
+                continue
+            if request is None:
+                continue
+
+            if executor:
+                register_request(server, request)
+                executor.submit(dispatch_request, server, request)
+            else:
+                dispatch_request(server, request)
 
     except KeyboardInterrupt:
         pass
     finally:
-        server.running = False 
\ No newline at end of file
+        if executor:
+            executor.shutdown(wait=True)
+        server.running = False
@@ -3,12 +3,17 @@
 MCP Stdio Server runner and entry point.
 Contains the main execution function and CLI entry point.
 """
+import os
 from .stdio_server_core import MCPStdioServer
 
 
 def run_stdio_server():
-    """Run the MCP server in stdio mode."""
-    server = MCPStdioServer()
+    """Run the MCP server in stdio mode (asyncio variant with MCP_STDIO_ASYNC=1)."""
+    if os.environ.get('MCP_STDIO_ASYNC') == '1':
+        from .stdio_server_async import AsyncMCPStdioServer
+        server = AsyncMCPStdioServer()
+    else:
+        server = MCPStdioServer()
     try:
         server.start()
     except KeyboardInterrupt:
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any
+from src.core import auth as auth
+from src.core.agenda import availability
+from src.core.calendar import query_busy
+from src.core.interval_index import to_timestamp
+from .tool_sources import _calendar_ids, _ics_feeds, _status_warnings
+
+__all__ = ["handle"]
+
+_ERR = lambda code, msg: {"error": {"code": code, "message": msg}}
+
+# Range searched by find_free_slots when timeMax is omitted
+DEFAULT_RANGE = timedelta(days=7)
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def _busy(args, start, end):
+    """Busy intervals per source (``google:<id>``, ``ics:<alias>``) within ``[start, end)``, plus status."""
+    svc = auth.get_calendar_service()
+    ids = _calendar_ids(svc, args) or [args.get("calendar_id", "primary")]
+    found = query_busy(svc, ids, _iso(start), _iso(end))
+    sources = {f"google:{cid}": intervals for cid, intervals in found.busy.items()}
+    status = {"calendar_status": {cid: f"error: {found.errors[cid]}" if cid in found.errors else "ok" for cid in ids}}
+    feeds = _ics_feeds(args)
+    if feeds:
+        from src.core.ics.fanout import list_feeds
+        results = list_feeds(feeds, None, time_min=_iso(start), time_max=_iso(end))
+        for feed in results:
+            sources[f"ics:{feed.alias}"] = availability.ics_busy(feed.records)
+        status["ics_status"] = {feed.alias: feed.status for feed in results}
+    return sources, status
+
+
+def _bounds(args, start_key, end_key, default_start=None):
+    start = to_timestamp(args[start_key]) if args.get(start_key) else default_start
+    if start is None:
+        raise ValueError(f"Missing required parameter: {start_key}")
+    if args.get(end_key):
+        end = to_timestamp(args[end_key])
+    elif default_start is not None:
+        end = start + DEFAULT_RANGE.total_seconds()
+    else:
+        raise ValueError(f"Missing required parameter: {end_key}")
+    if end <= start:
+        raise ValueError(f"{end_key} must be after {start_key}")
+    return start, end
+
+
+def _find_free_slots(args):
+    try:
+        start, end = _bounds(args, "timeMin", "timeMax", default_start=datetime.now(timezone.utc).timestamp())
+        minutes = float(args.get("duration_minutes", 30))
+        limit = int(args.get("max_results", 10))
+        if limit < 1:
+            raise ValueError("max_results must be at least 1")
+        sources, status = _busy(args, start, end)
+    except (TypeError, ValueError) as e:
+        return _ERR(-32602, str(e))
+    busy = [interval for intervals in sources.values() for interval in intervals]
+    slots = availability.free_slots(busy, start, end, minutes * 60, limit)
+    if slots:
+        txt = f"🟢 {len(slots)} horários livres de pelo menos {minutes:g} min:"
+        txt += "".join(f"\n• {_iso(s)} → {_iso(e)} ({(e - s) / 60:g} min)" for s, e in slots)
+    else:
+        txt = f"❌ Nenhum horário livre de {minutes:g} min entre {_iso(start)} e {_iso(end)}"
+    content = [{"type": "text", "text": txt}] + _status_warnings(**status)
+    return {"result": dict(status, content=content)}
+
+
+def _check_conflicts(args):
+    try:
+        start, end = _bounds(args, "start_time", "end_time")
+        sources, status = _busy(args, start, end)
+    except ValueError as e:
+        return _ERR(-32602, str(e))
+    busy = [availability.Conflict(s, e, source) for source, intervals in sources.items() for s, e in intervals]
+    found = availability.conflicts(busy, start, end)
+    if found:
+        txt = f"⚠️ {len(found)} conflito(s) entre {_iso(start)} e {_iso(end)}:"
+        txt += "".join(f"\n• {_iso(c.start)} → {_iso(c.end)} ({c.source})" for c in found)
+    else:
+        txt = f"✅ Livre entre {_iso(start)} e {_iso(end)}"
+    content = [{"type": "text", "text": txt}] + _status_warnings(**status)
+    return {"result": dict(status, available=not found, content=content)}
+
+
+_mapping = {
+    "find_free_slots": _find_free_slots,
+    "check_conflicts": _check_conflicts,
+}
+
+
+def handle(tool: str, args: Dict[str, Any]):
+    func = _mapping.get(tool)
+    return func(args) if func else None
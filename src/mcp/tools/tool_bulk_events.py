@@ -0,0 +1,83 @@
+from src.core import auth as auth
+from src.core import sync
+from src.core.calendar import add_events, remove_events, edit_events
+
+
+def _has_event_fields(args):
+    return all(args.get(k) for k in ("summary", "start_time", "end_time"))
+
+
+def _event_body(args):
+    body = {
+        "summary": args["summary"],
+        "start": {"dateTime": args["start_time"]},
+        "end": {"dateTime": args["end_time"]}
+    }
+    for k in ("location", "description"):
+        if args.get(k):
+            body[k] = args[k]
+    return body
+
+
+def _add_events(args):
+    events = args.get("events", [])
+    if not events:
+        return {"error": {"code": -32602, "message": "Missing required parameter: events"}}
+    
+    valid = [i for i, ev in enumerate(events) if _has_event_fields(ev)]
+    results = [{"status": "error", "message": "Missing required event parameters"}] * len(events)
+    if valid:
+        svc = auth.get_calendar_service()
+        for i, res in zip(valid, add_events(svc, [_event_body(events[i]) for i in valid])):
+            results[i] = res
+        sync.mark_stale()
+    
+    lines = []
+    for ev, res in zip(events, results):
+        label = ev.get("summary") or "Evento"
+        if res.get("status") == "confirmed":
+            lines.append(f"✅ {label} (🆔 {res['event'].get('id', 'N/A')})")
+        else:
+            lines.append(f"❌ {label}: {res.get('message', 'Erro desconhecido')}")
+    success_count = sum(1 for res in results if res.get("status") == "confirmed")
+    return _bulk_result("criados", success_count, len(results), lines)
+
+
+def _bulk_result(verb, success_count, total, lines):
+    txt = f"{success_count} eventos {verb} com sucesso, {total - success_count} falharam"
+    txt += "".join(f"\n{line}" for line in lines)
+    return {"result": {"content": [{"type": "text", "text": txt}]}}
+
+
+def _remove_events(args):
+    event_ids = args.get("event_ids") or []
+    if not event_ids:
+        return {"error": {"code": -32602, "message": "Missing required parameter: event_ids"}}
+    svc = auth.get_calendar_service()
+    results = remove_events(svc, event_ids)
+    sync.mark_stale()
+    lines = [
+        f"✅ {res['event_id']}" if res["status"] == "deleted"
+        else f"❌ {res['event_id']}: {res.get('message', 'Erro desconhecido')}"
+        for res in results
+    ]
+    success_count = sum(1 for res in results if res["status"] == "deleted")
+    return _bulk_result("removidos", success_count, len(results), lines)
+
+
+def _edit_events(args):
+    edits = args.get("edits") or []
+    if not edits:
+        return {"error": {"code": -32602, "message": "Missing required parameter: edits"}}
+    if not all(e.get("event_id") and e.get("updated_details") for e in edits):
+        return {"error": {"code": -32602, "message": "Each edit requires event_id and updated_details"}}
+    svc = auth.get_calendar_service()
+    results = edit_events(svc, edits)
+    sync.mark_stale()
+    lines = [
+        f"✅ {e['event_id']}" if res["status"] == "confirmed"
+        else f"❌ {e['event_id']}: {res.get('message', 'Erro desconhecido')}"
+        for e, res in zip(edits, results)
+    ]
+    success_count = sum(1 for res in results if res["status"] == "confirmed")
+    return _bulk_result("editados", success_count, len(results), lines)
@@ -10,14 +10,22 @@ def _register(args):
     alias, url = args.get("alias"), args.get("ics_url")
     if not alias or not url:
         return _ERR(-32602, "alias and ics_url are required")
-    reg_mod = import_module("src.core.ics_registry")
-    reg_mod.register(alias, url)
+    ttl = args.get("ttl")
+    if ttl is not None and (not isinstance(ttl, (int, float)) or ttl < 0):
+        return _ERR(-32602, "ttl must be a non-negative number of seconds")
+    reg_mod = import_module("src.core.ics.registry")
+    extra = {"ttl": ttl} if ttl is not None else {}
+    if args.get("ordered"):
+        extra["ordered"] = True
+    reg_mod.register(alias, url, **extra)
     txt = f"✅ Calendário ICS registrado com sucesso!\n🔖 Alias: {alias}"
+    if ttl is not None:
+        txt += f"\n⏱️ Cache: {ttl}s"
     return {"result": {"registered": True, "content": [{"type": "text", "text": txt}]}}
 
 
 def _list(_: Dict[str, Any]):
-    return {"result": {"calendars": import_module("src.core.ics_registry").list_all()}}
+    return {"result": {"calendars": import_module("src.core.ics.registry").list_all()}}
 
 _mapping = {
     "register_ics_calendar": _register,
@@ -0,0 +1,80 @@
+from src.core import auth as auth
+from src.core import sync
+from src.core.calendar import fetch_calendars, fetch_events, list_events
+from .tool_sources import _calendar_ids, _ics_feeds, _status_warnings
+
+
+def _time_window(args):
+    """``time_min``/``time_max`` kwargs from the tool's ``timeMin``/``timeMax`` arguments."""
+    from src.core.interval_index import to_timestamp
+    window = {}
+    for arg, kwarg in (("timeMin", "time_min"), ("timeMax", "time_max")):
+        if args.get(arg):
+            to_timestamp(args[arg])
+            window[kwarg] = args[arg]
+    return window
+
+
+def _list_events(args):
+    mr = args.get("max_results", 10)
+    try:
+        window = _time_window(args)
+    except ValueError as e:
+        return {"error": {"code": -32602, "message": str(e)}}
+    ics_url = args.get("ics_url")
+    if not ics_url and args.get("ics_alias"):
+        from src.core.ics.registry import get as _get_ics
+        ics_url = _get_ics(args["ics_alias"])
+    if ics_url:
+        from src.core.ics.ops import ICSOperations
+        content = ICSOperations().list_events(ics_url, mr, **window)
+    else:
+        svc = auth.get_calendar_service()
+        cid = args.get("calendar_id", "primary")
+        extra = {k: args[k] for k in ("cursor", "fields") if args.get(k)}
+        store = None if extra else sync.get_store()
+        feeds = _ics_feeds(args)
+        try:
+            calendar_ids = _calendar_ids(svc, args)
+            if feeds or calendar_ids:
+                return {"result": _merged(svc, store, feeds, mr, cid, calendar_ids, args.get("fields") or [], window)}
+            if store:
+                content = sync.list_cached_events(svc, store, mr, cid, **window)
+            else:
+                content = list_events(svc, mr, cid, **extra, **window)
+        except ValueError as e:
+            return {"error": {"code": -32602, "message": str(e)}}
+    return {"result": {"content": content}}
+
+
+def _google_streams(svc, store, mr, cid, calendar_ids, fields, window):
+    """Start-ordered Google sources of a merged listing, plus per-calendar status when fanning out."""
+    from src.core import agenda
+    if not calendar_ids:
+        if store:
+            google = sync.cached_events(svc, store, mr, cid, **window)
+        else:
+            google = fetch_events(svc, mr, cid, fields=["iCalUID", *fields], **window)
+        return [agenda.google_entries(google, fields)], None
+    results = fetch_calendars(svc, calendar_ids, mr, fields=["iCalUID", *fields], **window)
+    streams = [agenda.google_entries(r.events, fields, source=f"google:{r.calendar_id}") for r in results]
+    return streams, {r.calendar_id: "ok" if r.error is None else f"error: {r.error}" for r in results}
+
+
+def _merged(svc, store, feeds, mr, cid, calendar_ids, fields, window):
+    """Google calendars and every ICS feed (fetched concurrently) as one list ordered by start.
+
+    *mr* applies to the merged list; failed sources are reported, not fatal.
+    """
+    from src.core import agenda
+    from src.core.ics.fanout import list_feeds
+    streams, calendar_status = _google_streams(svc, store, mr, cid, calendar_ids, fields, window)
+    results = list_feeds(feeds, mr, **window)
+    streams.extend(agenda.ics_entries(feed.records, feed.alias) for feed in results)
+    status = {}
+    if calendar_status is not None:
+        status["calendar_status"] = calendar_status
+    if feeds:
+        status["ics_status"] = {feed.alias: feed.status for feed in results}
+    content = [entry.content for entry in agenda.merge(streams, mr)] + _status_warnings(**status)
+    return dict(status, content=content)
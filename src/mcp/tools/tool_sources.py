@@ -0,0 +1,33 @@
+from src.core.calendar import list_calendars
+
+
+def _ics_feeds(args):
+    """Registered ICS feeds to merge in with ``with_ics`` (none for cursor pages or if the registry fails)."""
+    if not args.get("with_ics") or args.get("cursor"):
+        return {}
+    try:
+        from src.core.ics.registry import list_all as _ics_list
+        return _ics_list()
+    except Exception:
+        return {}
+
+
+def _calendar_ids(svc, args):
+    """Calendars to fan out over: ``calendar_ids``, or every selected calendar with ``all_calendars``."""
+    if args.get("cursor"):
+        return []
+    ids = args.get("calendar_ids")
+    if ids:
+        if not isinstance(ids, list) or not all(isinstance(i, str) and i for i in ids):
+            raise ValueError("calendar_ids must be a list of calendar IDs")
+        return list(dict.fromkeys(ids))
+    if args.get("all_calendars"):
+        return [c["id"] for c in list_calendars(svc)]
+    return []
+
+
+def _status_warnings(calendar_status=None, ics_status=None):
+    """A warning item per calendar or ICS feed that could not be read."""
+    warnings = [f"⚠️ Calendário '{cid}' indisponível: {st}" for cid, st in (calendar_status or {}).items() if st != "ok"]
+    warnings += [f"⚠️ Calendário ICS '{alias}' indisponível: {st}" for alias, st in (ics_status or {}).items() if st != "ok"]
+    return [{"type": "text", "text": text} for text in warnings]
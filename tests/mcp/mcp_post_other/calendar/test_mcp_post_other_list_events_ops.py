@@ -1,6 +1,7 @@
 import json
 import pytest
 from src.mcp import mcp_post_other_handler as mod
+from src.mcp.tools import tool_list_events
 from unittest.mock import Mock
 
 class DummyHandler:
@@ -35,7 +36,8 @@ def test_list_events(monkeypatch):
         return ['e1', 'e2']
 
     monkeypatch.setattr(mod.auth, 'get_calendar_service', lambda: 'svc')
-    monkeypatch.setattr(mod, 'list_events', fake_list_events)
+    monkeypatch.setattr(tool_list_events.sync, 'get_store', lambda: None)
+    monkeypatch.setattr(tool_list_events, 'list_events', fake_list_events)
     request = {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"tool": "list_events", "args": {"max_results": 5, "calendar_id": "globalsys"}}}
     response = {"jsonrpc": "2.0", "id": 3}
     mod.handle_post_other(handler, request, response)
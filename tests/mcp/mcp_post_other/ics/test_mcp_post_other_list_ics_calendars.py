@@ -20,7 +20,7 @@ def test_list_ics_calendars_other(monkeypatch, mock_credentials):
         @staticmethod
         def list_all():
             return {'a':'u'}
-    monkeypatch.setitem(sys.modules,'src.core.ics_registry', FakeReg)
+    monkeypatch.setitem(sys.modules,'src.core.ics.registry', FakeReg)
     h=H()
     req={"jsonrpc":"2.0","id":7,"method":"tools/call","params":{"tool":"list_ics_calendars","args":{}}}
     mod.handle_post_other(h, req, {"jsonrpc":"2.0","id":7})
@@ -41,9 +41,9 @@ def test_list_ics_events(monkeypatch):
             return sample_events
 
     monkeypatch.setattr(mod.auth, 'get_calendar_service', lambda: 'svc')
-    # The handler now imports ICSOperations via importlib from src.core.ics_ops
-    # So we need to patch 'src.core.ics_ops.ICSOperations'
-    with patch('src.core.ics_ops.ICSOperations', return_value=FakeICSOps()) as mock_ics_ops:
+    # The handler now imports ICSOperations via importlib from src.core.ics.ops
+    # So we need to patch 'src.core.ics.ops.ICSOperations'
+    with patch('src.core.ics.ops.ICSOperations', return_value=FakeICSOps()) as mock_ics_ops:
         request = {"jsonrpc": "2.0", "id": 10, "method": "tools/call", "params": {"tool": "list_events", "args": {"ics_url": "http://example.com/calendar.ics", "max_results": 5}}}
         response = {"jsonrpc": "2.0", "id": 10}
         mod.handle_post_other(handler, request, response)
@@ -34,7 +34,7 @@ def test_register_and_use_alias(monkeypatch, mock_credentials):
         @staticmethod
         def list_all():
             return store.copy()
-    monkeypatch.setitem(sys.modules,'src.core.ics_registry', FakeReg)
+    monkeypatch.setitem(sys.modules,'src.core.ics.registry', FakeReg)
     # register tool
     req = {"jsonrpc":"2.0","id":1,"method":"tools/call","params":{"tool":"register_ics_calendar","args":{"alias":"work","ics_url":"http://ex.com/a.ics"}}}
     resp = {"jsonrpc":"2.0","id":1}
@@ -48,7 +48,7 @@ def test_register_and_use_alias(monkeypatch, mock_credentials):
         def list_events(self, url, max_results):
             assert url=="http://ex.com/a.ics"
             return ['ok']
-    with patch('src.core.ics_ops.ICSOperations', return_value=FakeICSOps()):
+    with patch('src.core.ics.ops.ICSOperations', return_value=FakeICSOps()):
         req2 = {"jsonrpc":"2.0","id":2,"method":"tools/call","params":{"tool":"list_events","args":{"ics_alias":"work","max_results":5}}}
         resp2 = {"jsonrpc":"2.0","id":2}
         mod.handle_post_other(handler2, req2, resp2)
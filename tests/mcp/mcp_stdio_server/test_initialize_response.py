@@ -1,3 +1,4 @@
+import io
 import json
 import pytest
 from unittest.mock import patch
@@ -11,17 +12,15 @@ class TestInitializeResponse:
         server = MCPStdioServer()
         initialize_request = create_initialize_request()
         mock_stdin = MockStdin([json.dumps(initialize_request)])
-        responses = []
-        
-        def capture_print(*args, **kwargs):
-            if args:
-                responses.append(args[0])
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
         
         with patch('sys.stdin', mock_stdin), \
-             patch('builtins.print', side_effect=capture_print):
+             patch('sys.stdout', stdout):
             
             run_server_with_timeout(server)
         
+        stdout.flush()
+        responses = stdout.buffer.getvalue().decode("utf-8").splitlines()
         assert len(responses) >= 1
         
         initialize_response = find_response_by_id(responses, 1)
@@ -1,25 +1,30 @@
-from src.mcp import tool_calendar as tc
+from src.mcp.tools import tool_list_events as tle
+from src.core.ics.parser import ICSEvent, Property
+from datetime import datetime, timezone
 import importlib
 
 
 def test_list_events_merges_ics(monkeypatch):
     # Stub calendar service
-    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: "svc")
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: "svc")
 
-    # Mock the calendar.list_events function to return ["g1"]
-    monkeypatch.setattr("src.mcp.tools.tool_calendar.list_events", lambda svc, mr, cid: ["g1"])
+    # Mock the raw Google listing with a single event
+    google = [{"id": "g1", "summary": "g1", "start": {"dateTime": "2099-05-02T10:00:00Z"}}]
+    monkeypatch.setattr("src.mcp.tools.tool_list_events.fetch_events", lambda svc, mr, cid, fields=(): google)
 
     # Stub ICS registry
-    registry = importlib.import_module("src.core.ics_registry")
+    registry = importlib.import_module("src.core.ics.registry")
     monkeypatch.setattr(registry, "list_all", lambda: {"work": "http://example.com/work.ics"})
 
-    # Stub ICS operations
-    ics_mod = importlib.import_module("src.core.ics_ops")
+    # Stub ICS operations: one event before the Google one
+    ics_mod = importlib.import_module("src.core.ics.ops")
+    start = datetime(2099, 5, 1, 9, tzinfo=timezone.utc)
     class FakeICS:
-        def list_events(self, url, max_results):
+        def list_records(self, url, max_results):
             assert url == "http://example.com/work.ics"
-            return ["i1"]
+            return [ICSEvent({"SUMMARY": [Property("SUMMARY", "i1")]}, start=start, end=start,
+                             sort_ts=start.timestamp())]
     monkeypatch.setattr(ics_mod, "ICSOperations", lambda: FakeICS())
 
-    res = tc._list_events({"with_ics": True})
-    assert res["result"]["content"] == ["g1", "i1"] 
\ No newline at end of file
+    res = tle._list_events({"with_ics": True})
+    assert [c["text"].split("\n")[0] for c in res["result"]["content"]] == ["i1", "g1"]
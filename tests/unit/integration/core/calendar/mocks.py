@@ -0,0 +1,54 @@
+class FakeRequest:
+    """Stand-in for googleapiclient HttpRequest objects."""
+    def __init__(self, method, kwargs, handler):
+        self.method = method
+        self.kwargs = kwargs
+        self.headers = {}
+        self._handler = handler
+
+    def execute(self):
+        return self._handler(self.method, self.kwargs)
+
+
+class FakeBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.items = []
+
+    def add(self, request, request_id):
+        self.items.append((request_id, request))
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.items))
+        for request_id, request in self.items:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+class FakeBatchService:
+    """Minimal Calendar service supporting events() calls and batching.
+
+    *handler* receives ``(method, kwargs)`` and returns the API response or
+    raises to simulate a per-item failure.
+    """
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+        self.requests = []
+        self.batch_sizes = []
+
+    def events(self):
+        return self
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+    def __getattr__(self, method):
+        def _build(**kwargs):
+            self.calls.append((method, kwargs))
+            self.requests.append(FakeRequest(method, kwargs, self.handler))
+            return self.requests[-1]
+        return _build
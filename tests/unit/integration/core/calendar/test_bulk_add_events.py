@@ -0,0 +1,47 @@
+from src.core.calendar import add_events
+from src.core.calendar.bulk import BATCH_LIMIT, execute_batch
+from .mocks import FakeBatchService
+
+
+def _insert_handler(method, kwargs):
+    if kwargs["body"]["summary"] == "bad":
+        raise ValueError("invalid event")
+    return {"id": f"id-{kwargs['body']['summary']}", **kwargs["body"]}
+
+
+def test_add_events_reports_each_item():
+    svc = FakeBatchService(_insert_handler)
+    events = [
+        {"summary": "a", "start": {"dateTime": "2025-01-01T10:00:00"}, "end": {"dateTime": "2025-01-01T11:00:00"}},
+        {"summary": "bad", "start": {"dateTime": "2025-01-01T10:00:00"}, "end": {"dateTime": "2025-01-01T11:00:00"}},
+    ]
+    results = add_events(svc, events)
+    assert results[0]["status"] == "confirmed"
+    assert results[0]["event"]["id"] == "id-a"
+    assert results[0]["event"]["start"]["dateTime"] == "2025-01-01T10:00:00-03:00"
+    assert results[1] == {"status": "error", "message": "invalid event"}
+    # Caller data is not mutated by timezone normalisation
+    assert events[0]["start"] == {"dateTime": "2025-01-01T10:00:00"}
+
+
+def test_execute_batch_chunks_requests():
+    svc = FakeBatchService(lambda method, kwargs: {"n": kwargs["n"]})
+    requests = [svc.events().get(n=i) for i in range(BATCH_LIMIT * 2 + 5)]
+    results = execute_batch(svc, requests)
+    assert svc.batch_sizes == [BATCH_LIMIT, BATCH_LIMIT, 5]
+    assert [r[0]["n"] for r in results] == list(range(len(requests)))
+
+
+def test_execute_batch_transport_failure_marks_chunk():
+    svc = FakeBatchService(lambda method, kwargs: {})
+
+    class Broken:
+        def add(self, request, request_id):
+            pass
+
+        def execute(self):
+            raise ConnectionError("down")
+
+    svc.new_batch_http_request = lambda callback=None: Broken()
+    results = execute_batch(svc, [svc.events().get(), svc.events().get()])
+    assert all(isinstance(err, ConnectionError) for _, err in results)
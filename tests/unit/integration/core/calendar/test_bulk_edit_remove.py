@@ -0,0 +1,73 @@
+from src.core.calendar import edit_events, remove_events
+from src.core.calendar.utils import build_event_patch, is_self_contained_patch
+from .mocks import FakeBatchService
+
+
+def test_remove_events_reports_each_id():
+    def handler(method, kwargs):
+        if kwargs["eventId"] == "missing":
+            raise LookupError("not found")
+        return ""
+
+    svc = FakeBatchService(handler)
+    results = remove_events(svc, ["a", "missing"])
+    assert results == [
+        {"event_id": "a", "status": "deleted"},
+        {"event_id": "missing", "status": "error", "message": "not found"},
+    ]
+    assert svc.batch_sizes == [2]
+
+
+def test_edit_events_skips_get_for_self_contained_patches():
+    svc = FakeBatchService(lambda method, kwargs: {"id": kwargs["eventId"], **kwargs.get("body", {})})
+    results = edit_events(svc, [
+        {"event_id": "a", "updated_details": {"summary": "x"}},
+        {"event_id": "b", "updated_details": {"start": {"dateTime": "2025-01-01T10:00:00"}}},
+    ])
+    assert [m for m, _ in svc.calls] == ["patch", "patch"]
+    assert results[0] == {"status": "confirmed", "event": {"id": "a", "summary": "x"}}
+    assert results[1]["event"]["start"] == {"dateTime": "2025-01-01T10:00:00-03:00"}
+
+
+def test_edit_events_reads_current_event_for_partial_times():
+    def handler(method, kwargs):
+        if method == "get":
+            if kwargs["eventId"] == "gone":
+                raise LookupError("not found")
+            return {"start": {"dateTime": "2025-01-01T10:00:00-03:00"}}
+        return kwargs["body"]
+
+    svc = FakeBatchService(handler)
+    results = edit_events(svc, [
+        {"event_id": "a", "updated_details": {"start": {"timeZone": "UTC"}}},
+        {"event_id": "gone", "updated_details": {"end": {"timeZone": "UTC"}}},
+    ])
+    assert [m for m, _ in svc.calls] == ["get", "get", "patch"]
+    assert results[0]["event"]["start"] == {"dateTime": "2025-01-01T10:00:00-03:00", "timeZone": "UTC"}
+    assert results[1] == {"status": "error", "message": "not found"}
+
+
+def test_build_event_patch_helpers():
+    assert is_self_contained_patch({"summary": "x", "end": {"date": "2025-01-02"}})
+    assert not is_self_contained_patch({"start": {"timeZone": "UTC"}})
+    patch = build_event_patch({"start": {"dateTime": "2025-01-01T10:00:00"}}, {"start": {"date": "2025-01-01"}})
+    assert patch == {"start": {"dateTime": "2025-01-01T10:00:00-03:00", "timeZone": "America/Sao_Paulo"}}
+
+
+def test_edit_events_passes_etag():
+    svc = FakeBatchService(lambda method, kwargs: {})
+    edit_events(svc, [{"event_id": "a", "updated_details": {"summary": "x"}, "etag": "e1"}])
+    assert svc.requests[0].headers == {"If-Match": "e1"}
+
+
+def test_edit_events_fails_malformed_items_alone():
+    svc = FakeBatchService(lambda method, kwargs: {"id": kwargs["eventId"]})
+    results = edit_events(svc, [
+        {"event_id": "bad", "updated_details": {"start": {"dateTime": 10}}},
+        {"event_id": "a", "updated_details": {"summary": "x"}},
+        {"event_id": "odd", "updated_details": {"end": 5}},
+    ])
+    assert results[0]["status"] == "error" and results[0]["message"].startswith("Invalid edit:")
+    assert results[1] == {"status": "confirmed", "event": {"id": "a"}}
+    assert results[2]["status"] == "error"
+    assert [kwargs["eventId"] for _, kwargs in svc.calls] == ["a"]
@@ -111,10 +111,29 @@ def test_edit_event_with_timezone_missing(mock_service):
     assert result['summary'] == 'Updated Event'
 
 def test_edit_event_exception(mock_service):
-    mock_service.events().get.side_effect = Exception("API Error")
+    mock_service.events().patch.side_effect = Exception("API Error")
     result = edit_event(mock_service, "event_id", {'summary': 'Updated Event'})
     assert result is None
 
+def test_edit_event_get_exception(mock_service):
+    mock_service.events().get.side_effect = Exception("API Error")
+    result = edit_event(mock_service, "event_id", {'start': {'timeZone': 'UTC'}})
+    assert result is None
+
+def test_edit_event_patch_only_fast_path(mock_service):
+    mock_service.reset_mock()
+    mock_service.events().patch().execute.return_value = {'id': 'event_id'}
+    edit_event(mock_service, "event_id", {'summary': 'New', 'start': {'dateTime': '2025-01-01T10:00:00'}})
+    mock_service.events().get.assert_not_called()
+    body = mock_service.events().patch.call_args.kwargs['body']
+    assert body == {'summary': 'New', 'start': {'dateTime': '2025-01-01T10:00:00-03:00'}}
+
+def test_edit_event_with_etag_sends_if_match(mock_service):
+    request = mock_service.events().patch.return_value
+    request.headers = {}
+    edit_event(mock_service, "event_id", {'summary': 'New'}, etag='"abc"')
+    assert request.headers == {'If-Match': '"abc"'}
+
 def test_ensure_timezone():
     assert ensure_timezone("2025-01-01T10:00:00Z") == "2025-01-01T10:00:00Z"
     assert ensure_timezone("2025-01-01T10:00:00+01:00") == "2025-01-01T10:00:00+01:00"
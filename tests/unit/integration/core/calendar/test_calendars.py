@@ -0,0 +1,66 @@
+from src.core.calendar import fetch_calendars, list_calendars
+from .mocks import FakeBatchService
+
+
+class CalendarListService(FakeBatchService):
+    def __init__(self, handler, pages):
+        super().__init__(handler)
+        self.pages = pages
+
+    def calendarList(self):
+        service = self
+
+        class _List:
+            def list(self, **kwargs):
+                page = int(kwargs.get("pageToken", 0))
+                result = {"items": service.pages[page]}
+                if page + 1 < len(service.pages):
+                    result["nextPageToken"] = str(page + 1)
+                return type("Req", (), {"execute": lambda _self: result})()
+        return _List()
+
+
+def _events_handler(per_calendar, page=2):
+    def handler(method, kwargs):
+        cid = kwargs["calendarId"]
+        if cid == "broken":
+            raise RuntimeError("forbidden")
+        start = int(kwargs.get("pageToken", 0))
+        size = min(kwargs["maxResults"], page)
+        items = [{"id": f"{cid}-{i}"} for i in range(start, min(start + size, per_calendar))]
+        result = {"items": items}
+        if start + size < per_calendar:
+            result["nextPageToken"] = str(start + size)
+        return result
+    return handler
+
+
+def test_list_calendars_keeps_selected_across_pages():
+    svc = CalendarListService(None, [
+        [{"id": "me", "primary": True}, {"id": "hidden"}],
+        [{"id": "team", "selected": True}],
+    ])
+    assert [c["id"] for c in list_calendars(svc)] == ["me", "team"]
+    assert [c["id"] for c in list_calendars(svc, selected_only=False)] == ["me", "hidden", "team"]
+
+
+def test_fetch_calendars_batches_first_pages():
+    svc = FakeBatchService(_events_handler(per_calendar=2, page=5))
+    results = fetch_calendars(svc, ["a", "b", "c"], max_results=5)
+    assert svc.batch_sizes == [3]
+    assert [r.calendar_id for r in results] == ["a", "b", "c"]
+    assert [len(r.events) for r in results] == [2, 2, 2]
+
+
+def test_fetch_calendars_follows_pages_only_when_needed():
+    svc = FakeBatchService(_events_handler(per_calendar=10, page=2))
+    results = fetch_calendars(svc, ["a"], max_results=5)
+    assert [e["id"] for e in results[0].events] == [f"a-{i}" for i in range(5)]
+    assert [c[1].get("pageToken") for c in svc.calls] == [None, "2", "4"]
+
+
+def test_fetch_calendars_isolates_failures():
+    svc = FakeBatchService(_events_handler(per_calendar=1))
+    ok, broken = fetch_calendars(svc, ["a", "broken"], max_results=3)
+    assert ok.error is None and [e["id"] for e in ok.events] == ["a-0"]
+    assert broken.events == [] and str(broken.error) == "forbidden"
@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import MagicMock
+from src.core.calendar import add_event, edit_event, list_events
+from src.core.calendar.fields import MUTATION_FIELDS, TIME_FIELDS, field_key, list_fields
+from .mocks import FakeBatchService
+
+
+def test_list_fields_mask():
+    assert list_fields() == "nextPageToken,items(id,summary,start,end,location,description)"
+    assert list_fields(["attendees(email)", "summary"]).endswith("description,attendees(email))")
+    with pytest.raises(ValueError):
+        list_fields(["bad field"])
+    assert field_key("attendees(email)") == "attendees"
+
+
+def test_list_events_requests_mask_and_formats_extra_fields():
+    svc = FakeBatchService(lambda method, kwargs: {"items": [
+        {"id": "1", "summary": "Sync", "hangoutLink": "https://meet"},
+    ]})
+    events = list_events(svc, max_results=5, fields=["hangoutLink"])
+    assert svc.calls[0][1]["fields"] == list_fields(["hangoutLink"])
+    assert '🔹 hangoutLink: "https://meet"' in events[0]["text"]
+
+
+def test_mutations_request_minimal_responses():
+    svc = MagicMock()
+    add_event(svc, {"summary": "x"})
+    assert svc.events().insert.call_args.kwargs["fields"] == MUTATION_FIELDS
+    edit_event(svc, "id", {"start": {"timeZone": "UTC"}})
+    assert svc.events().get.call_args.kwargs["fields"] == TIME_FIELDS
+    assert svc.events().patch.call_args.kwargs["fields"] == MUTATION_FIELDS
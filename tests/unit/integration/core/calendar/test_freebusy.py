@@ -0,0 +1,36 @@
+from src.core.calendar import query_busy
+from src.core.calendar.freebusy import FREEBUSY_LIMIT
+
+
+class FreeBusyService:
+    def __init__(self):
+        self.bodies = []
+
+    def freebusy(self):
+        return self
+
+    def query(self, body):
+        self.bodies.append(body)
+        calendars = {}
+        for item in body["items"]:
+            if item["id"] == "missing":
+                calendars["missing"] = {"errors": [{"domain": "global", "reason": "notFound"}]}
+            else:
+                calendars[item["id"]] = {"busy": [{"start": "2099-01-01T10:00:00Z", "end": "2099-01-01T11:00:00Z"}]}
+        return type("Req", (), {"execute": lambda _self: {"calendars": calendars}})()
+
+
+def test_query_busy_parses_intervals_and_errors():
+    svc = FreeBusyService()
+    found = query_busy(svc, ["me", "missing"], "2099-01-01T00:00:00Z", "2099-01-02T00:00:00Z")
+    assert len(svc.bodies) == 1
+    assert found.busy["me"][0][1] - found.busy["me"][0][0] == 3600
+    assert found.errors == {"missing": "notFound"}
+
+
+def test_query_busy_chunks_large_calendar_lists():
+    svc = FreeBusyService()
+    ids = [f"c{i}" for i in range(FREEBUSY_LIMIT + 3)]
+    found = query_busy(svc, ids, "2099-01-01T00:00:00Z", "2099-01-02T00:00:00Z")
+    assert [len(b["items"]) for b in svc.bodies] == [FREEBUSY_LIMIT, 3]
+    assert len(found.busy) == len(ids)
@@ -0,0 +1,58 @@
+import pytest
+from src.core.calendar import fetch_events, list_events
+from src.core.calendar.list_events import decode_cursor, encode_cursor, iter_event_pages
+from .mocks import FakeBatchService
+
+
+def _paged_service(total, page=3):
+    def handler(method, kwargs):
+        start = int(kwargs.get("pageToken", 0))
+        size = min(kwargs["maxResults"], page)
+        items = [{"id": str(i), "summary": f"E{i}"} for i in range(start, min(start + size, total))]
+        result = {"items": items}
+        if start + size < total:
+            result["nextPageToken"] = str(start + size)
+        return result
+    return FakeBatchService(handler)
+
+
+def test_list_events_follows_next_page_token():
+    svc = _paged_service(total=7)
+    events = list_events(svc, max_results=None)
+    assert [e["text"].split("\n")[0] for e in events] == [f"E{i}" for i in range(7)]
+    assert len(svc.calls) == 3
+
+
+def test_list_events_stops_fetching_at_max_results_and_returns_cursor():
+    svc = _paged_service(total=10)
+    events = list_events(svc, max_results=4, calendar_id="team")
+    assert len(svc.calls) == 2
+    assert [c[1]["maxResults"] for c in svc.calls] == [4, 1]
+    assert "cursor: " in events[-1]["text"]
+    cursor = events[-1]["text"].split("cursor: ")[1]
+    query, token = decode_cursor(cursor)
+    assert query["calendarId"] == "team" and token == "4"
+
+    more = list_events(svc, max_results=10, cursor=cursor)
+    assert [e["text"].split("\n")[0] for e in more] == [f"E{i}" for i in range(4, 10)]
+    assert svc.calls[-1][1]["timeMin"] == query["timeMin"]
+
+
+def test_iter_event_pages_is_lazy():
+    svc = _paged_service(total=100)
+    pages = iter_event_pages(svc, {"calendarId": "primary"})
+    next(pages)
+    assert len(svc.calls) == 1
+
+
+def test_invalid_cursor():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+    assert decode_cursor(encode_cursor({"a": 1}, "t")) == ({"a": 1}, "t")
+
+
+def test_fetch_events_returns_raw_items_without_cursor():
+    svc = _paged_service(total=10)
+    events = fetch_events(svc, max_results=4, fields=["iCalUID"])
+    assert [e["id"] for e in events] == ["0", "1", "2", "3"]
+    assert "iCalUID" in svc.calls[0][1]["fields"]
@@ -0,0 +1,81 @@
+import threading
+import time
+from src.core.ics.cache import ParsedFeedCache
+
+
+def _loader(values):
+    calls = []
+
+    def load(previous):
+        calls.append(previous)
+        return values.pop(0)
+    return load, calls
+
+
+def test_fresh_entries_are_served_without_loading():
+    cache = ParsedFeedCache()
+    load, calls = _loader(["v1", "v2"])
+    assert cache.get("u", 60, load, len) == "v1"
+    assert cache.get("u", 60, load, len) == "v1"
+    assert calls == [None]
+
+
+def test_zero_ttl_reloads_synchronously_with_previous_value():
+    cache = ParsedFeedCache()
+    load, calls = _loader(["v1", "v2"])
+    cache.get("u", 0, load, len)
+    assert cache.get("u", 0, load, len) == "v2"
+    assert calls == [None, "v1"]
+
+
+def test_stale_entry_is_served_while_refreshing():
+    cache = ParsedFeedCache()
+    release = threading.Event()
+    done = threading.Event()
+    values = ["v1", "v2"]
+
+    def load(previous):
+        if previous is not None:
+            release.wait(timeout=2)
+            done.set()
+        return values.pop(0)
+
+    cache.get("u", 0.01, load, len)
+    time.sleep(0.02)
+    assert cache.get("u", 0.01, load, len) == "v1"
+    # A second stale read does not start another refresh
+    assert cache.get("u", 0.01, load, len) == "v1"
+    release.set()
+    assert done.wait(timeout=2)
+    for _ in range(100):
+        if cache.get("u", 60, load, len) == "v2":
+            break
+        time.sleep(0.01)
+    assert cache.get("u", 60, load, len) == "v2"
+
+
+def test_failed_refresh_keeps_stale_value():
+    cache = ParsedFeedCache()
+    cache.get("u", 0.01, lambda prev: "v1", len)
+    time.sleep(0.02)
+    failed = threading.Event()
+
+    def boom(previous):
+        failed.set()
+        raise RuntimeError("down")
+    assert cache.get("u", 0.01, boom, len) == "v1"
+    assert failed.wait(timeout=2)
+    assert cache.get("u", 60, boom, len) == "v1"
+
+
+def test_lru_eviction_by_size():
+    cache = ParsedFeedCache(max_bytes=10)
+    cache.get("a", 60, lambda prev: "aaaa", len)
+    cache.get("b", 60, lambda prev: "bbbb", len)
+    cache.get("a", 60, lambda prev: "xxxx", len)  # touch a
+    cache.get("c", 60, lambda prev: "cccc", len)  # evicts b
+    assert cache.total_bytes == 8 and len(cache) == 2
+    assert cache.get("a", 60, lambda prev: "new", len) == "aaaa"
+    assert cache.get("b", 60, lambda prev: "bb", len) == "bb"
+    cache.get("huge", 60, lambda prev: "z" * 11, len)
+    assert cache.get("huge", 60, lambda prev: "again", len) == "again"
@@ -0,0 +1,49 @@
+import threading
+import time
+from src.core.ics import fanout
+from src.core.ics import ops as ics_ops
+
+
+class SlowOps:
+    delays = {}
+
+    def list_records(self, url, max_results):
+        time.sleep(self.delays.get(url, 0))
+        if url == "boom":
+            raise RuntimeError("unreachable")
+        return [url]
+
+
+def test_feeds_are_fetched_concurrently(monkeypatch):
+    SlowOps.delays = {f"u{i}": 0.2 for i in range(4)}
+    monkeypatch.setattr(ics_ops, "ICSOperations", SlowOps)
+    started = time.monotonic()
+    results = fanout.list_feeds({f"a{i}": f"u{i}" for i in range(4)}, 5)
+    assert time.monotonic() - started < 0.6
+    assert [r.records for r in results] == [["u0"], ["u1"], ["u2"], ["u3"]]
+    assert {r.status for r in results} == {"ok"}
+
+
+def test_deadline_returns_partial_results_with_status(monkeypatch):
+    SlowOps.delays = {"slow": 1.0}
+    monkeypatch.setattr(ics_ops, "ICSOperations", SlowOps)
+    started = time.monotonic()
+    results = fanout.list_feeds({"fast": "fast", "slow": "slow", "bad": "boom"}, 5, deadline=0.2)
+    assert time.monotonic() - started < 0.8
+    by_alias = {r.alias: r for r in results}
+    assert by_alias["fast"].records == ["fast"] and by_alias["fast"].status == "ok"
+    assert by_alias["slow"].records == [] and by_alias["slow"].status == "timeout"
+    assert by_alias["bad"].status == "error: unreachable"
+
+
+def test_no_feeds_does_not_touch_pool(monkeypatch):
+    monkeypatch.setattr(fanout, "_pool", lambda: (_ for _ in ()).throw(AssertionError))
+    assert fanout.list_feeds({}) == []
+
+
+def test_feed_timeout_from_env(monkeypatch):
+    monkeypatch.setenv("MCP_ICS_FEED_TIMEOUT", "3")
+    assert ics_ops.ICSOperations().fetch_timeout == 3.0
+    monkeypatch.setenv("MCP_ICS_FEED_TIMEOUT", "bad")
+    assert ics_ops.ICSOperations().fetch_timeout == 10.0
+    assert ics_ops.ICSOperations(fetch_timeout=2).fetch_timeout == 2
@@ -0,0 +1,82 @@
+import io
+import pytest
+from email.message import Message
+from urllib.error import HTTPError
+from src.core.ics import http as ics_http
+from src.core.ics import feeds
+from src.core.ics import ops as ics_ops
+from src.core.ics.cache import ParsedFeedCache
+from src.core.ics.ops import ICSOperations
+
+BODY = "BEGIN:VCALENDAR\nBEGIN:VEVENT\nSUMMARY:Café\nDTSTART:20990101T100000Z\nEND:VEVENT\nEND:VCALENDAR"
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, body, headers):
+        super().__init__(body.encode())
+        self.headers = headers
+
+
+def _server(responses):
+    sent = []
+
+    def fake_urlopen(request, timeout):
+        sent.append(dict(request.header_items()))
+        status, body, headers = responses.pop(0)
+        if status == 304:
+            raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+        return FakeResponse(body, headers)
+    return fake_urlopen, sent
+
+
+def test_body_is_streamed_in_chunks(monkeypatch):
+    fake, sent = _server([(200, BODY, {"ETag": '"v1"'})])
+    monkeypatch.setattr(ics_http, "urlopen", fake)
+    monkeypatch.setattr(ics_http, "CHUNK_SIZE", 7)
+    response = ics_http.open_feed("http://x/cal.ics", 5)
+    chunks = list(response.chunks)
+    assert len(chunks) > 1 and "".join(chunks) == BODY
+    assert response.validators == {"etag": '"v1"'}
+    assert sent[0] == {}
+
+
+def test_revalidation_headers_and_304(monkeypatch):
+    fake, sent = _server([(304, None, None)])
+    monkeypatch.setattr(ics_http, "urlopen", fake)
+    validators = {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2030 00:00:00 GMT"}
+    response = ics_http.open_feed("http://x/cal.ics", 5, validators)
+    assert response.not_modified and response.validators == validators
+    assert sent[0]["If-none-match"] == '"v1"'
+    assert sent[0]["If-modified-since"] == "Mon, 01 Jan 2030 00:00:00 GMT"
+
+
+def test_304_without_validators_raises(monkeypatch):
+    fake, _ = _server([(304, None, None)])
+    monkeypatch.setattr(ics_http, "urlopen", fake)
+    with pytest.raises(HTTPError):
+        ics_http.open_feed("http://x/cal.ics", 5)
+
+
+def test_not_modified_feed_is_not_reparsed(monkeypatch):
+    fake, sent = _server([(200, BODY, {"ETag": '"v1"'}), (304, None, None)])
+    monkeypatch.setattr(ics_http, "urlopen", fake)
+    monkeypatch.setattr(feeds, "feed_cache", ParsedFeedCache())
+    ops = ICSOperations()
+    calls = []
+    original = ops._parse_events
+    monkeypatch.setattr(ops, "_parse_events", lambda chunks: calls.append(1) or original(chunks))
+    assert "Café" in ops.list_events("http://x/reparse.ics")[0]["text"]
+    assert "Café" in ops.list_events("http://x/reparse.ics")[0]["text"]
+    assert len(calls) == 1
+    assert sent[1]["If-none-match"] == '"v1"'
+
+
+def test_registered_ttl_skips_download(monkeypatch):
+    downloads = []
+    monkeypatch.setattr(feeds, "feed_cache", ParsedFeedCache())
+    monkeypatch.setattr(ics_ops.registry, "ttl_for_url", lambda url: 300)
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: downloads.append(url) or BODY)
+    ops.list_events("http://x/ttl.ics")
+    ops.list_events("http://x/ttl.ics")
+    assert downloads == ["http://x/ttl.ics"]
@@ -1,4 +1,4 @@
-from src.core.ics_ops import ICSOperations
+from src.core.ics.ops import ICSOperations
 import textwrap
 from datetime import datetime, timezone, timedelta
 
@@ -299,12 +299,17 @@ def test_real_world_ics_format_variations(monkeypatch):
 
     monkeypatch.setattr(ICSOperations, "_download_ics", fake_download)
     ops = ICSOperations()
-    events = ops.list_events("http://example.com/complex.ics")
+    events = ops.list_events("http://example.com/complex.ics", max_results=1)
     
     # Should handle timezone and other complex fields
     assert len(events) == 1
     assert "Weekly Meeting" in events[0]['text']
 
+    # The weekly RRULE is expanded into later occurrences as well
+    events = ops.list_events("http://example.com/complex.ics", max_results=3)
+    assert len(events) == 3
+    assert all("Weekly Meeting" in event['text'] for event in events)
+
 def test_ics_operations_error_handling_and_debug_info(monkeypatch):
     """Test that ICS operations provide useful error information and don't fail silently."""
     
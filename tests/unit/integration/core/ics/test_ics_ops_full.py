@@ -0,0 +1,40 @@
+import textwrap
+
+from src.core.ics.ops import ICSOperations
+
+
+def test_ics_ops_parsing_and_normalize(monkeypatch):
+    ics_text = textwrap.dedent("""
+    BEGIN:VCALENDAR
+    BEGIN:VEVENT
+    DTSTART:20200101T120000Z
+    DTEND:20200101T130000Z
+    SUMMARY:Past Event
+    LOCATION:Nowhere
+    DESCRIPTION:Desc
+    END:VEVENT
+    BEGIN:VEVENT
+    DTSTART:99999999
+    DTEND:99999999
+    SUMMARY:Bad Date Event
+    END:VEVENT
+    BEGIN:VEVENT
+    SUMMARY:Undated Event
+    END:VEVENT
+    END:VCALENDAR
+    """)
+
+    # Monkeypatch download to supply inline text
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: ics_text)
+
+    events = ops.list_events("dummy", max_results=None)
+    # Second event should still be included due to parsing fallback
+    assert any("Bad Date Event" in e["text"] for e in events)
+
+    # Records keep their optional fields; undated ones say so
+    records = ops._parse_events(ics_text)
+    past = ops._format_event(records[0])["text"]
+    assert "📍 Location: Nowhere" in past and "📝 Description: Desc" in past
+    assert "📅 Start: 2020-01-01T12:00:00+00:00" in past
+    assert "📅 Start: No start time" in ops._format_event(records[2])["text"]
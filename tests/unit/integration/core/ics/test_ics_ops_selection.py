@@ -0,0 +1,53 @@
+from src.core.ics.ops import ICSOperations
+
+
+def _feed(count, reverse=False):
+    days = range(count, 0, -1) if reverse else range(1, count + 1)
+    body = "".join(
+        f"BEGIN:VEVENT\nSUMMARY:E{d:03d}\nDTSTART:2099{1 + d // 28 % 12:02d}{1 + d % 28:02d}T{d % 24:02d}0000Z\nEND:VEVENT\n"
+        for d in days)
+    return "BEGIN:VCALENDAR\n" + body + "END:VCALENDAR\n"
+
+
+def test_only_selected_events_are_formatted(monkeypatch):
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: _feed(200, reverse=True))
+    formatted = []
+    original = ops._format_event
+    monkeypatch.setattr(ops, "_format_event", lambda ev: formatted.append(ev) or original(ev))
+    events = ops.list_events("http://x/select.ics", max_results=3)
+    assert len(formatted) == 3
+    assert [e["text"].split("\n")[0] for e in events] == ["E001", "E002", "E003"]
+
+
+def test_sort_uses_precomputed_key(monkeypatch):
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: _feed(50, reverse=True))
+    events = ops.list_events("http://x/sorted.ics")
+    starts = [e["text"].split("\n")[1] for e in events]
+    assert len(events) == 50 and starts == sorted(starts)
+
+
+def test_top_n_stops_scanning_after_selection(monkeypatch):
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: _feed(300))
+    checked = []
+    original = ops._is_future_event
+    monkeypatch.setattr(ops, "_is_future_event", lambda ev, now: checked.append(ev) or original(ev, now))
+    events = ops.list_events("http://x/topn.ics", max_results=5)
+    assert [e["text"].split("\n")[0] for e in events] == ["E001", "E002", "E003", "E004", "E005"]
+    assert len(checked) <= 6
+
+
+def test_top_n_merges_singles_with_open_ended_series(monkeypatch):
+    body = (
+        "BEGIN:VCALENDAR\n"
+        "BEGIN:VEVENT\nUID:daily\nSUMMARY:Daily\nDTSTART:20990101T120000Z\nRRULE:FREQ=DAILY\nEND:VEVENT\n"
+        "BEGIN:VEVENT\nUID:one\nSUMMARY:Single\nDTSTART:20990102T080000Z\nEND:VEVENT\n"
+        "BEGIN:VEVENT\nUID:nodate\nSUMMARY:Undated\nEND:VEVENT\n"
+        "END:VCALENDAR\n")
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: body)
+    events = ops.list_events("http://x/merge.ics", max_results=4)
+    titles = [e["text"].split("\n")[0] for e in events]
+    assert titles == ["Undated", "Daily", "Single", "Daily"]
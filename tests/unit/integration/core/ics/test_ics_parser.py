@@ -0,0 +1,145 @@
+from src.core.ics import ops as ics_ops
+from src.core.ics.ops import ICSOperations
+from src.core.ics.http import FeedResponse
+import textwrap
+from datetime import date, datetime, timedelta, timezone
+from src.core.ics.parser import iter_events, iter_lines, parse_duration, parse_property
+
+
+def test_unfolding_across_chunk_boundaries():
+    text = "BEGIN:VEVENT\r\nDESCRIPTION:first part\r\n  and the rest\r\n\tend\r\nSUMMARY:X\r\nEND:VEVENT\r\n"
+    for size in (1, 3, 7, len(text)):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        events = list(iter_events(chunks))
+        assert len(events) == 1
+        assert events[0].get("DESCRIPTION") == "first part and the restend"
+        assert events[0].get("SUMMARY") == "X"
+
+
+def test_lines_without_trailing_newline_and_plain_strings():
+    assert list(iter_lines(["A:1\nB:", "2"])) == ["A:1", "B:2"]
+    assert list(iter_lines("A:1\n b")) == ["A:1b"]
+    assert list(iter_lines("")) == []
+
+
+def test_properties_outside_vevent_are_ignored():
+    text = "BEGIN:VCALENDAR\nDTSTART:19700101T000000\nBEGIN:VEVENT\nEND:VEVENT\nBEGIN:VEVENT\nSUMMARY:A\nEND:VEVENT\nEND:VCALENDAR"
+    events = list(iter_events(text))
+    assert [list(ev.properties) for ev in events] == [["SUMMARY"]]
+    assert events[0].start is None
+
+
+def test_ordered_feed_stops_reading_early(monkeypatch):
+    read = []
+    closed = []
+
+    def chunks():
+        try:
+            for i in range(1000):
+                read.append(i)
+                yield f"BEGIN:VEVENT\nSUMMARY:E{i}\nDTSTART:2099{1 + i // 28 % 12:02d}{1 + i % 28:02d}T100000Z\nEND:VEVENT\n"
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(ics_ops.registry, "is_ordered", lambda url: True)
+    monkeypatch.setattr(ics_ops.registry, "ttl_for_url", lambda url: None)
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: FeedResponse(chunks()))
+    events = ops.list_events("http://x/ordered.ics", max_results=3)
+    assert [e["text"].split("\n")[0] for e in events] == ["E0", "E1", "E2"]
+    assert len(read) <= 4 and closed == [True]
+
+
+def _one(body):
+    return list(iter_events("BEGIN:VCALENDAR\n" + textwrap.dedent(body) + "END:VCALENDAR\n"))
+
+
+def test_tzid_resolves_through_zoneinfo():
+    ev, = _one("""
+    BEGIN:VEVENT
+    DTSTART;TZID=America/New_York:20300701T100000
+    DTEND;TZID="America/New_York":20300701T113000
+    END:VEVENT
+    """)
+    assert ev.start.isoformat() == "2030-07-01T10:00:00-04:00"
+    assert ev.end - ev.start == timedelta(minutes=90)
+    assert not ev.all_day
+
+
+def test_custom_tzid_uses_vtimezone_definition():
+    ev, = _one("""
+    BEGIN:VTIMEZONE
+    TZID:Eastern Standard Time
+    BEGIN:STANDARD
+    DTSTART:16010101T020000
+    TZOFFSETFROM:-0400
+    TZOFFSETTO:-0500
+    RRULE:FREQ=YEARLY;BYDAY=1SU;BYMONTH=11
+    END:STANDARD
+    BEGIN:DAYLIGHT
+    DTSTART:16010101T020000
+    TZOFFSETFROM:-0500
+    TZOFFSETTO:-0400
+    RRULE:FREQ=YEARLY;BYDAY=2SU;BYMONTH=3
+    END:DAYLIGHT
+    END:VTIMEZONE
+    BEGIN:VEVENT
+    DTSTART;TZID=Eastern Standard Time:20300115T090000
+    END:VEVENT
+    """)
+    assert ev.start.utcoffset() == timedelta(hours=-5)
+
+
+def test_floating_times_use_calendar_timezone():
+    ev, = _one("""
+    X-WR-TIMEZONE:America/Sao_Paulo
+    BEGIN:VEVENT
+    DTSTART:20300101T090000
+    END:VEVENT
+    """)
+    assert ev.start.utcoffset() == timedelta(hours=-3)
+
+
+def test_all_day_and_duration():
+    day, timed = _one("""
+    BEGIN:VEVENT
+    DTSTART;VALUE=DATE:20300101
+    END:VEVENT
+    BEGIN:VEVENT
+    DTSTART:20300101T090000Z
+    DURATION:PT1H30M
+    END:VEVENT
+    """)
+    assert day.all_day and day.start == datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert day.end - day.start == timedelta(days=1)
+    assert timed.end - timed.start == timedelta(hours=1, minutes=30)
+    assert parse_duration("-P1W") == -timedelta(weeks=1)
+    assert parse_duration("P") is None
+
+
+def test_params_text_escapes_and_nested_components():
+    ev, = _one(r"""
+    BEGIN:VEVENT
+    SUMMARY:Lunch\, team\; planning
+    DESCRIPTION:Line one\nLine two
+    ORGANIZER;CN="Doe: John":mailto:j@example.com
+    BEGIN:VALARM
+    DESCRIPTION:Reminder
+    END:VALARM
+    END:VEVENT
+    """)
+    assert ev.text("SUMMARY") == "Lunch, team; planning"
+    assert ev.text("DESCRIPTION") == "Line one\nLine two"
+    assert ev.properties["ORGANIZER"][0].params == {"CN": "Doe: John"}
+    assert ev.get("ORGANIZER") == "mailto:j@example.com"
+    assert parse_property("no colon here") is None
+
+
+def test_all_day_events_filtered_by_date(monkeypatch):
+    yesterday = date.today() - timedelta(days=2)
+    body = (f"BEGIN:VEVENT\nSUMMARY:Old\nDTSTART;VALUE=DATE:{yesterday:%Y%m%d}\nEND:VEVENT\n"
+            "BEGIN:VEVENT\nSUMMARY:New\nDTSTART;VALUE=DATE:20990101\nEND:VEVENT\n")
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: body)
+    events = ops.list_events("http://x/allday.ics")
+    assert [e["text"].split("\n")[:2] for e in events] == [["New", "📅 Start: 2099-01-01"]]
@@ -0,0 +1,105 @@
+import textwrap
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from src.core.ics.ops import ICSOperations
+from src.core.ics.parser import iter_events
+from src.core.ics.recurrence import split_recurring
+
+NY = ZoneInfo("America/New_York")
+
+
+def _feed(body):
+    return list(iter_events("BEGIN:VCALENDAR\n" + textwrap.dedent(body) + "END:VCALENDAR\n"))
+
+
+def test_infinite_rule_is_expanded_lazily():
+    singles, (series,) = split_recurring(_feed("""
+    BEGIN:VEVENT
+    UID:daily
+    DTSTART:20200101T090000Z
+    DTEND:20200101T100000Z
+    RRULE:FREQ=DAILY
+    END:VEVENT
+    """))
+    assert singles == []
+    occurrences = series.take(datetime(2030, 1, 1, tzinfo=timezone.utc), limit=3)
+    assert [ev.start.day for ev in occurrences] == [1, 2, 3]
+    assert all(ev.end - ev.start == timedelta(hours=1) for ev in occurrences)
+    # Running occurrence counts
+    ongoing = next(series.after(datetime(2030, 1, 1, 9, 30, tzinfo=timezone.utc)))
+    assert ongoing.start == datetime(2030, 1, 1, 9, tzinfo=timezone.utc)
+
+
+def test_wall_clock_kept_across_dst_and_until_in_utc():
+    _, (series,) = split_recurring(_feed("""
+    BEGIN:VEVENT
+    UID:weekly
+    DTSTART;TZID=America/New_York:20300301T090000
+    RRULE:FREQ=WEEKLY;UNTIL=20300322T140000Z
+    END:VEVENT
+    """))
+    starts = [ev.start for ev in series.take(datetime(2030, 1, 1, tzinfo=timezone.utc))]
+    assert [s.day for s in starts] == [1, 8, 15, 22]
+    assert all(s.astimezone(NY).hour == 9 for s in starts)
+    assert starts[0].utcoffset() != starts[-1].utcoffset()
+
+
+def test_exdate_rdate_and_overrides():
+    singles, (series,) = split_recurring(_feed("""
+    BEGIN:VEVENT
+    UID:s
+    SUMMARY:Standup
+    DTSTART:20300101T090000Z
+    RRULE:FREQ=DAILY;COUNT=5
+    EXDATE:20300102T090000Z,20300103T090000Z
+    RDATE:20300110T090000Z
+    END:VEVENT
+    BEGIN:VEVENT
+    UID:s
+    RECURRENCE-ID:20300104T090000Z
+    SUMMARY:Standup (moved)
+    DTSTART:20300104T150000Z
+    END:VEVENT
+    BEGIN:VEVENT
+    UID:s
+    RECURRENCE-ID:20300105T090000Z
+    STATUS:CANCELLED
+    DTSTART:20300105T090000Z
+    END:VEVENT
+    """))
+    assert [ev.start.day for ev in series.take(datetime(2030, 1, 1, tzinfo=timezone.utc))] == [1, 10]
+    assert [ev.text("SUMMARY") for ev in singles] == ["Standup (moved)"]
+    window = series.between(datetime(2030, 1, 9, tzinfo=timezone.utc), datetime(2030, 1, 11, tzinfo=timezone.utc))
+    assert [ev.start.day for ev in window] == [10]
+
+
+def test_invalid_rule_keeps_master_as_single():
+    singles, series = split_recurring(_feed("""
+    BEGIN:VEVENT
+    UID:bad
+    DTSTART:20300101T090000Z
+    RRULE:FREQ=SOMETIMES
+    END:VEVENT
+    """))
+    assert series == [] and len(singles) == 1
+
+
+def test_list_events_includes_occurrences_of_old_series(monkeypatch):
+    body = textwrap.dedent("""
+    BEGIN:VCALENDAR
+    BEGIN:VEVENT
+    UID:w
+    SUMMARY:Weekly sync
+    DTSTART:20200106T140000Z
+    DTEND:20200106T150000Z
+    RRULE:FREQ=WEEKLY
+    END:VEVENT
+    END:VCALENDAR
+    """)
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: body)
+    events = ops.list_events("http://x/weekly.ics", max_results=2)
+    assert len(events) == 2 and all("Weekly sync" in e["text"] for e in events)
+    window = ops.list_events("http://x/weekly.ics", time_min="2030-01-01T00:00:00Z", time_max="2030-01-15T00:00:00Z")
+    assert [e["text"].split("\n")[1] for e in window] == ["📅 Start: 2030-01-07T14:00:00+00:00",
+                                                          "📅 Start: 2030-01-14T14:00:00+00:00"]
@@ -0,0 +1,62 @@
+import os
+import json
+import tempfile
+import importlib
+import pytest
+
+
+def test_register_and_get(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        fake_path = os.path.join(tmp, 'ics.json')
+        monkeypatch.setattr('src.core.ics.registry._REGISTRY_PATH', fake_path, raising=False)
+        reg = importlib.import_module('src.core.ics.registry')
+        reg.register('work', 'http://example.com/a.ics')
+        assert reg.get('work') == 'http://example.com/a.ics'
+        data_on_disk = json.load(open(fake_path))
+        assert data_on_disk == {'work': 'http://example.com/a.ics'}
+        assert reg.list_all() == {'work': 'http://example.com/a.ics'}
+
+
+def test_load_invalid_json(monkeypatch, tmp_path):
+    bad = tmp_path / 'bad.json'
+    bad.write_text('{invalid')
+    # Import the module and then patch its path to point to invalid JSON
+    registry = importlib.import_module('src.core.ics.registry')
+    monkeypatch.setattr(registry, '_REGISTRY_PATH', str(bad), raising=False)
+    assert registry.list_all() == {}
+
+
+def test_list_all_no_file(monkeypatch, tmp_path):
+    missing = tmp_path / 'none.json'
+    registry = importlib.import_module('src.core.ics.registry')
+    monkeypatch.setattr(registry, '_REGISTRY_PATH', str(missing), raising=False)
+    assert registry.list_all() == {}
+
+
+def test_register_invalid(monkeypatch, tmp_path):
+    fake = tmp_path / 'f.json'
+    reg = importlib.import_module('src.core.ics.registry')
+    monkeypatch.setattr(reg, '_REGISTRY_PATH', str(fake), raising=False)
+    with pytest.raises(ValueError):
+        reg.register('', '') 
+
+def test_register_with_ttl(monkeypatch, tmp_path):
+    reg = importlib.import_module('src.core.ics.registry')
+    monkeypatch.setattr(reg, '_REGISTRY_PATH', str(tmp_path / 'r.json'), raising=False)
+    reg.register('work', 'http://example.com/a.ics', ttl=300)
+    reg.register('home', 'http://example.com/b.ics')
+    assert reg.get('work') == 'http://example.com/a.ics'
+    assert reg.list_all() == {'work': 'http://example.com/a.ics', 'home': 'http://example.com/b.ics'}
+    assert reg.ttl_for_url('http://example.com/a.ics') == 300
+    assert reg.ttl_for_url('http://example.com/b.ics') is None
+    with pytest.raises(ValueError):
+        reg.register('bad', 'http://example.com/c.ics', ttl=-1)
+
+
+def test_register_ordered(monkeypatch, tmp_path):
+    reg = importlib.import_module('src.core.ics.registry')
+    monkeypatch.setattr(reg, '_REGISTRY_PATH', str(tmp_path / 'r.json'), raising=False)
+    reg.register('feed', 'http://example.com/a.ics', ordered=True)
+    assert json.load(open(tmp_path / 'r.json')) == {'feed': {'url': 'http://example.com/a.ics', 'ordered': True}}
+    assert reg.is_ordered('http://example.com/a.ics')
+    assert not reg.is_ordered('http://example.com/b.ics')
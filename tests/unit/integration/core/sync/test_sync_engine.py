@@ -0,0 +1,107 @@
+import time
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from src.core import sync
+from src.core.sync import EventStore, ensure_fresh, list_cached_events, sync_calendar
+from src.core.interval_index import to_timestamp
+from ..calendar.mocks import FakeBatchService
+
+
+def _event(eid, start, end, **extra):
+    return {"id": eid, "summary": eid, "start": {"dateTime": start}, "end": {"dateTime": end}, **extra}
+
+
+class Remote:
+    """Fake events().list endpoint with sync-token semantics."""
+    def __init__(self):
+        self.full = []
+        self.changes = {}
+        self.expired = set()
+
+    def __call__(self, method, kwargs):
+        token = kwargs.get("syncToken")
+        if token in self.expired:
+            raise HttpError(httplib2.Response({"status": 410}), b"gone")
+        if token is None:
+            if kwargs.get("pageToken") is None and len(self.full) > 1:
+                return {"items": self.full[:1], "nextPageToken": "p2"}
+            items = self.full[1:] if kwargs.get("pageToken") else self.full
+            return {"items": items, "nextSyncToken": "t1"}
+        return {"items": self.changes.get(token, []), "nextSyncToken": token + "+"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EventStore(str(tmp_path / "events.sqlite3"))
+
+
+def test_full_then_incremental_sync(store):
+    remote = Remote()
+    remote.full = [_event("a", "2099-01-01T10:00:00Z", "2099-01-01T11:00:00Z"),
+                   _event("b", "2099-01-02T10:00:00Z", "2099-01-02T11:00:00Z")]
+    svc = FakeBatchService(remote)
+    assert sync_calendar(svc, store) == 2
+    assert store.get_state("primary")[0] == "t1"
+    assert "syncToken" not in svc.calls[0][1]
+
+    remote.changes["t1"] = [{"id": "a", "status": "cancelled"},
+                            _event("c", "2099-01-01T09:00:00+00:00", "2099-01-01T09:30:00+00:00")]
+    assert sync_calendar(svc, store) == 2
+    assert svc.calls[-1][1]["syncToken"] == "t1"
+    assert [e["id"] for e in store.window("primary", 0)] == ["c", "b"]
+
+
+def test_expired_token_triggers_full_resync(store):
+    remote = Remote()
+    remote.full = [_event("a", "2099-01-01T10:00:00Z", "2099-01-01T11:00:00Z")]
+    store.apply_changes("primary", [_event("stale", "2099-01-01T10:00:00Z", "2099-01-01T11:00:00Z")], "old")
+    remote.expired.add("old")
+    sync_calendar(FakeBatchService(remote), store)
+    assert [e["id"] for e in store.window("primary", 0)] == ["a"]
+    assert store.get_state("primary")[0] == "t1"
+
+
+def test_other_http_errors_propagate(store):
+    def handler(method, kwargs):
+        raise HttpError(httplib2.Response({"status": 500}), b"boom")
+    with pytest.raises(HttpError):
+        sync_calendar(FakeBatchService(handler), store)
+
+
+def test_ensure_fresh_respects_ttl_and_mark_stale(store):
+    svc = FakeBatchService(Remote())
+    assert ensure_fresh(svc, store, "primary", ttl=60) is True
+    assert ensure_fresh(svc, store, "primary", ttl=60) is False
+    store.mark_stale()
+    assert ensure_fresh(svc, store, "primary", ttl=60) is True
+
+
+def test_list_cached_events_filters_past_and_limits(store):
+    now = time.time()
+    iso = lambda ts: time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+    remote = Remote()
+    remote.full = [_event("past", iso(now - 7200), iso(now - 3600)),
+                   _event("ongoing", iso(now - 600), iso(now + 600)),
+                   _event("next", iso(now + 3600), iso(now + 7200)),
+                   {"id": "allday", "summary": "allday", "start": {"date": "2099-01-01"}, "end": {"date": "2099-01-02"}}]
+    events = list_cached_events(FakeBatchService(remote), store, max_results=2)
+    assert [e["text"].split("\n")[0] for e in events] == ["ongoing", "next"]
+
+
+def test_get_store_disabled_by_default(monkeypatch, tmp_path):
+    monkeypatch.delenv("MCP_EVENT_STORE", raising=False)
+    assert sync.get_store() is None
+    monkeypatch.setenv("MCP_EVENT_STORE", "1")
+    monkeypatch.setenv("MCP_EVENT_STORE_PATH", str(tmp_path / "s.sqlite3"))
+    monkeypatch.setattr(sync, "_STORE", None)
+    assert isinstance(sync.get_store(), EventStore)
+
+
+def test_window_query_uses_fresh_index(store):
+    store.apply_changes("primary", [_event("a", "2099-01-01T10:00:00Z", "2099-01-01T12:00:00Z"),
+                                    _event("b", "2099-01-01T13:00:00Z", "2099-01-01T14:00:00Z")], "t")
+    ts = lambda s: to_timestamp(s)
+    assert [e["id"] for e in store.window("primary", ts("2099-01-01T11:00:00Z"), ts("2099-01-01T13:30:00Z"))] == ["a", "b"]
+    store.apply_changes("primary", [{"id": "a", "status": "cancelled"}], "t2")
+    assert [e["id"] for e in store.window("primary", ts("2099-01-01T11:00:00Z"))] == ["b"]
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+from src.core.agenda import availability
+from src.core.ics.parser import ICSEvent, Property
+
+
+def test_merge_busy_joins_overlapping_and_touching():
+    assert availability.merge_busy([(5, 7), (1, 3), (2, 4), (4, 5), (9, 9), (10, 12)]) == [(1, 7), (10, 12)]
+
+
+def test_free_slots_within_range_and_min_duration():
+    busy = [(0, 10), (30, 40), (42, 50), (95, 120)]
+    assert availability.free_slots(busy, 5, 100) == [(10, 30), (40, 42), (50, 95)]
+    assert availability.free_slots(busy, 5, 100, min_duration=5) == [(10, 30), (50, 95)]
+    assert availability.free_slots(busy, 5, 100, limit=1) == [(10, 30)]
+    assert availability.free_slots([], 0, 60) == [(0, 60)]
+    assert availability.free_slots([(0, 100)], 10, 50) == []
+
+
+def test_conflicts_are_sorted_overlaps():
+    busy = [availability.Conflict(50, 60, "b"), availability.Conflict(0, 10, "a"),
+            availability.Conflict(10, 20, "c"), availability.Conflict(5, 15, "d")]
+    assert [c.source for c in availability.conflicts(busy, 10, 55)] == ["d", "c", "b"]
+
+
+def test_ics_busy_ignores_transparent_and_cancelled():
+    def record(**props):
+        start = datetime(2099, 1, 1, tzinfo=timezone.utc)
+        properties = {k: [Property(k, v)] for k, v in props.items()}
+        return ICSEvent(properties, start=start, end=start.replace(hour=1), sort_ts=start.timestamp())
+    records = [record(), record(TRANSP="TRANSPARENT"), record(STATUS="CANCELLED"), ICSEvent({})]
+    assert len(availability.ics_busy(records)) == 1
@@ -0,0 +1,100 @@
+import time
+import httplib2
+import pytest
+from src.core import calendar_service, deadline
+from src.core.ics import http as ics_http
+from src.core.ics import fanout
+from src.core.ics import ops as ics_ops
+
+
+def test_timeout_is_capped_by_remaining_budget():
+    assert deadline.timeout(10) == 10
+    with deadline.scope(deadline.Deadline(0.5)):
+        assert 0 < deadline.timeout(10) <= 0.5
+        assert deadline.timeout(0.1) == 0.1
+        assert deadline.timeout() <= 0.5
+    with deadline.scope(deadline.Deadline()):
+        assert deadline.timeout(10) == 10 and deadline.timeout() is None
+    assert deadline.current() is None
+
+
+def test_expired_and_cancelled_budgets_raise():
+    with deadline.scope(deadline.Deadline(0.001)):
+        time.sleep(0.01)
+        with pytest.raises(deadline.DeadlineExceeded):
+            deadline.check()
+    budget = deadline.Deadline()
+    budget.cancel()
+    with deadline.scope(budget):
+        with pytest.raises(deadline.RequestCancelled):
+            deadline.timeout(5)
+
+
+def test_default_seconds_from_env(monkeypatch):
+    assert deadline.default_seconds() is None
+    monkeypatch.setenv("MCP_REQUEST_TIMEOUT", "2.5")
+    assert deadline.default_seconds() == 2.5
+    monkeypatch.setenv("MCP_REQUEST_TIMEOUT", "bad")
+    assert deadline.default_seconds() is None
+
+
+def test_ics_download_uses_remaining_budget_and_stops_when_cancelled(monkeypatch):
+    seen = []
+
+    class Body:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+        headers = {}
+
+        def read(self, size):
+            return b"BEGIN:VCALENDAR\n"
+
+    monkeypatch.setattr(ics_http, "urlopen", lambda request, timeout: seen.append(timeout) or Body())
+    budget = deadline.Deadline(1)
+    with deadline.scope(budget):
+        response = ics_http.open_feed("http://x/cal.ics", 10)
+        chunks = iter(response.chunks)
+        next(chunks)
+        budget.cancel()
+        with pytest.raises(deadline.RequestCancelled):
+            next(chunks)
+    assert 0 < seen[0] <= 1
+
+
+def test_feed_fan_out_runs_in_request_context(monkeypatch):
+    seen = []
+
+    class Ops:
+        def list_records(self, url, max_results):
+            seen.append(deadline.current())
+            return []
+
+    monkeypatch.setattr(ics_ops, "ICSOperations", Ops)
+    budget = deadline.Deadline(5)
+    with deadline.scope(budget):
+        results = fanout.list_feeds({"a": "u1", "b": "u2"})
+    assert seen == [budget, budget] and {r.status for r in results} == {"ok"}
+
+
+def test_api_requests_time_out_with_budget():
+    http = httplib2.Http()
+
+    class Conn:
+        timeout = None
+
+        class sock:
+            value = None
+
+            @classmethod
+            def settimeout(cls, value):
+                cls.value = value
+
+    http.connections["https:www.googleapis.com"] = Conn
+    calendar_service._apply_timeout(http, 3)
+    assert http.timeout == 3 and Conn.timeout == 3 and Conn.sock.value == 3
+    calendar_service._apply_timeout(http, None)
+    assert http.timeout is None and Conn.sock.value is None
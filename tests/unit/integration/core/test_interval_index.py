@@ -0,0 +1,67 @@
+import random
+import textwrap
+import pytest
+from src.core.interval_index import IntervalIndex, to_timestamp
+from src.core.ics.ops import ICSOperations
+
+
+@pytest.fixture
+def index():
+    # A long event (0-100) and several short ones
+    return IntervalIndex([(50, 55, "c"), (0, 100, "long"), (10, 20, "a"), (30, 30, "point"), (60, 70, "d")])
+
+
+def test_overlapping_includes_running_events(index):
+    assert index.overlapping(52, 58) == ["long", "c"]
+    assert index.overlapping(25, 35) == ["long", "point"]
+    assert index.overlapping(100, None) == []
+    assert index.overlapping(15, None, limit=2) == ["long", "a"]
+    assert len(index) == 5
+
+
+def test_overlapping_matches_brute_force_with_mixed_durations():
+    rng = random.Random(7)
+    intervals = [(s, s + rng.choice([0, 60, 1800, 7200]), i) for i, s in enumerate(rng.uniform(0, 1e6) for _ in range(2000))]
+    intervals += [(0, 5e6, "years"), (4e5, 4e5, "instant"), (4e5, 4e5 + 1e5, "week")]
+    index = IntervalIndex(intervals)
+    ordered = sorted(intervals, key=lambda entry: entry[0])
+    for _ in range(200):
+        start = rng.uniform(0, 1.1e6)
+        end = start + rng.choice([0, 300, 86400])
+        expected = [item for s, e, item in ordered if (e > start or s >= start) and s < end]
+        assert index.overlapping(start, end) == expected
+
+
+def test_to_timestamp():
+    assert to_timestamp("1970-01-01T00:01:00Z") == 60
+    assert to_timestamp("1970-01-01T00:00:00-01:00") == 3600
+    with pytest.raises(ValueError):
+        to_timestamp("yesterday")
+
+
+def test_ics_window_query(monkeypatch):
+    sample = textwrap.dedent("""
+    BEGIN:VCALENDAR
+    BEGIN:VEVENT
+    SUMMARY:Conference
+    DTSTART;VALUE=DATE:20300101
+    DTEND;VALUE=DATE:20300104
+    END:VEVENT
+    BEGIN:VEVENT
+    SUMMARY:Morning
+    DTSTART:20300102T090000Z
+    DTEND:20300102T100000Z
+    END:VEVENT
+    BEGIN:VEVENT
+    SUMMARY:Later
+    DTSTART:20300110T090000Z
+    DTEND:20300110T100000Z
+    END:VEVENT
+    END:VCALENDAR
+    """)
+    ops = ICSOperations()
+    monkeypatch.setattr(ops, "_download_ics", lambda url: sample)
+    events = ops.list_events("u", time_min="2030-01-02T00:00:00Z", time_max="2030-01-03T00:00:00Z")
+    assert [e["text"].split("\n")[0] for e in events] == ["Conference", "Morning"]
+    empty = ops.list_events("u", time_min="2031-01-01T00:00:00Z")
+    assert "No events found" in empty[0]["text"]
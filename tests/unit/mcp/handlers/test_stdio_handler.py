@@ -33,11 +33,23 @@ def test_handle_unknown_method(capabilities):
     assert response['error']['code'] == -32601
 
 def test_handle_tools_call(capabilities, monkeypatch):
-    mock_post_handler = MagicMock()
-    monkeypatch.setattr('src.mcp.stdio_handler.handle_post_other', mock_post_handler)
+    mock_post_handler = MagicMock(return_value={"jsonrpc": "2.0", "id": 4, "result": {}})
+    monkeypatch.setattr('src.mcp.stdio_handler.post_other_response', mock_post_handler)
     
     handler = StdioRequestHandler(capabilities)
     request = {"jsonrpc": "2.0", "id": 4, "method": "tools/call", "params": {}}
     handler.handle_request(request)
     
-    mock_post_handler.assert_called_once() 
\ No newline at end of file
+    mock_post_handler.assert_called_once_with(request)
+
+def test_handle_tools_call_skips_json_round_trip(capabilities, monkeypatch):
+    from src.mcp.handlers import mcp_post_other_handler as post_other
+    payload = {"content": [{"type": "text", "text": "ok"}]}
+    monkeypatch.setattr(post_other, "_call_tool", lambda name, args: {"result": payload})
+    monkeypatch.setattr(post_other.json, "dumps", MagicMock(side_effect=AssertionError("serialised")))
+
+    handler = StdioRequestHandler(capabilities)
+    request = {"jsonrpc": "2.0", "id": 5, "method": "tools/call", "params": {"name": "echo"}}
+    response = handler.handle_request(request)
+
+    assert response["result"] is payload 
\ No newline at end of file
@@ -0,0 +1,73 @@
+import threading
+import time
+from src.core import deadline
+from src.mcp.handlers import stdio_handler
+from src.mcp.handlers.stdio_handler import StdioRequestHandler
+
+CAPS = {"tools": {}, "serverInfo": {}, "protocolVersion": "v"}
+
+
+def _call(request_id, meta=None):
+    params = {"name": "slow", "arguments": {}}
+    if meta is not None:
+        params["_meta"] = meta
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": params}
+
+
+def _tool(monkeypatch, body):
+    def fake(request):
+        return {"jsonrpc": "2.0", "id": request["id"], "result": body()}
+    monkeypatch.setattr(stdio_handler, "post_other_response", fake)
+
+
+def test_meta_timeout_sets_request_budget(monkeypatch):
+    seen = []
+    _tool(monkeypatch, lambda: seen.append(deadline.timeout()) or "ok")
+    res = StdioRequestHandler(CAPS).handle_request(_call(1, {"timeoutMs": 2000}))
+    assert res["result"] == "ok" and 0 < seen[0] <= 2
+    assert deadline.current() is None
+
+
+def test_server_default_budget(monkeypatch):
+    monkeypatch.setenv("MCP_REQUEST_TIMEOUT", "3")
+    seen = []
+    _tool(monkeypatch, lambda: seen.append(deadline.timeout()) or "ok")
+    StdioRequestHandler(CAPS).handle_request(_call(1))
+    assert 2 < seen[0] <= 3
+
+
+def test_expired_budget_returns_timeout_error(monkeypatch):
+    def slow():
+        time.sleep(0.05)
+        deadline.check()
+    _tool(monkeypatch, slow)
+    res = StdioRequestHandler(CAPS).handle_request(_call(4, {"timeoutMs": 10}))
+    assert res["id"] == 4 and res["error"]["code"] == -32001
+
+
+def test_late_result_after_deadline_is_a_timeout(monkeypatch):
+    _tool(monkeypatch, lambda: time.sleep(0.05) or "late")
+    res = StdioRequestHandler(CAPS).handle_request(_call(5, {"timeoutMs": 10}))
+    assert res["error"]["code"] == -32001
+
+
+def test_cancel_stops_running_call_without_response(monkeypatch):
+    handler = StdioRequestHandler(CAPS)
+    started = threading.Event()
+
+    def wait_for_cancel():
+        started.set()
+        for _ in range(200):
+            deadline.check()
+            time.sleep(0.01)
+        return "never"
+
+    _tool(monkeypatch, wait_for_cancel)
+    out = []
+    worker = threading.Thread(target=lambda: out.append(handler.handle_request(_call(7))))
+    worker.start()
+    assert started.wait(1)
+    handler.cancel(7)
+    worker.join(2)
+    assert out == [None]
+    handler.cancel(7)  # unknown ids are ignored
@@ -0,0 +1,91 @@
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+from src.core.calendar.calendars import CalendarEvents
+from src.core.ics.parser import ICSEvent, Property
+from src.mcp.handlers.stdio_handler import StdioRequestHandler
+from src.mcp.tools import tool_list_events as tle
+
+CAPS = {"tools": {}, "serverInfo": {}, "protocolVersion": "v"}
+
+
+def _call(arguments):
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+               "params": {"name": "list_events", "arguments": arguments}}
+    return StdioRequestHandler(CAPS).handle_request(request)
+
+
+def _google(event_id, start, uid=None):
+    return {"id": event_id, "iCalUID": uid or event_id, "summary": event_id,
+            "start": {"dateTime": start}, "end": {"dateTime": start}}
+
+
+def _record(summary, start, uid=None):
+    props = {"SUMMARY": [Property("SUMMARY", summary)], "UID": [Property("UID", uid or summary)]}
+    moment = datetime.fromisoformat(start).replace(tzinfo=timezone.utc)
+    return ICSEvent(props, start=moment, end=moment, sort_ts=moment.timestamp())
+
+
+def _titles(res):
+    return [item["text"].split("\n")[0] for item in res["result"]["content"]]
+
+
+def _setup(monkeypatch):
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: "svc")
+    monkeypatch.setattr(tle.sync, "get_store", lambda: None)
+
+
+def test_calendar_ids_fan_out_through_stdio(monkeypatch):
+    _setup(monkeypatch)
+    seen = []
+
+    def fake_fetch(svc, ids, mr, fields=()):
+        seen.append(ids)
+        return [CalendarEvents("a", [_google("a1", "2099-01-02T10:00:00Z")], None),
+                CalendarEvents("b", [_google("b1", "2099-01-01T10:00:00Z")], None)]
+
+    monkeypatch.setattr(tle, "fetch_calendars", fake_fetch)
+    res = _call({"calendar_ids": ["a", "b"]})
+    assert seen == [["a", "b"]]
+    assert _titles(res) == ["b1", "a1"]
+    assert res["result"]["calendar_status"] == {"a": "ok", "b": "ok"}
+
+
+def test_with_ics_merges_and_dedupes_through_stdio(monkeypatch):
+    _setup(monkeypatch)
+    monkeypatch.setattr(tle, "fetch_events", lambda svc, mr, cid, fields=(): [
+        _google("g1", "2099-01-01T10:00:00Z", uid="shared"), _google("g2", "2099-01-03T10:00:00Z")])
+    monkeypatch.setattr("src.core.ics.registry.list_all", lambda: {"work": "u1"})
+
+    class FakeOps:
+        def list_records(self, url, mr):
+            return [_record("dup", "2099-01-01T10:00:00", uid="shared"), _record("i1", "2099-01-02T09:00:00")]
+
+    with patch("src.core.ics.ops.ICSOperations", return_value=FakeOps()):
+        res = _call({"with_ics": True})
+
+    assert _titles(res) == ["g1", "i1", "g2"]
+    assert res["result"]["ics_status"] == {"work": "ok"}
+
+
+def test_with_ics_fetches_feeds_concurrently_through_stdio(monkeypatch):
+    _setup(monkeypatch)
+    monkeypatch.setenv("MCP_ICS_DEADLINE", "0.3")
+    monkeypatch.setattr(tle, "fetch_events", lambda svc, mr, cid, fields=(): [])
+    monkeypatch.setattr("src.core.ics.registry.list_all", lambda: {"fast": "u1", "slow": "u2"})
+    release = threading.Event()
+
+    class FakeOps:
+        def list_records(self, url, mr):
+            if url == "u2":
+                release.wait(2)
+            return [_record(url, "2099-01-02T09:00:00")]
+
+    try:
+        with patch("src.core.ics.ops.ICSOperations", return_value=FakeOps()):
+            res = _call({"with_ics": True})
+    finally:
+        release.set()
+
+    assert _titles(res)[0] == "u1"
+    assert res["result"]["ics_status"] == {"fast": "ok", "slow": "timeout"}
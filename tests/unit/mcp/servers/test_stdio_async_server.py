@@ -0,0 +1,140 @@
+import asyncio
+import io
+import json
+import sys
+import threading
+from src.mcp.servers import stdio_frames, stdio_server_runner
+from src.mcp.servers.mcp_stdio_server import AsyncMCPStdioServer
+
+
+class Writer:
+    def __init__(self):
+        self.lines = []
+
+    def write(self, data):
+        self.lines.extend(json.loads(l) for l in data.decode().splitlines())
+
+    async def drain(self):
+        pass
+
+
+def _serve(srv, messages):
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data("".join((m if isinstance(m, str) else json.dumps(m)) + "\n" for m in messages).encode())
+        reader.feed_eof()
+        writer = Writer()
+        await srv.serve(reader, writer)
+        return writer.lines
+    return asyncio.run(main())
+
+
+def test_workers_default_to_concurrent(monkeypatch):
+    monkeypatch.delenv("MCP_STDIO_WORKERS", raising=False)
+    assert AsyncMCPStdioServer().max_workers == 8
+    monkeypatch.setenv("MCP_STDIO_WORKERS", "2")
+    assert AsyncMCPStdioServer().max_workers == 2
+
+
+def test_tool_calls_overlap_and_answer_by_id():
+    srv = AsyncMCPStdioServer(max_workers=4)
+    fast_done = threading.Event()
+
+    class H:
+        def handle_request(self, req):
+            if req["params"]["name"] == "slow":
+                assert fast_done.wait(timeout=2)
+            else:
+                fast_done.set()
+            return {"jsonrpc": "2.0", "id": req["id"], "result": req["params"]["name"]}
+
+    srv.handler = H()
+    lines = _serve(srv, [
+        {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "slow"}, "id": 1},
+        {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "fast"}, "id": 2},
+    ])
+    # The slow call only succeeds if the fast one ran while it was waiting
+    assert {l["id"]: l.get("result") for l in lines} == {1: "slow", 2: "fast"}
+
+
+def test_cancelled_request_gets_no_response():
+    srv = AsyncMCPStdioServer(max_workers=2)
+    release = threading.Event()
+
+    class H:
+        def handle_request(self, req):
+            if req["id"] == 1:
+                release.wait(timeout=2)
+            return {"jsonrpc": "2.0", "id": req["id"], "result": "done"}
+
+    srv.handler = H()
+    try:
+        lines = _serve(srv, [
+            {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "slow"}, "id": 1},
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 1}},
+            {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "fast"}, "id": 2},
+        ])
+    finally:
+        release.set()
+    assert [l["id"] for l in lines] == [2]
+
+
+def test_parse_errors_and_handler_failures():
+    srv = AsyncMCPStdioServer(max_workers=1)
+
+    class H:
+        def handle_request(self, req):
+            raise ValueError("boom")
+
+    srv.handler = H()
+    lines = _serve(srv, ["{not json", {"jsonrpc": "2.0", "method": "tools/call", "id": 5},
+                         {"jsonrpc": "2.0", "method": "notifications/initialized"}])
+    assert lines[0]["error"]["code"] == -32700
+    assert lines[1]["id"] == 5 and lines[1]["error"]["code"] == -32603
+
+
+def test_runner_selects_async_server(monkeypatch):
+    started = []
+    monkeypatch.setattr(AsyncMCPStdioServer, "start", lambda self: started.append(type(self)))
+    monkeypatch.setenv("MCP_STDIO_ASYNC", "1")
+    stdio_server_runner.run_stdio_server()
+    assert started == [AsyncMCPStdioServer]
+
+
+def test_writes_drain_one_at_a_time():
+    srv = AsyncMCPStdioServer(max_workers=4)
+    srv.handler = type("H", (), {"handle_request": lambda self, req: {"jsonrpc": "2.0", "id": req["id"], "result": "ok"}})()
+
+    class SlowWriter(Writer):
+        draining = 0
+        overlap = False
+
+        async def drain(self):
+            self.draining += 1
+            self.overlap = self.overlap or self.draining > 1
+            await asyncio.sleep(0.01)
+            self.draining -= 1
+
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data("".join(json.dumps({"jsonrpc": "2.0", "method": "tools/call", "id": i}) + "\n"
+                                 for i in range(5)).encode())
+        reader.feed_eof()
+        writer = SlowWriter()
+        await srv.serve(reader, writer)
+        return writer
+
+    writer = asyncio.run(main())
+    assert sorted(l["id"] for l in writer.lines) == list(range(5))
+    assert not writer.overlap
+
+
+def test_non_pipe_streams_use_threaded_loop(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({"jsonrpc": "2.0", "method": "ping", "id": 1}) + "\n"))
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    srv = AsyncMCPStdioServer(max_workers=1)
+    srv.handler = type("H", (), {"handle_request": lambda self, req: {"jsonrpc": "2.0", "id": req["id"], "result": "pong"}})()
+    assert not stdio_frames.streams_are_pipes()
+    srv._read_stdin()
+    assert json.loads(out.getvalue())["result"] == "pong"
@@ -0,0 +1,70 @@
+import io
+import json
+import sys
+import pytest
+from src.mcp.servers import stdio_codec, stdio_frames
+from src.mcp.servers.mcp_stdio_server import MCPStdioServer
+
+CODECS = [stdio_codec.STDLIB] + ([stdio_codec.ORJSON] if stdio_codec.ORJSON else [])
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+def test_round_trip(codec):
+    payload = {"id": 1, "result": {"content": [{"type": "text", "text": "Reunião às 9h 📅"}]}}
+    data = codec.dumps(payload)
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == payload
+    assert codec.loads(data.decode("utf-8")) == payload
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+def test_malformed_input_is_a_decode_error(codec):
+    for data in (b"not json", b'{"id": "\xff"}'):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(data)
+
+
+def test_select_codec(monkeypatch):
+    assert stdio_codec.select_codec("json") is stdio_codec.STDLIB
+    monkeypatch.setenv("MCP_JSON_CODEC", "json")
+    assert stdio_codec.select_codec() is stdio_codec.STDLIB
+    monkeypatch.delenv("MCP_JSON_CODEC")
+    assert stdio_codec.select_codec() is (stdio_codec.ORJSON or stdio_codec.STDLIB)
+
+
+@pytest.mark.skipif(stdio_codec.ORJSON is None, reason="orjson not installed")
+def test_orjson_falls_back_for_values_it_cannot_encode():
+    assert json.loads(stdio_codec.ORJSON.dumps({"n": 2 ** 70, 1: "a"})) == {"n": 2 ** 70, "1": "a"}
+
+
+def test_send_response_writes_bytes_to_stdout_buffer(monkeypatch):
+    out = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", out)
+    print("log line")
+    stdio_frames.send_response({"jsonrpc": "2.0", "id": None, "result": "é"})
+    lines = out.buffer.getvalue().decode("utf-8").splitlines()
+    assert lines[0] == "log line"
+    assert json.loads(lines[1]) == {"jsonrpc": "2.0", "id": "", "result": "é"}
+
+
+def test_read_loop_decodes_stdin_bytes(monkeypatch):
+    requests = [{"jsonrpc": "2.0", "id": 1, "method": "ping"}, {"jsonrpc": "2.0", "id": 2, "method": "ping"}]
+    raw = b"\n".join(json.dumps(r).encode() for r in requests) + b"\n\xff\n"
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8"))
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    srv = MCPStdioServer()
+    monkeypatch.setattr(srv, "handler", type("H", (), {"handle_request": lambda self, req: {"id": req["id"], "result": "ok"}})())
+    srv._read_stdin()
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["id"] for r in responses] == [1, 2, ""]
+    assert responses[2]["error"]["code"] == -32700
+
+
+def test_decode_request_skips_notifications_and_routes_cancellations():
+    cancelled = []
+    line = b'{"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 3}}'
+    assert stdio_frames.decode_request(line, cancelled.append) == (None, None)
+    assert cancelled == [{"requestId": 3}]
+    assert stdio_frames.decode_request(b'{"method": "notifications/initialized"}', cancelled.append) == (None, None)
+    assert stdio_frames.decode_request(b"[1]", cancelled.append)[1]["error"]["code"] == -32603
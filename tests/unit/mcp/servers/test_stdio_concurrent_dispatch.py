@@ -0,0 +1,103 @@
+import json
+import sys
+import threading
+from io import StringIO
+from src.mcp.servers.mcp_stdio_server import MCPStdioServer
+
+
+def _run(srv, monkeypatch, requests):
+    monkeypatch.setattr(sys, "stdin", StringIO("\n".join(json.dumps(r) for r in requests)))
+    out = StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    srv._read_stdin()
+    return [json.loads(l) for l in out.getvalue().strip().splitlines()]
+
+
+def test_workers_from_env(monkeypatch):
+    monkeypatch.setenv("MCP_STDIO_WORKERS", "4")
+    assert MCPStdioServer().max_workers == 4
+    monkeypatch.setenv("MCP_STDIO_WORKERS", "bad")
+    assert MCPStdioServer().max_workers == 1
+    assert MCPStdioServer(max_workers=3).max_workers == 3
+
+
+def test_slow_request_does_not_block_others(monkeypatch):
+    srv = MCPStdioServer(max_workers=4)
+    fast_done = threading.Event()
+
+    class H:
+        def handle_request(self, req):
+            if req["method"] == "slow":
+                # Only completes if the fast request runs concurrently
+                assert fast_done.wait(timeout=2)
+            else:
+                fast_done.set()
+            return {"jsonrpc": "2.0", "id": req["id"], "result": req["method"]}
+
+    srv.handler = H()
+    lines = _run(srv, monkeypatch, [
+        {"jsonrpc": "2.0", "method": "slow", "id": 1},
+        {"jsonrpc": "2.0", "method": "fast", "id": 2},
+    ])
+    assert [l["id"] for l in lines] == [2, 1]
+    assert {l["id"]: l["result"] for l in lines} == {1: "slow", 2: "fast"}
+
+
+def test_concurrent_errors_keep_request_id(monkeypatch):
+    srv = MCPStdioServer(max_workers=2)
+
+    class H:
+        def handle_request(self, req):
+            raise ValueError("boom")
+
+    srv.handler = H()
+    lines = _run(srv, monkeypatch, [{"jsonrpc": "2.0", "method": "x", "id": 7}])
+    assert lines[0]["id"] == 7
+    assert lines[0]["error"]["code"] == -32603
+
+
+def test_cancel_notification_reaches_handler(monkeypatch):
+    srv = MCPStdioServer()
+    cancelled = []
+
+    class H:
+        def handle_request(self, req):
+            return {"jsonrpc": "2.0", "id": req["id"], "result": "ok"}
+
+        def cancel(self, request_id):
+            cancelled.append(request_id)
+
+    srv.handler = H()
+    lines = _run(srv, monkeypatch, [
+        {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 3, "reason": "timeout"}},
+        {"jsonrpc": "2.0", "method": "x", "id": 4},
+    ])
+    assert cancelled == [3]
+    assert [l["id"] for l in lines] == [4]
+
+
+def test_cancelling_a_queued_call_skips_it(monkeypatch):
+    srv = MCPStdioServer(max_workers=2)
+    release = threading.Event()
+    ran = []
+
+    def call_tool(req):
+        ran.append(req["id"])
+        release.wait(2)
+        return {"jsonrpc": "2.0", "id": req["id"], "result": "ok"}
+
+    monkeypatch.setattr(srv.handler, "_call_tool", call_tool)
+    calls = [{"jsonrpc": "2.0", "method": "tools/call", "id": i, "params": {}} for i in (1, 2, 3)]
+    cancel = {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 3}}
+
+    def stdin():
+        # Both workers are busy until the cancellation for the queued call has been read
+        yield from (json.dumps(r) + "\n" for r in calls + [cancel])
+        release.set()
+
+    monkeypatch.setattr(sys, "stdin", stdin())
+    out = StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    srv._read_stdin()
+    assert sorted(json.loads(l)["id"] for l in out.getvalue().splitlines()) == [1, 2]
+    assert sorted(ran) == [1, 2]
@@ -6,4 +6,13 @@ def test_stdio_server_start(monkeypatch):
     # Patch _read_stdin so start returns immediately
     monkeypatch.setattr(srv, "_read_stdin", lambda: setattr(srv, 'running', False))
     srv.start()
-    assert srv.running is False 
\ No newline at end of file
+    assert srv.running is False 
+
+def test_stdio_server_start_prewarms_when_enabled(monkeypatch):
+    monkeypatch.setenv("MCP_PREWARM_SERVICE", "1")
+    srv = MCPStdioServer()
+    calls = []
+    monkeypatch.setattr(srv, "_prewarm", lambda: calls.append("prewarm"))
+    monkeypatch.setattr(srv, "_read_stdin", lambda: setattr(srv, 'running', False))
+    srv.start()
+    assert calls == ["prewarm"]
@@ -0,0 +1,37 @@
+from src.mcp.tools import tool_bulk_events
+from src.mcp.tools import tool_calendar as tc
+
+
+def test_add_events_uses_single_batch_call(monkeypatch):
+    calls = []
+
+    def fake_add_events(svc, bodies):
+        calls.append(bodies)
+        return [{"status": "confirmed", "event": {"id": "e1"}},
+                {"status": "error", "message": "quota"}]
+
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: "svc")
+    monkeypatch.setattr(tool_bulk_events, "add_events", fake_add_events)
+    res = tc.handle("add_events", {"events": [
+        {"summary": "A", "start_time": "s", "end_time": "e"},
+        {"summary": "B", "start_time": "s"},
+        {"summary": "C", "start_time": "s", "end_time": "e", "location": "L"},
+    ]})
+    txt = res["result"]["content"][0]["text"]
+    assert len(calls) == 1
+    assert [b["summary"] for b in calls[0]] == ["A", "C"]
+    assert calls[0][1]["location"] == "L"
+    assert txt.startswith("1 eventos criados com sucesso, 2 falharam")
+    assert "✅ A (🆔 e1)" in txt
+    assert "❌ B: Missing required event parameters" in txt
+    assert "❌ C: quota" in txt
+
+
+def test_add_events_all_invalid_skips_api(monkeypatch):
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: (_ for _ in ()).throw(AssertionError()))
+    res = tc.handle("add_events", {"events": [{"summary": "B"}]})
+    assert "0 eventos criados com sucesso, 1 falharam" in res["result"]["content"][0]["text"]
+
+
+def test_add_events_requires_events():
+    assert tc.handle("add_events", {})["error"]["code"] == -32602
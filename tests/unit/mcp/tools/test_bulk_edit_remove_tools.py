@@ -0,0 +1,37 @@
+from src.mcp.tools import tool_bulk_events
+from src.mcp.tools import tool_calendar as tc
+from src.mcp.mcp_schema import get_mcp_schema
+
+
+def test_bulk_tools_registered_in_schema():
+    names = {t["name"] for t in get_mcp_schema()["tools"]}
+    assert {"remove_events", "edit_events"} <= names
+
+
+def test_remove_events_tool(monkeypatch):
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: "svc")
+    monkeypatch.setattr(tool_bulk_events, "remove_events", lambda svc, ids: [
+        {"event_id": "a", "status": "deleted"},
+        {"event_id": "b", "status": "error", "message": "gone"},
+    ])
+    txt = tc.handle("remove_events", {"event_ids": ["a", "b"]})["result"]["content"][0]["text"]
+    assert txt.startswith("1 eventos removidos com sucesso, 1 falharam")
+    assert "✅ a" in txt and "❌ b: gone" in txt
+
+
+def test_edit_events_tool(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: "svc")
+    monkeypatch.setattr(tool_bulk_events, "edit_events", lambda svc, edits: seen.setdefault("edits", edits) and [
+        {"status": "confirmed", "event": {"id": "a"}},
+    ])
+    edits = [{"event_id": "a", "updated_details": {"summary": "x"}}]
+    txt = tc.handle("edit_events", {"edits": edits})["result"]["content"][0]["text"]
+    assert seen["edits"] == edits
+    assert txt.startswith("1 eventos editados com sucesso, 0 falharam")
+
+
+def test_bulk_tools_validate_arguments():
+    assert tc.handle("remove_events", {})["error"]["code"] == -32602
+    assert tc.handle("edit_events", {})["error"]["code"] == -32602
+    assert tc.handle("edit_events", {"edits": [{"event_id": "a"}]})["error"]["code"] == -32602
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+from src.core.calendar.freebusy import BusyTimes
+from src.core.ics.parser import ICSEvent, Property
+from src.mcp.tools import tool_availability as ta
+
+
+def _ts(hour):
+    return datetime(2099, 1, 1, hour, tzinfo=timezone.utc).timestamp()
+
+
+def _patch_busy(monkeypatch, busy, errors=None):
+    calls = []
+
+    def fake_query(svc, ids, time_min, time_max):
+        calls.append((ids, time_min, time_max))
+        return BusyTimes({cid: busy.get(cid, []) for cid in ids if cid not in (errors or {})}, errors or {})
+
+    monkeypatch.setattr(ta.auth, "get_calendar_service", lambda: "svc")
+    monkeypatch.setattr(ta, "query_busy", fake_query)
+    return calls
+
+
+def test_find_free_slots_merges_calendars(monkeypatch):
+    calls = _patch_busy(monkeypatch, {"me": [(_ts(9), _ts(10))], "team": [(_ts(9), _ts(11)), (_ts(13), _ts(14))]})
+    res = ta.handle("find_free_slots", {"timeMin": "2099-01-01T08:00:00Z", "timeMax": "2099-01-01T15:00:00Z",
+                                        "calendar_ids": ["me", "team"], "duration_minutes": 60})
+    text = res["result"]["content"][0]["text"]
+    assert calls[0][0] == ["me", "team"]
+    assert "08:00:00+00:00 → 2099-01-01T09:00:00+00:00 (60 min)" in text
+    assert "11:00:00+00:00 → 2099-01-01T13:00:00+00:00 (120 min)" in text
+    assert "14:00:00+00:00 → 2099-01-01T15:00:00+00:00" in text
+    assert res["result"]["calendar_status"] == {"me": "ok", "team": "ok"}
+
+
+def test_find_free_slots_includes_ics_busy_times(monkeypatch):
+    _patch_busy(monkeypatch, {})
+    monkeypatch.setattr("src.core.ics.registry.list_all", lambda: {"work": "u1"})
+    start = datetime(2099, 1, 1, 9, tzinfo=timezone.utc)
+
+    class FakeOps:
+        def list_records(self, url, max_results, time_min=None, time_max=None):
+            return [ICSEvent({"SUMMARY": [Property("SUMMARY", "x")]}, start=start,
+                             end=start.replace(hour=12), sort_ts=start.timestamp())]
+
+    monkeypatch.setattr("src.core.ics.ops.ICSOperations", FakeOps)
+    res = ta.handle("find_free_slots", {"timeMin": "2099-01-01T08:00:00Z", "timeMax": "2099-01-01T13:00:00Z",
+                                        "with_ics": True})
+    text = res["result"]["content"][0]["text"]
+    assert text.count("•") == 2 and "12:00:00+00:00 → 2099-01-01T13:00:00+00:00" in text
+    assert res["result"]["ics_status"] == {"work": "ok"}
+
+
+def test_check_conflicts_lists_sources(monkeypatch):
+    _patch_busy(monkeypatch, {"primary": [(_ts(9), _ts(10)), (_ts(12), _ts(13))]})
+    res = ta.handle("check_conflicts", {"start_time": "2099-01-01T09:30:00Z", "end_time": "2099-01-01T11:00:00Z"})
+    assert res["result"]["available"] is False
+    assert "(google:primary)" in res["result"]["content"][0]["text"]
+
+    res = ta.handle("check_conflicts", {"start_time": "2099-01-01T10:00:00Z", "end_time": "2099-01-01T12:00:00Z"})
+    assert res["result"]["available"] is True
+
+
+def test_check_conflicts_reports_unreadable_calendars(monkeypatch):
+    _patch_busy(monkeypatch, {}, errors={"gone": "notFound"})
+    res = ta.handle("check_conflicts", {"start_time": "2099-01-01T09:00:00Z", "end_time": "2099-01-01T10:00:00Z",
+                                        "calendar_ids": ["primary", "gone"]})
+    assert res["result"]["calendar_status"] == {"primary": "ok", "gone": "error: notFound"}
+    assert "gone" in res["result"]["content"][1]["text"]
+
+
+def test_invalid_ranges_are_rejected(monkeypatch):
+    _patch_busy(monkeypatch, {})
+    assert ta.handle("check_conflicts", {"start_time": "2099-01-01T10:00:00Z"})["error"]["code"] == -32602
+    res = ta.handle("find_free_slots", {"timeMin": "2099-01-02T00:00:00Z", "timeMax": "2099-01-01T00:00:00Z"})
+    assert res["error"]["code"] == -32602
+    assert ta.handle("unknown", {}) is None
+
+
+def test_find_free_slots_rejects_bad_max_results(monkeypatch):
+    calls = _patch_busy(monkeypatch, {})
+    window = {"timeMin": "2099-01-01T08:00:00Z", "timeMax": "2099-01-01T15:00:00Z"}
+    for bad in ("many", None, 0):
+        assert ta.handle("find_free_slots", dict(window, max_results=bad))["error"]["code"] == -32602
+    assert calls == []
+    res = ta.handle("find_free_slots", dict(window, max_results="2", duration_minutes=30))
+    assert res["result"]["content"][0]["text"].startswith("🟢 1 horários livres")
@@ -2,6 +2,7 @@ import pytest
 from types import SimpleNamespace
 from unittest.mock import patch
 from src.mcp.tools import tool_calendar as tc
+from src.mcp.tools import tool_list_events as tle
 
 
 def make_dummy_service():
@@ -10,7 +11,7 @@ def make_dummy_service():
 
 def test_list_events_google(monkeypatch):
     monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
-    monkeypatch.setattr(tc, "list_events", lambda svc, mr, cid: ["g"])
+    monkeypatch.setattr(tle, "list_events", lambda svc, mr, cid: ["g"])
     res = tc.handle("list_events", {})
     assert res["result"]["content"] == ["g"]
 
@@ -22,7 +23,7 @@ def test_list_events_ics(monkeypatch):
             assert mr == 7
             return ["i"]
     monkeypatch.setattr(tc, "auth", SimpleNamespace(get_calendar_service=lambda: make_dummy_service()))
-    with patch("src.core.ics_ops.ICSOperations", return_value=FakeOps()):
+    with patch("src.core.ics.ops.ICSOperations", return_value=FakeOps()):
         res = tc.handle("list_events", {"ics_url": "http://x.com/ics.ics", "max_results": 7})
     assert res["result"]["content"] == ["i"]
 
@@ -61,4 +62,60 @@ def test_edit_event(monkeypatch):
     monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
     res = tc.handle("edit_event", {"event_id": "abc", "updated_details": {"summary": "x"}})
     txt = res["result"]["content"][0]["text"]
-    assert "✅" in txt 
\ No newline at end of file
+    assert "✅" in txt 
+
+def test_edit_event_with_etag(monkeypatch):
+    seen = {}
+    def fake_edit(svc, eid, det, etag=None):
+        seen["etag"] = etag
+        return {"id": eid, "etag": "new"}
+    monkeypatch.setattr(tc, "edit_event", fake_edit)
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
+    res = tc.handle("edit_event", {"event_id": "abc", "updated_details": {"summary": "x"}, "etag": "old"})
+    assert seen["etag"] == "old"
+    assert "🏷️ ETag: new" in res["result"]["content"][0]["text"]
+
+
+def test_list_events_passes_cursor(monkeypatch):
+    seen = {}
+    def fake_list(svc, mr, cid, cursor=None):
+        seen["cursor"] = cursor
+        return ["g"]
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
+    monkeypatch.setattr(tle, "list_events", fake_list)
+    tc.handle("list_events", {"cursor": "abc"})
+    assert seen["cursor"] == "abc"
+
+
+def test_list_events_invalid_cursor(monkeypatch):
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
+    res = tc.handle("list_events", {"cursor": "bad"})
+    assert res["error"]["code"] == -32602
+
+
+def test_list_events_served_from_store(monkeypatch):
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
+    monkeypatch.setattr(tc.sync, "get_store", lambda: "store")
+    monkeypatch.setattr(tc.sync, "list_cached_events", lambda svc, store, mr, cid: [store, mr, cid])
+    res = tc.handle("list_events", {"max_results": 3})
+    assert res["result"]["content"] == ["store", 3, "primary"]
+
+
+def test_mutations_invalidate_store(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tc.sync, "mark_stale", lambda: calls.append(1))
+    monkeypatch.setattr(tc, "remove_event", lambda svc, eid: True)
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
+    tc.handle("remove_event", {"event_id": "abc"})
+    assert calls == [1]
+
+
+def test_list_events_time_window(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(tc.auth, "get_calendar_service", lambda: make_dummy_service())
+    monkeypatch.setattr(tc.sync, "get_store", lambda: None)
+    monkeypatch.setattr(tle, "list_events", lambda svc, mr, cid, **kw: seen.update(kw) or [])
+    tc.handle("list_events", {"timeMin": "2030-01-01T00:00:00Z", "timeMax": "2030-01-02T00:00:00Z"})
+    assert seen == {"time_min": "2030-01-01T00:00:00Z", "time_max": "2030-01-02T00:00:00Z"}
+    res = tc.handle("list_events", {"timeMin": "soon"})
+    assert res["error"]["code"] == -32602
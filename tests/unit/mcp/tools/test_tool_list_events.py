@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.core.ics.parser import ICSEvent, Property
+from src.mcp.mcp_schema import get_mcp_schema
+from src.mcp.tools import tool_calendar as tc
+from src.mcp.tools import tool_list_events as tle
+from src.mcp.tools import tool_sources
+
+
+def _dummy_svc():
+    return SimpleNamespace(name="svc")
+
+
+def _google(event_id, start, uid=None):
+    event = {"id": event_id, "summary": event_id, "start": {"dateTime": start}, "end": {"dateTime": start}}
+    if uid:
+        event["iCalUID"] = uid
+    return event
+
+
+def _record(summary, start, uid=None):
+    props = {"SUMMARY": [Property("SUMMARY", summary)], "UID": [Property("UID", uid or summary)]}
+    moment = datetime.fromisoformat(start).replace(tzinfo=timezone.utc)
+    return ICSEvent(props, start=moment, end=moment, sort_ts=moment.timestamp())
+
+
+def _titles(res):
+    return [item["text"].split("\n")[0] for item in res["result"]["content"]]
+
+
+def test_list_events_merge_with_ics(monkeypatch):
+    monkeypatch.setattr(tle, "fetch_events", lambda svc, mr, cid, fields=(): [
+        _google("g1", "2099-01-01T10:00:00Z"), _google("g2", "2099-01-03T10:00:00Z")])
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: _dummy_svc())
+    monkeypatch.setattr("src.core.ics.registry.list_all", lambda: {"a": "u1", "b": "u2"})
+
+    class FakeOps:
+        def list_records(self, url, mr):
+            day = "02" if url == "u1" else "04"
+            return [_record(url, f"2099-01-{day}T09:00:00")]
+
+    with patch("src.core.ics.ops.ICSOperations", return_value=FakeOps()):
+        res = tc.handle("list_events", {"with_ics": True})
+
+    assert _titles(res) == ["g1", "u1", "g2", "u2"]
+    assert res["result"]["content"][1]["text"].endswith("Source: ics:a")
+    assert res["result"]["content"][0]["text"].endswith("Source: google")
+
+
+def test_with_ics_applies_max_results_globally(monkeypatch):
+    monkeypatch.setattr(tle, "fetch_events", lambda svc, mr, cid, fields=(): [
+        _google(f"g{i}", f"2099-01-0{i}T10:00:00Z") for i in range(1, mr + 1)])
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: _dummy_svc())
+    monkeypatch.setattr("src.core.ics.registry.list_all", lambda: {"a": "u1"})
+
+    class FakeOps:
+        def list_records(self, url, mr):
+            return [_record(f"i{i}", f"2099-01-0{i}T08:00:00") for i in range(1, mr + 1)]
+
+    with patch("src.core.ics.ops.ICSOperations", return_value=FakeOps()):
+        res = tc.handle("list_events", {"with_ics": True, "max_results": 3})
+
+    assert _titles(res) == ["i1", "g1", "i2"]
+
+
+def test_with_ics_suppresses_duplicate_uids(monkeypatch):
+    monkeypatch.setattr(tle, "fetch_events", lambda svc, mr, cid, fields=(): [
+        _google("g1", "2099-01-01T10:00:00Z", uid="shared@example.com")])
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: _dummy_svc())
+    monkeypatch.setattr("src.core.ics.registry.list_all", lambda: {"a": "u1"})
+
+    class FakeOps:
+        def list_records(self, url, mr):
+            return [_record("copy", "2099-01-01T10:00:00", uid="shared@example.com"),
+                    _record("later", "2099-01-08T10:00:00", uid="shared@example.com")]
+
+    with patch("src.core.ics.ops.ICSOperations", return_value=FakeOps()):
+        res = tc.handle("list_events", {"with_ics": True})
+
+    assert _titles(res) == ["g1", "later"]
+
+
+def test_with_ics_reports_failed_feeds(monkeypatch):
+    monkeypatch.setattr(tle, "fetch_events", lambda svc, mr, cid, fields=(): [_google("g1", "2099-01-01T10:00:00Z")])
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: _dummy_svc())
+    monkeypatch.setattr("src.core.ics.registry.list_all", lambda: {"ok": "u1", "down": "u2"})
+
+    class FlakyOps:
+        def list_records(self, url, mr):
+            if url == "u2":
+                raise OSError("connection refused")
+            return [_record("i1", "2099-01-02T10:00:00")]
+
+    with patch("src.core.ics.ops.ICSOperations", return_value=FlakyOps()):
+        res = tc.handle("list_events", {"with_ics": True})
+
+    assert _titles(res)[:2] == ["g1", "i1"]
+    assert "down" in res["result"]["content"][2]["text"]
+    assert res["result"]["ics_status"] == {"ok": "ok", "down": "error: connection refused"}
+
+
+def test_calendar_ids_fan_out_merges_by_start(monkeypatch):
+    from src.core.calendar.calendars import CalendarEvents
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: _dummy_svc())
+    calls = []
+
+    def fake_fetch(svc, ids, mr, fields=()):
+        calls.append((ids, mr))
+        return [CalendarEvents("team", [_google("t1", "2099-01-01T09:00:00Z"), _google("t2", "2099-01-03T09:00:00Z")]),
+                CalendarEvents("me", [_google("m1", "2099-01-02T09:00:00Z")]),
+                CalendarEvents("gone", [], RuntimeError("notFound"))]
+
+    monkeypatch.setattr(tle, "fetch_calendars", fake_fetch)
+    res = tc.handle("list_events", {"calendar_ids": ["team", "me", "gone"], "max_results": 2})
+
+    assert calls == [(["team", "me", "gone"], 2)]
+    assert _titles(res) == ["t1", "m1", "⚠️ Calendário 'gone' indisponível: error: notFound"]
+    assert res["result"]["content"][1]["text"].endswith("Source: google:me")
+    assert res["result"]["calendar_status"] == {"team": "ok", "me": "ok", "gone": "error: notFound"}
+    assert "ics_status" not in res["result"]
+
+
+def test_all_calendars_uses_calendar_list(monkeypatch):
+    from src.core.calendar.calendars import CalendarEvents
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: _dummy_svc())
+    monkeypatch.setattr(tool_sources, "list_calendars", lambda svc: [{"id": "me"}, {"id": "team"}])
+    monkeypatch.setattr(tle, "fetch_calendars", lambda svc, ids, mr, fields=(): [CalendarEvents(i, []) for i in ids])
+    res = tc.handle("list_events", {"all_calendars": True})
+    assert res["result"]["calendar_status"] == {"me": "ok", "team": "ok"}
+
+
+def test_calendar_ids_must_be_list(monkeypatch):
+    monkeypatch.setattr(tle.auth, "get_calendar_service", lambda: _dummy_svc())
+    res = tc.handle("list_events", {"calendar_ids": "team"})
+    assert res["error"]["code"] == -32602
+
+
+def test_with_ics_declared_in_schema():
+    tool = next(t for t in get_mcp_schema()["tools"] if t["name"] == "list_events")
+    assert tool["inputSchema"]["properties"]["with_ics"]["type"] == "boolean"
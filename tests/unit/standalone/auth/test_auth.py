@@ -4,6 +4,7 @@ from unittest.mock import Mock, MagicMock, mock_open, patch
 from pathlib import Path
 import src.auth as auth
 import src.core.auth as core_auth
+from src.core import calendar_service
 
 
 def test_load_credentials_success():
@@ -38,15 +39,9 @@ def test_get_credentials_existing_valid_token():
 
 
 def test_get_calendar_service():
-    mock_creds = MagicMock()
-    mock_service = MagicMock()
-
-    with patch('src.auth.get_credentials', return_value=mock_creds) as mock_get_creds, \
-         patch('src.auth.build', return_value=mock_service) as mock_build:
-        service = auth.get_calendar_service()
-        mock_get_creds.assert_called_once_with()
-        mock_build.assert_called_once_with('calendar', 'v3', credentials=mock_creds)
-        assert service == mock_service
+    # The legacy module shares the cached core implementation
+    assert auth.get_calendar_service is core_auth.get_calendar_service
+    assert core_auth.get_calendar_service is calendar_service.get_calendar_service
 
 
 def test_load_credentials_success():
@@ -121,16 +116,27 @@ def test_get_config_path():
         assert '/test/project' in result
 
 
-def test_get_calendar_service_core():
-    mock_creds = MagicMock()
-    mock_service = MagicMock()
-
-    with patch('src.core.auth.get_credentials', return_value=mock_creds) as mock_get_creds, \
-         patch('src.core.auth.build', return_value=mock_service) as mock_build:
-        service = core_auth.get_calendar_service()
-        mock_get_creds.assert_called_once_with()
-        mock_build.assert_called_once_with('calendar', 'v3', credentials=mock_creds)
-        assert service == mock_service
+def test_prewarm_without_token_does_not_authenticate():
+    with patch('os.path.exists', return_value=False), \
+         patch('src.core.auth.get_calendar_service') as mock_get:
+        assert core_auth.prewarm_calendar_service() is False
+        mock_get.assert_not_called()
+
+
+def test_prewarm_with_token_builds_service():
+    for creds in (MagicMock(valid=True), MagicMock(valid=False, expired=True, refresh_token='r')):
+        with patch('src.core.auth._load_token', return_value=creds), \
+             patch('src.core.auth.get_calendar_service') as mock_get:
+            assert core_auth.prewarm_calendar_service() is True
+            mock_get.assert_called_once_with()
+
+
+def test_prewarm_skips_token_that_needs_consent():
+    for creds in (MagicMock(valid=False, expired=True, refresh_token=None), MagicMock(valid=False, expired=False)):
+        with patch('src.core.auth._load_token', return_value=creds), \
+             patch('src.core.auth.get_calendar_service') as mock_get:
+            assert core_auth.prewarm_calendar_service() is False
+            mock_get.assert_not_called()
 
 
 def test_get_credentials_expired_without_refresh_token():
@@ -0,0 +1,65 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from src.core import calendar_service
+
+
+def test_get_calendar_service_core():
+    mock_creds = MagicMock()
+    mock_creds.valid = True
+    mock_creds.expiry = None
+    mock_service = MagicMock()
+
+    calendar_service._SERVICE_CACHE.clear()
+    with patch('src.core.auth.get_credentials', return_value=mock_creds) as mock_get_creds, \
+         patch('src.core.calendar_service.build_from_document', return_value=mock_service) as mock_build:
+        service = calendar_service.get_calendar_service()
+        assert calendar_service.get_calendar_service() is service
+        mock_get_creds.assert_called_once_with()
+        mock_build.assert_called_once()
+        assert mock_build.call_args.args == (calendar_service._calendar_discovery_doc(),)
+        assert service == mock_service
+    calendar_service._SERVICE_CACHE.clear()
+
+
+def test_get_calendar_service_refreshes_near_expiry():
+    mock_creds = MagicMock()
+    mock_creds.valid = True
+    mock_creds.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=1)
+    mock_creds.refresh_token = 'rt'
+
+    calendar_service._SERVICE_CACHE.clear()
+    with patch('src.core.auth.get_credentials', return_value=mock_creds), \
+         patch('src.core.calendar_service.build_from_document', return_value=MagicMock()) as mock_build, \
+         patch('src.core.auth._save_token') as mock_save:
+        calendar_service.get_calendar_service()
+        mock_creds.refresh.assert_not_called()
+        calendar_service.get_calendar_service()
+        mock_creds.refresh.assert_called_once()
+        mock_save.assert_called_once_with(mock_creds)
+        mock_build.assert_called_once()
+    calendar_service._SERVICE_CACHE.clear()
+
+
+def test_calendar_discovery_doc_parsed_once():
+    doc = calendar_service._calendar_discovery_doc()
+    assert doc is calendar_service._calendar_discovery_doc()
+    assert 'events' in doc['resources']
+
+
+def test_build_service_falls_back_without_static_doc():
+    with patch('src.core.calendar_service._calendar_discovery_doc', return_value=None), \
+         patch('src.core.calendar_service.build', return_value='svc') as mock_build:
+        assert calendar_service._build_service(MagicMock()) == 'svc'
+        assert mock_build.call_args.args == ('calendar', 'v3')
+
+
+def test_thread_http_is_per_thread():
+    creds = MagicMock()
+    main_http = calendar_service._thread_http(creds)
+    assert calendar_service._thread_http(creds) is main_http
+    other = []
+    t = threading.Thread(target=lambda: other.append(calendar_service._thread_http(creds)))
+    t.start()
+    t.join()
+    assert other[0] is not main_http